@@ -1,18 +1,14 @@
 # dependencies
 import numpy as np
-import os 
-import sys
 
 # qom modules
-from qom.solvers.deterministic import HLESolver
 from qom.solvers.measure import QCMSolver
 from qom.ui import init_log
 from qom.ui.plotters import MPLPlotter
 
-# add path to local libraries
-sys.path.append(os.path.abspath(os.path.join('.')))
-# import system
-from systems.Unidirectional import Uni_00
+# import system and utilities
+from systems import Uni_00
+from utils.solvers import HLESolver
 
 # parameters
 params = {
@@ -1,17 +1,9 @@
 # dependencies
 import numpy as np
-import os 
-import sys
 
-# qom modules
-from qom.ui.plotters import MPLPlotter
-from qom.utils.loopers import run_loopers_in_parallel, wrap_looper
-from qom.utils.solvers import get_func_quantum_correlation_measures
-
-# add path to local libraries
-sys.path.append(os.path.abspath(os.path.join('.')))
-# import system
-from systems.Unidirectional import Uni_00
+# import system and utilities
+from systems import Uni_00
+from utils.solvers import get_func_quantum_correlation_measures
 
 # all parameters
 params = {
@@ -105,6 +97,10 @@ def func(system_params):
     return np.mean(Measures, axis=0)
 
 if __name__ == '__main__':
+    # qom modules
+    from qom.ui.plotters import MPLPlotter
+    from qom.utils.loopers import run_loopers_in_parallel
+
     # looper
     looper = run_loopers_in_parallel(
         looper_name='XLooper',
@@ -0,0 +1,12 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+ 
+"""Command-line entry points for the simulation of coupled QOM systems.
+
+Run ``python -m sync_bi_uni --help`` from the top-level directory for the available commands.
+"""
+
+__authors__ = ["Sampreet Kalita"]
+__toolbox__ = 'qom-v1.0.1'
+__created__ = "2026-10-18"
+__updated__ = "2026-10-18"
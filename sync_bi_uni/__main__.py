@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+ 
+"""Command-line interface to run and monitor the sweeps and ensembles, continue the periodic orbits, run the run graphs and build the kernels of coupled QOM systems."""
+
+__authors__ = ["Sampreet Kalita"]
+__toolbox__ = 'qom-v1.0.1'
+__created__ = "2026-10-18"
+__updated__ = "2026-10-18"
+
+# dependencies
+import argparse
+import logging
+import sys
+
+def get_parser():
+    """Function to obtain the parser of the command-line arguments.
+
+    Returns
+    -------
+    parser : :class:`argparse.ArgumentParser`
+        Parser of the arguments.
+    """
+
+    # parser
+    parser = argparse.ArgumentParser(
+        prog='python -m sync_bi_uni',
+        description='Simulate coupled QOM systems.'
+    )
+    commands = parser.add_subparsers(
+        dest='command',
+        required=True
+    )
+
+    # sweep command
+    sweep = commands.add_parser(
+        'sweep',
+        help='run a sweep over one or two system parameters'
+    )
+    sweep.add_argument('config', help='path of the JSON or YAML configuration')
+    sweep.add_argument('--workers', type=int, default=1, help='number of parallel processes (default: 1)')
+    sweep.add_argument('--chunk-size', type=int, default=None, help='number of points in each chunk (default: divided among the workers)')
+    sweep.add_argument('--resume', action='store_true', help='resume from the partial results of an interrupted sweep')
+    sweep.add_argument('--prepass', action='store_true', help='classify the points by their fixed points and evaluate the stable points without integration')
+    sweep.add_argument('--floquet', action='store_true', help='evaluate the points on periodic limit cycles from their periodic correlations over one period')
+    sweep.add_argument('--symmetry', default=None, help='name of a symmetry declared by the system to evaluate only the independent points')
+    sweep.add_argument('--symmetry-rtol', type=float, default=1e-2, help='maximum relative deviation of the points sampled to verify the symmetry (default: 1e-2)')
+    sweep.add_argument('--status-file', default=None, help='path of the status file rewritten during the sweep')
+    sweep.add_argument('--preview-file', default=None, help='path of the preview of the partial results, requiring Matplotlib')
+    sweep.add_argument('--port', type=int, default=None, help='local port to stream the progress and the partial results')
+    sweep.add_argument('--interval', type=float, default=1.0, help='interval in seconds between the updates of the monitor (default: 1.0)')
+    sweep.add_argument('--quiet', action='store_true', help='hide the progress')
+
+    # ensemble command
+    ensemble = commands.add_parser(
+        'ensemble',
+        help='run a Monte Carlo ensemble over the disorder of the system parameters'
+    )
+    ensemble.add_argument('config', help='path of the JSON or YAML configuration')
+    ensemble.add_argument('--workers', type=int, default=1, help='number of parallel processes (default: 1)')
+    ensemble.add_argument('--samples', type=int, default=None, help='maximum number of samples (default: from the configuration)')
+    ensemble.add_argument('--design', default=None, choices=['random', 'lhs', 'sobol'], help='design of the samples (default: from the configuration)')
+    ensemble.add_argument('--seed', type=int, default=None, help='seed of the random numbers (default: from the configuration)')
+    ensemble.add_argument('--rtol', type=float, default=None, help='relative half-width of the confidence intervals to stop early (default: from the configuration)')
+    ensemble.add_argument('--resume', action='store_true', help='resume from the partial results of an interrupted ensemble')
+    ensemble.add_argument('--quiet', action='store_true', help='hide the progress')
+
+    # continue command
+    continuation = commands.add_parser(
+        'continue',
+        help='continue the periodic orbit along the first axis of a sweep and detect its bifurcations'
+    )
+    continuation.add_argument('config', help='path of the JSON or YAML configuration')
+    continuation.add_argument('--ds', type=float, default=None, help='initial step of the scaled arclength (default: from the configuration)')
+    continuation.add_argument('--max-points', type=int, default=None, help='maximum number of points of the branch (default: from the configuration)')
+    continuation.add_argument('--quiet', action='store_true', help='hide the progress')
+
+    # watch command
+    watch = commands.add_parser(
+        'watch',
+        help='follow the progress of a sweep streamed on a local port'
+    )
+    watch.add_argument('port', type=int, help='local port of the sweep')
+    watch.add_argument('--abort', action='store_true', help='request the sweep to abort, keeping its partial results')
+    watch.add_argument('--quiet', action='store_true', help='hide the progress')
+
+    # run command
+    run = commands.add_parser(
+        'run',
+        help='run a sweep as a graph of cached stages, recomputing only the changed stages'
+    )
+    run.add_argument('config', help='path of the JSON or YAML configuration')
+    run.add_argument('--workers', type=int, default=1, help='number of parallel processes (default: 1)')
+    run.add_argument('--chunk-size', type=int, default=None, help='number of points in each chunk (default: divided among the workers)')
+    run.add_argument('--cache-dir', default='data/v3.0_qom-v1.0.1/graph', help='directory of the cached stages (default: data/v3.0_qom-v1.0.1/graph)')
+    run.add_argument('--quiet', action='store_true', help='hide the progress')
+
+    # build command
+    build = commands.add_parser(
+        'build',
+        help='generate the kernels of the systems with model specifications'
+    )
+    build.add_argument('--force', action='store_true', help='regenerate existing kernels')
+    build.add_argument('--quiet', action='store_true', help='hide the progress')
+
+    return parser
+
+def main(argv=None):
+    """Function to run the command-line interface.
+
+    Parameters
+    ----------
+    argv : list, optional
+        Command-line arguments. Default is ``sys.argv[1:]``.
+    """
+
+    # parse arguments
+    args = get_parser().parse_args(argv)
+    logging.basicConfig(level=logging.WARNING if args.quiet else logging.INFO, format='%(message)s')
+
+    if args.command == 'sweep':
+        # local modules
+        from utils.loopers import get_axes, get_config, run_sweep
+        from utils.monitors import SweepMonitor
+
+        # progress
+        def cb_update(num_done, num_points):
+            if not args.quiet:
+                sys.stdout.write('\rCompleted {} of {} points'.format(num_done, num_points) + ('\n' if num_done == num_points else ''))
+                sys.stdout.flush()
+
+        # monitor
+        config = get_config(args.config)
+        if args.floquet:
+            config['solver']['floquet'] = True
+        monitor = None
+        if args.status_file is not None or args.preview_file is not None or args.port is not None:
+            monitor = SweepMonitor(
+                axes=get_axes(config['looper']),
+                params={
+                    'status_file'   : args.status_file,
+                    'preview_file'  : args.preview_file,
+                    'port'          : args.port,
+                    'interval'      : args.interval
+                }
+            )
+
+        run_sweep(
+            config=config,
+            num_workers=args.workers,
+            chunk_size=args.chunk_size,
+            resume=args.resume,
+            cb_update=cb_update,
+            monitor=monitor,
+            symmetry=args.symmetry,
+            rtol=args.symmetry_rtol,
+            prepass=args.prepass
+        )
+
+    if args.command == 'ensemble':
+        # local modules
+        from utils.ensembles import get_ensemble_config, run_ensemble
+
+        # running statistics
+        def cb_update(stats):
+            if not args.quiet:
+                sys.stdout.write('\r{} samples | mean {} | CI {}'.format(stats['num_samples'], ' '.join(['{:.4e}'.format(value) for value in stats['mean']]), ' '.join(['[{:.4e}, {:.4e}]'.format(*ci) for ci in stats['mean_ci']])))
+                sys.stdout.flush()
+
+        # override parameters
+        config = get_ensemble_config(args.config)
+        for key, value in [('num_samples', args.samples), ('design', args.design), ('seed', args.seed), ('rtol', args.rtol)]:
+            if value is not None:
+                config['ensemble'][key] = value
+
+        run_ensemble(
+            config=config,
+            num_workers=args.workers,
+            resume=args.resume,
+            cb_update=cb_update
+        )
+        if not args.quiet:
+            sys.stdout.write('\n')
+
+    if args.command == 'continue':
+        # local modules
+        from utils.continuation import run_continuation
+        from utils.loopers import get_config
+
+        # progress
+        def cb_update(num_points, p):
+            if not args.quiet:
+                sys.stdout.write('\rContinued {} points up to {:.6f}'.format(num_points, p))
+                sys.stdout.flush()
+
+        # override parameters
+        params = dict()
+        for key, value in [('ds', args.ds), ('max_points', args.max_points)]:
+            if value is not None:
+                params[key] = value
+
+        file_path, branch = run_continuation(
+            config=get_config(args.config),
+            params=params,
+            cb_update=cb_update
+        )
+        if not args.quiet:
+            sys.stdout.write('\n')
+            for idx, label in zip(branch['bifurcation_indices'], branch['bifurcation_labels']):
+                sys.stdout.write('{} at {:.6f}\n'.format(label, branch['xs'][idx]))
+
+    if args.command == 'watch':
+        # local modules
+        from utils.monitors import get_status_line, watch
+
+        # progress
+        def cb_update(status):
+            if not args.quiet:
+                sys.stdout.write('\r' + get_status_line(status) + ('\n' if status['num_done'] == status['num_points'] else ''))
+                sys.stdout.flush()
+
+        watch(
+            port=args.port,
+            abort=args.abort,
+            cb_update=cb_update
+        )
+
+    if args.command == 'run':
+        # local modules
+        from utils.graphs import RunGraph
+        from utils.loopers import get_config
+
+        # progress
+        def cb_update(stage, num_done, num_total):
+            if not args.quiet:
+                sys.stdout.write('\rCompleted {} of {} points of {}'.format(num_done, num_total, stage) + ('\n' if num_done == num_total else ''))
+                sys.stdout.flush()
+
+        RunGraph(
+            config=get_config(args.config),
+            params={
+                'cache_dir'     : args.cache_dir,
+                'num_workers'   : args.workers,
+                'chunk_size'    : args.chunk_size
+            },
+            cb_update=cb_update
+        ).run()
+
+    if args.command == 'build':
+        # local modules
+        from systems.Models import Bi_02, Uni_03
+        from utils.models import get_kernels
+
+        for SystemClass in [Bi_02, Uni_03]:
+            get_kernels(
+                spec=SystemClass.spec,
+                rebuild=args.force
+            )
+
+if __name__ == '__main__':
+    main()
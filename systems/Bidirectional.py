@@ -6,7 +6,7 @@
 __authors__ = ["Sampreet Kalita"]
 __toolbox__ = 'qom-v1.0.1'
 __created__ = "2020-06-03"
-__updated__ = "2024-01-09"
+__updated__ = "2026-10-19"
 
 # dependencies
 import numpy as np
@@ -17,6 +17,9 @@ from qom.systems import BaseSystem
 class Bi_00(BaseSystem):
     r"""Class to simulate two simple bidirectionally-coupled QOM systems.
 
+    With equal couplings, decay rates and thermal occupancies, the exchange of the left and right systems maps :math:`\delta` to :math:`- \delta / \left( 1 + \delta \right)` only after rescaling all rates, including :math:`\omega_{mL}`, by :math:`1 + \delta`.
+    As the measures at :math:`- \delta` hence differ from those at :math:`\delta` by up to half of their values, no symmetry is declared to reduce the sweeps (see :mod:`utils.symmetries`).
+
     Parameters
     ----------
     params : dict
@@ -111,7 +114,82 @@ class Bi_00(BaseSystem):
             self.A[4*i + 3][4*i + 3] = - self.params['gammas'][i]
 
         return self.A
+
+    def get_A_grad(self, modes, c, t, key):
+        """Method to obtain the derivatives of the drift matrix with respect to a parameter.
+
+        Parameters
+        ----------
+        modes : numpy.ndarray
+            Classical modes.
+        c : numpy.ndarray
+            Derived constants and controls.
+        t : float
+            Time at which the values are calculated.
+        key : str
+            Key of the parameter. Available options are ``'delta'``, ``'lambda'``.
+        
+        Returns
+        -------
+        A_grad : numpy.ndarray
+            Derivatives of the drift matrix.
+        """
+
+        assert key in ['delta', 'lambda'], 'Parameter ``key`` should be either ``delta`` or ``lambda``'
+
+        # initialize derivatives
+        A_grad = np.zeros(self.dim_corrs, dtype=np.float64)
+
+        # detuning of the right mechanical mode
+        if key == 'delta':
+            A_grad[4][5] = - self.params['Delta_0_sign']
+            A_grad[5][4] = self.params['Delta_0_sign']
+            A_grad[6][7] = 1.0
+            A_grad[7][6] = - 1.0
+        # coupling strength of the optical channel
+        elif key == 'lambda':
+            A_grad[0][5] = - 1.0
+            A_grad[1][4] = 1.0
+            A_grad[4][1] = - 1.0
+            A_grad[5][0] = 1.0
+
+        return A_grad
+
+    def get_A_jac(self, modes, c, t):
+        r"""Method to obtain the derivatives of the drift matrix with respect to the real and imaginary parts of the modes.
+
+        Parameters
+        ----------
+        modes : numpy.ndarray
+            Classical modes.
+        c : numpy.ndarray
+            Derived constants and controls.
+        t : float
+            Time at which the values are calculated.
+        
+        Returns
+        -------
+        A_jac : numpy.ndarray
+            Derivatives of the drift matrix, in the format :math:`\partial A / \partial y_{k}` along the first axis, where :math:`y = \left[ \mathrm{Re} \alpha_{L}, \mathrm{Im} \alpha_{L}, \mathrm{Re} \beta_{L}, \mathrm{Im} \beta_{L}, ... \right]`.
+        """
+
+        # initialize derivatives
+        A_jac = np.zeros((2 * self.num_modes, ) + self.dim_corrs, dtype=np.float64)
+
+        # update derivatives
+        for i in range(2):
+            # detunings
+            A_jac[4*i + 2][4*i + 0][4*i + 1] = - 2.0 * self.params['g_0s'][i]
+            A_jac[4*i + 2][4*i + 1][4*i + 0] = 2.0 * self.params['g_0s'][i]
+            # effective optomechanical couplings
+            A_jac[4*i + 1][4*i + 0][4*i + 2] = - 2.0 * self.params['g_0s'][i]
+            A_jac[4*i + 0][4*i + 1][4*i + 2] = 2.0 * self.params['g_0s'][i]
+            A_jac[4*i + 0][4*i + 3][4*i + 0] = 2.0 * self.params['g_0s'][i]
+            A_jac[4*i + 1][4*i + 3][4*i + 1] = 2.0 * self.params['g_0s'][i]
+
+        return A_jac
     
+
     def get_D(self, modes, corrs, c, t):
         """Method to obtain the noise matrix.
         
@@ -143,6 +221,112 @@ class Bi_00(BaseSystem):
 
         return self.D
 
+    def get_D_grad(self, modes, corrs, c, t, key):
+        """Method to obtain the derivatives of the noise matrix with respect to a parameter.
+
+        Parameters
+        ----------
+        modes : numpy.ndarray
+            Classical modes.
+        corrs : numpy.ndarray
+            Quantum correlations.
+        c : numpy.ndarray
+            Derived constants and controls.
+        t : float
+            Time at which the values are calculated.
+        key : str
+            Key of the parameter. Available options are ``'delta'``, ``'lambda'``.
+        
+        Returns
+        -------
+        D_grad : numpy.ndarray
+            Derivatives of the noise matrix.
+        """
+
+        assert key in ['delta', 'lambda'], 'Parameter ``key`` should be either ``delta`` or ``lambda``'
+
+        # initialize derivatives
+        D_grad = np.zeros(self.dim_corrs, dtype=np.float64)
+
+        # the noise matrix is independent of the parameters
+
+        return D_grad
+
+    def get_D_basis(self, modes, corrs, c, t):
+        """Method to obtain the weights and the basis components of the noise matrix.
+
+        The noise matrix is the weighted sum of the components, such that any reweighting of the noises can be evaluated as a linear combination of the correlations driven by each component.
+
+        Parameters
+        ----------
+        modes : numpy.ndarray
+            Classical modes.
+        corrs : numpy.ndarray
+            Quantum correlations.
+        c : numpy.ndarray
+            Derived constants and controls.
+        t : float
+            Time at which the values are calculated.
+        
+        Returns
+        -------
+        weights : dict
+            Weights of the components, formatted as ``{name: weight}``.
+        D_basis : dict
+            Basis components of the noise matrix, formatted as ``{name: D_k}``.
+        """
+
+        # initialize components
+        D_basis = {name: np.zeros(self.dim_corrs, dtype=np.float64) for name in ['kappa', 'vacuum', 'n_thL', 'n_thR']}
+
+        for i in range(2):
+            # optical modes
+            D_basis['kappa'][4*i + 0][4*i + 0] = self.params['kappas'][i]
+            D_basis['kappa'][4*i + 1][4*i + 1] = self.params['kappas'][i]
+            # mechanical modes
+            D_basis['vacuum'][4*i + 2][4*i + 2] = self.params['gammas'][i]
+            D_basis['vacuum'][4*i + 3][4*i + 3] = self.params['gammas'][i]
+            # thermal noises per unit occupancy
+            D_basis[['n_thL', 'n_thR'][i]][4*i + 2][4*i + 2] = 2.0 * self.params['gammas'][i]
+            D_basis[['n_thL', 'n_thR'][i]][4*i + 3][4*i + 3] = 2.0 * self.params['gammas'][i]
+
+        # weights
+        weights = {
+            'kappa' : 1.0,
+            'vacuum': 1.0,
+            'n_thL' : self.params['n_ths'][0],
+            'n_thR' : self.params['n_ths'][1]
+        }
+
+        return weights, D_basis
+
+    def get_iv_corrs_basis(self):
+        """Method to obtain the basis components of the initial values of the correlations.
+
+        The initial correlations are the sum of the components weighted as the components of the noise matrix (see :meth:`get_D_basis`), such that each reweighting of the noises starts from the corresponding initial correlations.
+
+        Returns
+        -------
+        iv_corrs_basis : dict
+            Basis components of the initial correlations, formatted as ``{name: V_k}``.
+        """
+
+        # initialize components
+        iv_corrs_basis = {name: np.zeros(self.dim_corrs, dtype=np.float64) for name in ['kappa', 'vacuum', 'n_thL', 'n_thR']}
+
+        for i in range(2):
+            # optical vacuum
+            iv_corrs_basis['kappa'][4*i + 0][4*i + 0] = 0.5
+            iv_corrs_basis['kappa'][4*i + 1][4*i + 1] = 0.5
+            # mechanical vacuum
+            iv_corrs_basis['vacuum'][4*i + 2][4*i + 2] = 0.5
+            iv_corrs_basis['vacuum'][4*i + 3][4*i + 3] = 0.5
+            # thermal occupancies per unit occupancy
+            iv_corrs_basis[['n_thL', 'n_thR'][i]][4*i + 2][4*i + 2] = 1.0
+            iv_corrs_basis[['n_thL', 'n_thR'][i]][4*i + 3][4*i + 3] = 1.0
+
+        return iv_corrs_basis
+
     def get_ivc(self):
         """Method to obtain the initial values of the modes, correlations and derived constants and controls.
         
@@ -157,10 +341,10 @@ class Bi_00(BaseSystem):
         """
  
         # initial values of the modes
-        iv_modes = np.zeros(self.num_modes, dtype=np.complex_)
+        iv_modes = np.zeros(self.num_modes, dtype=np.complex128)
 
         # initial values of the correlations
-        iv_corrs = np.zeros(self.dim_corrs, dtype=np.float_)
+        iv_corrs = np.zeros(self.dim_corrs, dtype=np.float64)
         for i in range(2):
             iv_corrs[4*i + 0][4*i + 0] = 0.5
             iv_corrs[4*i + 1][4*i + 1] = 0.5
@@ -204,4 +388,66 @@ class Bi_00(BaseSystem):
         # mechanical modes
         dbeta_dts = [1.0j * gs[i] * np.conjugate(alphas[i]) + (- self.params['gammas'][i] - 1.0j * omega_ms[i]) * betas[i] for i in range(2)]
 
-        return np.array([dalpha_dts[0], dbeta_dts[0], dalpha_dts[1], dbeta_dts[1]], dtype=np.complex_)
\ No newline at end of file
+        return np.array([dalpha_dts[0], dbeta_dts[0], dalpha_dts[1], dbeta_dts[1]], dtype=np.complex128)
+
+    def get_mode_rates_grad(self, modes, c, t, key):
+        """Method to obtain the derivatives of the rates of change of the modes with respect to a parameter.
+
+        Parameters
+        ----------
+        modes : numpy.ndarray
+            Classical modes.
+        c : numpy.ndarray
+            Derived constants and controls.
+        t : float
+            Time at which the values are calculated.
+        key : str
+            Key of the parameter. Available options are ``'delta'``, ``'lambda'``.
+        
+        Returns
+        -------
+        mode_rates_grad : numpy.ndarray
+            Derivatives of the rates of change of the modes.
+        """
+
+        assert key in ['delta', 'lambda'], 'Parameter ``key`` should be either ``delta`` or ``lambda``'
+
+        # extract frequently used variables
+        alphas = modes[::2]
+        betas = modes[1::2]
+
+        # initialize derivatives
+        mode_rates_grad = np.zeros(self.num_modes, dtype=np.complex128)
+
+        # detuning of the right mechanical mode
+        if key == 'delta':
+            mode_rates_grad[2] = 1.0j * self.params['Delta_0_sign'] * alphas[1]
+            mode_rates_grad[3] = - 1.0j * betas[1]
+        # coupling strength of the optical channel
+        elif key == 'lambda':
+            mode_rates_grad[0] = 1.0j * alphas[1]
+            mode_rates_grad[2] = 1.0j * alphas[0]
+
+        return mode_rates_grad
+
+    def get_mode_rates_jac(self, modes, c, t):
+        r"""Method to obtain the Jacobian of the rates of change of the modes.
+
+        The rates and the modes are in the real form :math:`\left[ \mathrm{Re} \alpha_{L}, \mathrm{Im} \alpha_{L}, \mathrm{Re} \beta_{L}, \mathrm{Im} \beta_{L}, ... \right]`, for which the Jacobian coincides with the drift matrix.
+
+        Parameters
+        ----------
+        modes : numpy.ndarray
+            Classical modes.
+        c : numpy.ndarray
+            Derived constants and controls.
+        t : float
+            Time at which the values are calculated.
+        
+        Returns
+        -------
+        mode_rates_jac : numpy.ndarray
+            Jacobian of the rates of change of the modes.
+        """
+
+        return np.array(self.get_A(modes, c, t), dtype=np.float64)
\ No newline at end of file
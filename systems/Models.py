@@ -0,0 +1,357 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Classes to simulate coupled QOM systems with kernels generated from model specifications."""
+
+__authors__ = ["Sampreet Kalita"]
+__toolbox__ = 'qom-v1.0.1'
+__created__ = "2026-10-18"
+__updated__ = "2026-10-18"
+
+# dependencies
+import numpy as np
+
+# qom modules
+from qom.systems import BaseSystem
+
+# local modules
+from utils.models import ModelSpec, get_kernels
+
+def get_terms_bi(p, z, z_c):
+    r"""Function to obtain the terms of two simple bidirectionally-coupled QOM systems.
+
+    Parameters
+    ----------
+    p : dict
+        Symbols of the parameters.
+    z : list
+        Symbols of the modes, in the format :math:`\left[ \alpha_{L}, \beta_{L}, \alpha_{R}, \beta_{R} \right]`.
+    z_c : list
+        Symbols of the conjugates of the modes.
+
+    Returns
+    -------
+    terms : dict
+        Terms of the model (see :class:`utils.models.ModelSpec`).
+    """
+
+    # effective values
+    omega_ms = [p['omega_mL'], p['omega_mL'] + p['delta']]
+
+    return {
+        'H'             : sum(- p['Delta_0_sign'] * omega_ms[i] * z_c[2*i] * z[2*i] + omega_ms[i] * z_c[2*i + 1] * z[2*i + 1] - p['g_0s'][i] * z_c[2*i] * z[2*i] * (z[2*i + 1] + z_c[2*i + 1]) for i in range(2)) - p['lambda'] * (z_c[0] * z[2] + z_c[2] * z[0]),
+        'losses'        : [p['kappas'][0], p['gammas'][0], p['kappas'][1], p['gammas'][1]],
+        'drives'        : [p['A_l'], 0, p['A_l'], 0],
+        'noises'        : {(4*i + q, 4*i + q): p['kappas'][i] if q < 2 else p['gammas'][i] * (2 * p['n_ths'][i] + 1) for i in range(2) for q in range(4)},
+        'occupancies'   : [0, p['n_ths'][0], 0, p['n_ths'][1]]
+    }
+
+def get_terms_uni(p, z, z_c):
+    r"""Function to obtain the terms of two simple unidirectionally-coupled QOM systems.
+
+    Parameters
+    ----------
+    p : dict
+        Symbols of the parameters.
+    z : list
+        Symbols of the modes, in the format :math:`\left[ \alpha_{L}, \beta_{L}, \alpha_{R}, \beta_{R} \right]`.
+    z_c : list
+        Symbols of the conjugates of the modes.
+
+    Returns
+    -------
+    terms : dict
+        Terms of the model (see :class:`utils.models.ModelSpec`).
+    """
+
+    # dependencies
+    import sympy as sp
+
+    # effective values
+    omega_ms = [p['omega_mL'], p['omega_mL'] + p['delta']]
+    temp = sp.sqrt(p['eta'] * p['kappas'][0] * p['kappas'][1])
+
+    # noises of the isolated systems and the cascaded channel
+    noises = {(4*i + q, 4*i + q): p['kappas'][i] if q < 2 else p['gammas'][i] * (2 * p['n_ths'][i] + 1) for i in range(2) for q in range(4)}
+    noises.update({(0, 4): temp, (1, 5): temp})
+
+    return {
+        'H'             : sum(- p['Delta_0_sign'] * omega_ms[i] * z_c[2*i] * z[2*i] + omega_ms[i] * z_c[2*i + 1] * z[2*i + 1] - p['g_0s'][i] * z_c[2*i] * z[2*i] * (z[2*i + 1] + z_c[2*i + 1]) for i in range(2)),
+        'losses'        : [p['kappas'][0], p['gammas'][0], p['kappas'][1], p['gammas'][1]],
+        'couplings'     : {(2, 0): - 2 * temp},
+        'drives'        : [p['A_l'], 0, (sp.sqrt(p['eta']) + sp.sqrt(1 - p['eta'])) * p['A_l'], 0],
+        'noises'        : noises,
+        'occupancies'   : [0, p['n_ths'][0], 0, p['n_ths'][1]]
+    }
+
+class ModelSystem(BaseSystem):
+    r"""Class to simulate coupled QOM systems with the kernels generated from a model specification.
+
+    The kernels are generated by :func:`utils.models.get_kernels` on first use and cached on disk.
+    The classical modes are always those of the specification, whereas the correlations are those of the plus-minus modes if the parameter ``'basis'`` is ``'pm'``.
+
+    Parameters
+    ----------
+    params : dict
+        Parameters for the system, along with the parameter ``'basis'`` (``'lr'`` or ``'pm'``).
+    name : str
+        Name of the system.
+    desc : str
+        Description of the system.
+    cb_update : callable, optional
+        Callback function to update status and progress, formatted as ``cb_update(status, progress, reset)``, where ``status`` is a string, ``progress`` is a float and ``reset`` is a boolean.
+    """
+
+    # specification of the model
+    spec = None
+
+    # available bases of the correlations
+    bases = ['lr', 'pm']
+
+    def __init__(self, params, name, desc, cb_update=None):
+        """Class constructor for ModelSystem."""
+
+        # initialize super class
+        super().__init__(
+            params=params,
+            name=name,
+            desc=desc,
+            num_modes=len(self.spec.modes),
+            cb_update=cb_update
+        )
+        assert self.params['basis'] in self.bases, 'Parameter ``basis`` should be one of ``{}``'.format(self.bases)
+        assert self.params['basis'] == 'lr' or self.spec.pairs is not None, 'Model ``{}`` has no plus-minus modes'.format(self.spec.name)
+
+        # kernels and parameters
+        self.kernels = get_kernels(self.spec)
+        self.p = self.spec.get_values(self.params)
+        self.suffix = '_pm' if self.params['basis'] == 'pm' else ''
+
+    def _get_y(self, modes):
+        # real form of the modes
+        return np.ascontiguousarray(modes, dtype=np.complex128).view(np.float64)
+
+    def get_A(self, modes, c, t):
+        """Method to obtain the drift matrix.
+
+        Parameters
+        ----------
+        modes : numpy.ndarray
+            Classical modes.
+        c : numpy.ndarray
+            Derived constants and controls.
+        t : float
+            Time at which the values are calculated.
+
+        Returns
+        -------
+        A : numpy.ndarray
+            Drift matrix.
+        """
+
+        return getattr(self.kernels, 'get_A' + self.suffix)(self._get_y(modes), self.p)
+
+    def get_A_jac(self, modes, c, t):
+        r"""Method to obtain the derivatives of the drift matrix with respect to the real and imaginary parts of the modes.
+
+        Parameters
+        ----------
+        modes : numpy.ndarray
+            Classical modes.
+        c : numpy.ndarray
+            Derived constants and controls.
+        t : float
+            Time at which the values are calculated.
+
+        Returns
+        -------
+        A_jac : numpy.ndarray
+            Derivatives of the drift matrix, in the format :math:`\partial A / \partial y_{k}` along the first axis.
+        """
+
+        return getattr(self.kernels, 'get_A_jac' + self.suffix)(self._get_y(modes), self.p)
+
+    def get_D(self, modes, corrs, c, t):
+        """Method to obtain the noise matrix.
+
+        Parameters
+        ----------
+        modes : numpy.ndarray
+            Classical modes.
+        corrs : numpy.ndarray
+            Quantum correlations.
+        c : numpy.ndarray
+            Derived constants and controls.
+        t : float
+            Time at which the values are calculated.
+
+        Returns
+        -------
+        D : numpy.ndarray
+            Noise matrix.
+        """
+
+        return getattr(self.kernels, 'get_D' + self.suffix)(self._get_y(modes), self.p)
+
+    def get_ivc(self):
+        """Method to obtain the initial values of the modes, correlations and derived constants and controls.
+
+        Returns
+        -------
+        iv_modes : numpy.ndarray
+            Initial values of the classical modes.
+        iv_corrs : numpy.ndarray
+            Initial values of the quantum correlations.
+        c : numpy.ndarray
+            Derived constants and controls.
+        """
+
+        # initial values of the modes
+        iv_modes = np.zeros(self.num_modes, dtype=np.complex128)
+
+        # initial values of the correlations
+        iv_corrs = getattr(self.kernels, 'get_iv_corrs' + self.suffix)(self._get_y(iv_modes), self.p)
+
+        return iv_modes, iv_corrs, np.empty(0)
+
+    def get_mode_rates(self, modes, c, t):
+        """Method to obtain the rates of change of the modes.
+
+        Parameters
+        ----------
+        modes : numpy.ndarray
+            Classical modes.
+        c : numpy.ndarray
+            Derived constants and controls.
+        t : float
+            Time at which the values are calculated.
+
+        Returns
+        -------
+        mode_rates : numpy.ndarray
+            Rates of change of the modes.
+        """
+
+        return self.kernels.get_mode_rates(self._get_y(modes), self.p).view(np.complex128)
+
+    def get_mode_rates_jac(self, modes, c, t):
+        """Method to obtain the Jacobian of the rates of change of the modes in the real form.
+
+        Parameters
+        ----------
+        modes : numpy.ndarray
+            Classical modes.
+        c : numpy.ndarray
+            Derived constants and controls.
+        t : float
+            Time at which the values are calculated.
+
+        Returns
+        -------
+        mode_rates_jac : numpy.ndarray
+            Jacobian of the rates of change of the modes.
+        """
+
+        return self.kernels.get_A(self._get_y(modes), self.p)
+
+class Bi_02(ModelSystem):
+    r"""Class to simulate two simple bidirectionally-coupled QOM systems with generated kernels.
+
+    The model is that of :class:`systems.Bidirectional.Bi_00`, specified by :func:`get_terms_bi`.
+
+    Parameters
+    ----------
+    params : dict
+        Parameters for the system. Along with the parameters of :class:`systems.Bidirectional.Bi_00`, the system parameters are:
+        ============    ====================================================================
+        key             meaning
+        ============    ====================================================================
+        basis           (*str*) basis of the correlations. Only ``'lr'`` (left-right modes) is available. Default is ``'lr'``.
+        ============    ====================================================================
+    cb_update : callable, optional
+        Callback function to update status and progress, formatted as ``cb_update(status, progress, reset)``, where ``status`` is a string, ``progress`` is a float and ``reset`` is a boolean.
+    """
+
+    system_defaults = {
+        'A_l'           : 52.0,
+        'Delta_0_sign'  : 1.0,
+        'delta'         : 0.01,
+        'g_0s'          : [0.005, 0.005],
+        'gammas'        : [0.005, 0.005],
+        'kappas'        : [0.15, 0.15],
+        'lambda'        : 0.075,
+        'n_ths'         : [0.0, 0.0],
+        'omega_mL'      : 1.0,
+        'basis'         : 'lr'
+    }
+
+    # specification of the model
+    spec = ModelSpec(
+        name='Bi',
+        modes=['alpha_L', 'beta_L', 'alpha_R', 'beta_R'],
+        system_defaults={key: value for key, value in system_defaults.items() if key != 'basis'},
+        get_terms=get_terms_bi
+    )
+
+    def __init__(self, params={}, cb_update=None):
+        """Class constructor for Bi_02."""
+
+        # initialize super class
+        super().__init__(
+            params=params,
+            name='Bi_02',
+            desc='Two Simple Bidirectionally-coupled QOM Systems with Generated Kernels',
+            cb_update=cb_update
+        )
+
+class Uni_03(ModelSystem):
+    r"""Class to simulate two simple unidirectionally-coupled QOM systems with generated kernels.
+
+    The model is that of :class:`systems.Unidirectional.Uni_00`, specified by :func:`get_terms_uni`, and the plus-minus correlations correspond to those of :class:`systems.Unidirectional.Uni_01`.
+    The noise matrix and the initial correlations of the plus-minus modes are the exact transforms of those of the left-right modes.
+
+    Parameters
+    ----------
+    params : dict
+        Parameters for the system. Along with the parameters of :class:`systems.Unidirectional.Uni_00`, the system parameters are:
+        ============    ====================================================================
+        key             meaning
+        ============    ====================================================================
+        basis           (*str*) basis of the correlations. Available options are ``'lr'`` (left-right modes) and ``'pm'`` (plus-minus modes). Default is ``'lr'``.
+        ============    ====================================================================
+    cb_update : callable, optional
+        Callback function to update status and progress, formatted as ``cb_update(status, progress, reset)``, where ``status`` is a string, ``progress`` is a float and ``reset`` is a boolean.
+    """
+
+    system_defaults = {
+        'A_l'           : 52.0,
+        'Delta_0_sign'  : 1.0,
+        'delta'         : 0.01,
+        'eta'           : 0.75,
+        'g_0s'          : [0.005, 0.005],
+        'gammas'        : [0.005, 0.005],
+        'kappas'        : [0.15, 0.15],
+        'n_ths'         : [0.0, 0.0],
+        'omega_mL'      : 1.0,
+        'basis'         : 'lr'
+    }
+
+    # specification of the model
+    spec = ModelSpec(
+        name='Uni',
+        modes=['alpha_L', 'beta_L', 'alpha_R', 'beta_R'],
+        system_defaults={key: value for key, value in system_defaults.items() if key != 'basis'},
+        get_terms=get_terms_uni,
+        pairs=[(0, 2), (1, 3)]
+    )
+
+    def __init__(self, params={}, cb_update=None):
+        """Class constructor for Uni_03."""
+
+        # initialize super class
+        super().__init__(
+            params=params,
+            name='Uni_03',
+            desc='Two Simple Unidirectionally-coupled QOM Systems with Generated Kernels',
+            cb_update=cb_update
+        )
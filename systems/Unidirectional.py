@@ -6,7 +6,7 @@
 __authors__ = ["Sampreet Kalita"]
 __toolbox__ = 'qom-v1.0.1'
 __created__ = "2020-01-04"
-__updated__ = "2024-01-09"
+__updated__ = "2026-10-19"
 
 # dependencies
 import numpy as np
@@ -112,7 +112,81 @@ class Uni_00(BaseSystem):
         self.A[5][1] = - 2 * temp
 
         return self.A
+
+    def get_A_grad(self, modes, c, t, key):
+        """Method to obtain the derivatives of the drift matrix with respect to a parameter.
+
+        Parameters
+        ----------
+        modes : numpy.ndarray
+            Classical modes.
+        c : numpy.ndarray
+            Derived constants and controls.
+        t : float
+            Time at which the values are calculated.
+        key : str
+            Key of the parameter. Available options are ``'delta'``, ``'eta'``.
+        
+        Returns
+        -------
+        A_grad : numpy.ndarray
+            Derivatives of the drift matrix.
+        """
+
+        assert key in ['delta', 'eta'], 'Parameter ``key`` should be either ``delta`` or ``eta``'
+
+        # initialize derivatives
+        A_grad = np.zeros(self.dim_corrs, dtype=np.float64)
+
+        # detuning of the right mechanical mode
+        if key == 'delta':
+            A_grad[4][5] = - self.params['Delta_0_sign']
+            A_grad[5][4] = self.params['Delta_0_sign']
+            A_grad[6][7] = 1.0
+            A_grad[7][6] = - 1.0
+        # transmission coefficient of the optical channel
+        elif key == 'eta':
+            temp_grad = np.sqrt(self.params['kappas'][0] * self.params['kappas'][1] / self.params['eta']) / 2.0
+            A_grad[4][0] = - 2.0 * temp_grad
+            A_grad[5][1] = - 2.0 * temp_grad
+
+        return A_grad
+
+    def get_A_jac(self, modes, c, t):
+        r"""Method to obtain the derivatives of the drift matrix with respect to the real and imaginary parts of the modes.
+
+        Parameters
+        ----------
+        modes : numpy.ndarray
+            Classical modes.
+        c : numpy.ndarray
+            Derived constants and controls.
+        t : float
+            Time at which the values are calculated.
+        
+        Returns
+        -------
+        A_jac : numpy.ndarray
+            Derivatives of the drift matrix, in the format :math:`\partial A / \partial y_{k}` along the first axis, where :math:`y = \left[ \mathrm{Re} \alpha_{L}, \mathrm{Im} \alpha_{L}, \mathrm{Re} \beta_{L}, \mathrm{Im} \beta_{L}, ... \right]`.
+        """
+
+        # initialize derivatives
+        A_jac = np.zeros((2 * self.num_modes, ) + self.dim_corrs, dtype=np.float64)
+
+        # update derivatives
+        for i in range(2):
+            # detunings
+            A_jac[4*i + 2][4*i + 0][4*i + 1] = - 2.0 * self.params['g_0s'][i]
+            A_jac[4*i + 2][4*i + 1][4*i + 0] = 2.0 * self.params['g_0s'][i]
+            # effective optomechanical couplings
+            A_jac[4*i + 1][4*i + 0][4*i + 2] = - 2.0 * self.params['g_0s'][i]
+            A_jac[4*i + 0][4*i + 1][4*i + 2] = 2.0 * self.params['g_0s'][i]
+            A_jac[4*i + 0][4*i + 3][4*i + 0] = 2.0 * self.params['g_0s'][i]
+            A_jac[4*i + 1][4*i + 3][4*i + 1] = 2.0 * self.params['g_0s'][i]
+
+        return A_jac
     
+
     def get_D(self, modes, corrs, c, t):
         """Method to obtain the noise matrix.
         
@@ -151,6 +225,126 @@ class Uni_00(BaseSystem):
 
         return self.D
 
+    def get_D_grad(self, modes, corrs, c, t, key):
+        """Method to obtain the derivatives of the noise matrix with respect to a parameter.
+
+        Parameters
+        ----------
+        modes : numpy.ndarray
+            Classical modes.
+        corrs : numpy.ndarray
+            Quantum correlations.
+        c : numpy.ndarray
+            Derived constants and controls.
+        t : float
+            Time at which the values are calculated.
+        key : str
+            Key of the parameter. Available options are ``'delta'``, ``'eta'``.
+        
+        Returns
+        -------
+        D_grad : numpy.ndarray
+            Derivatives of the noise matrix.
+        """
+
+        assert key in ['delta', 'eta'], 'Parameter ``key`` should be either ``delta`` or ``eta``'
+
+        # initialize derivatives
+        D_grad = np.zeros(self.dim_corrs, dtype=np.float64)
+
+        # transmission coefficient of the optical channel
+        if key == 'eta':
+            temp_grad = np.sqrt(self.params['kappas'][0] * self.params['kappas'][1] / self.params['eta']) / 2.0
+            D_grad[0][4] = temp_grad
+            D_grad[1][5] = temp_grad
+            D_grad[4][0] = temp_grad
+            D_grad[5][1] = temp_grad
+
+        return D_grad
+
+    def get_D_basis(self, modes, corrs, c, t):
+        """Method to obtain the weights and the basis components of the noise matrix.
+
+        The noise matrix is the weighted sum of the components, such that any reweighting of the noises can be evaluated as a linear combination of the correlations driven by each component.
+
+        Parameters
+        ----------
+        modes : numpy.ndarray
+            Classical modes.
+        corrs : numpy.ndarray
+            Quantum correlations.
+        c : numpy.ndarray
+            Derived constants and controls.
+        t : float
+            Time at which the values are calculated.
+        
+        Returns
+        -------
+        weights : dict
+            Weights of the components, formatted as ``{name: weight}``.
+        D_basis : dict
+            Basis components of the noise matrix, formatted as ``{name: D_k}``.
+        """
+
+        # initialize components
+        D_basis = {name: np.zeros(self.dim_corrs, dtype=np.float64) for name in ['kappa', 'vacuum', 'n_thL', 'n_thR', 'eta']}
+
+        for i in range(2):
+            # optical modes
+            D_basis['kappa'][4*i + 0][4*i + 0] = self.params['kappas'][i]
+            D_basis['kappa'][4*i + 1][4*i + 1] = self.params['kappas'][i]
+            # mechanical modes
+            D_basis['vacuum'][4*i + 2][4*i + 2] = self.params['gammas'][i]
+            D_basis['vacuum'][4*i + 3][4*i + 3] = self.params['gammas'][i]
+            # thermal noises per unit occupancy
+            D_basis[['n_thL', 'n_thR'][i]][4*i + 2][4*i + 2] = 2.0 * self.params['gammas'][i]
+            D_basis[['n_thL', 'n_thR'][i]][4*i + 3][4*i + 3] = 2.0 * self.params['gammas'][i]
+
+        # cross terms of the cascaded channel per unit square root of the transmission
+        temp = np.sqrt(self.params['kappas'][0] * self.params['kappas'][1])
+        D_basis['eta'][0][4] = temp
+        D_basis['eta'][1][5] = temp
+        D_basis['eta'][4][0] = temp
+        D_basis['eta'][5][1] = temp
+
+        # weights
+        weights = {
+            'kappa' : 1.0,
+            'vacuum': 1.0,
+            'n_thL' : self.params['n_ths'][0],
+            'n_thR' : self.params['n_ths'][1],
+            'eta'   : np.sqrt(self.params['eta'])
+        }
+
+        return weights, D_basis
+
+    def get_iv_corrs_basis(self):
+        """Method to obtain the basis components of the initial values of the correlations.
+
+        The initial correlations are the sum of the components weighted as the components of the noise matrix (see :meth:`get_D_basis`), such that each reweighting of the noises starts from the corresponding initial correlations.
+
+        Returns
+        -------
+        iv_corrs_basis : dict
+            Basis components of the initial correlations, formatted as ``{name: V_k}``.
+        """
+
+        # initialize components
+        iv_corrs_basis = {name: np.zeros(self.dim_corrs, dtype=np.float64) for name in ['kappa', 'vacuum', 'n_thL', 'n_thR', 'eta']}
+
+        for i in range(2):
+            # optical vacuum
+            iv_corrs_basis['kappa'][4*i + 0][4*i + 0] = 0.5
+            iv_corrs_basis['kappa'][4*i + 1][4*i + 1] = 0.5
+            # mechanical vacuum
+            iv_corrs_basis['vacuum'][4*i + 2][4*i + 2] = 0.5
+            iv_corrs_basis['vacuum'][4*i + 3][4*i + 3] = 0.5
+            # thermal occupancies per unit occupancy
+            iv_corrs_basis[['n_thL', 'n_thR'][i]][4*i + 2][4*i + 2] = 1.0
+            iv_corrs_basis[['n_thL', 'n_thR'][i]][4*i + 3][4*i + 3] = 1.0
+
+        return iv_corrs_basis
+
     def get_ivc(self):
         """Method to obtain the initial values of the modes, correlations and derived constants and controls.
         
@@ -165,10 +359,10 @@ class Uni_00(BaseSystem):
         """
  
         # initial mode amplitudes
-        iv_modes = np.zeros(self.num_modes, dtype=np.complex_)
+        iv_modes = np.zeros(self.num_modes, dtype=np.complex128)
 
         # initial quadrature correlations
-        iv_corrs = np.zeros(self.dim_corrs, dtype=np.float_)
+        iv_corrs = np.zeros(self.dim_corrs, dtype=np.float64)
         for i in range(2):
             iv_corrs[4*i + 0][4*i + 0] = 0.5
             iv_corrs[4*i + 1][4*i + 1] = 0.5
@@ -214,7 +408,69 @@ class Uni_00(BaseSystem):
         # mechanical modes
         dbeta_dts = [1.0j * gs[i] * np.conjugate(alphas[i]) + (- self.params['gammas'][i] - 1.0j * omega_ms[i]) * betas[i] for i in range(2)]
         
-        return np.array([dalpha_dts[0], dbeta_dts[0], dalpha_dts[1], dbeta_dts[1]], dtype=np.complex_)
+        return np.array([dalpha_dts[0], dbeta_dts[0], dalpha_dts[1], dbeta_dts[1]], dtype=np.complex128)
+
+    def get_mode_rates_grad(self, modes, c, t, key):
+        """Method to obtain the derivatives of the rates of change of the modes with respect to a parameter.
+
+        Parameters
+        ----------
+        modes : numpy.ndarray
+            Classical modes.
+        c : numpy.ndarray
+            Derived constants and controls.
+        t : float
+            Time at which the values are calculated.
+        key : str
+            Key of the parameter. Available options are ``'delta'``, ``'eta'``.
+        
+        Returns
+        -------
+        mode_rates_grad : numpy.ndarray
+            Derivatives of the rates of change of the modes.
+        """
+
+        assert key in ['delta', 'eta'], 'Parameter ``key`` should be either ``delta`` or ``eta``'
+
+        # extract frequently used variables
+        alphas = modes[::2]
+        betas = modes[1::2]
+
+        # initialize derivatives
+        mode_rates_grad = np.zeros(self.num_modes, dtype=np.complex128)
+
+        # detuning of the right mechanical mode
+        if key == 'delta':
+            mode_rates_grad[2] = 1.0j * self.params['Delta_0_sign'] * alphas[1]
+            mode_rates_grad[3] = - 1.0j * betas[1]
+        # transmission coefficient of the optical channel
+        elif key == 'eta':
+            temp_grad = np.sqrt(self.params['kappas'][0] * self.params['kappas'][1] / self.params['eta']) / 2.0
+            mode_rates_grad[2] = - 2.0 * temp_grad * alphas[0] + (0.5 / np.sqrt(self.params['eta']) - 0.5 / np.sqrt(1.0 - self.params['eta'])) * self.params['A_l']
+
+        return mode_rates_grad
+
+    def get_mode_rates_jac(self, modes, c, t):
+        r"""Method to obtain the Jacobian of the rates of change of the modes.
+
+        The rates and the modes are in the real form :math:`\left[ \mathrm{Re} \alpha_{L}, \mathrm{Im} \alpha_{L}, \mathrm{Re} \beta_{L}, \mathrm{Im} \beta_{L}, ... \right]`, for which the Jacobian coincides with the drift matrix.
+
+        Parameters
+        ----------
+        modes : numpy.ndarray
+            Classical modes.
+        c : numpy.ndarray
+            Derived constants and controls.
+        t : float
+            Time at which the values are calculated.
+        
+        Returns
+        -------
+        mode_rates_jac : numpy.ndarray
+            Jacobian of the rates of change of the modes.
+        """
+
+        return np.array(self.get_A(modes, c, t), dtype=np.float64)
 
 class Uni_01(BaseSystem):
     """Class to simulate two simple unidirectionally-coupled QOM systems with Plus-Minus modes.
@@ -326,7 +582,115 @@ class Uni_01(BaseSystem):
             self.A[4*i + 3][7] = - self.params['gammas'][0] / 2.0 + _sign * self.params['gammas'][1] / 2.0
 
         return self.A
+
+    def get_A_grad(self, modes, c, t, key):
+        """Method to obtain the derivatives of the drift matrix with respect to a parameter.
+
+        Parameters
+        ----------
+        modes : numpy.ndarray
+            Classical modes.
+        c : numpy.ndarray
+            Derived constants and controls.
+        t : float
+            Time at which the values are calculated.
+        key : str
+            Key of the parameter. Available options are ``'delta'``, ``'eta'``.
+        
+        Returns
+        -------
+        A_grad : numpy.ndarray
+            Derivatives of the drift matrix.
+        """
+
+        assert key in ['delta', 'eta'], 'Parameter ``key`` should be either ``delta`` or ``eta``'
+
+        # initialize derivatives
+        A_grad = np.zeros(self.dim_corrs, dtype=np.float64)
+
+        # update derivatives
+        for i in range(2):
+            # sign of mode
+            _sign = - 2.0 * (i - 0.5)
+            # detuning of the right mechanical mode
+            if key == 'delta':
+                A_grad[4*i + 0][1] = - _sign * self.params['Delta_0_sign'] / 2.0
+                A_grad[4*i + 0][5] = _sign * self.params['Delta_0_sign'] / 2.0
+                A_grad[4*i + 1][0] = _sign * self.params['Delta_0_sign'] / 2.0
+                A_grad[4*i + 1][4] = - _sign * self.params['Delta_0_sign'] / 2.0
+                A_grad[4*i + 2][3] = _sign / 2.0
+                A_grad[4*i + 2][7] = - _sign / 2.0
+                A_grad[4*i + 3][2] = - _sign / 2.0
+                A_grad[4*i + 3][6] = _sign / 2.0
+            # transmission coefficient of the optical channel
+            elif key == 'eta':
+                temp_grad = np.sqrt(self.params['kappas'][0] * self.params['kappas'][1] / self.params['eta']) / 2.0
+                A_grad[4*i + 0][0] = - _sign * temp_grad
+                A_grad[4*i + 0][4] = - _sign * temp_grad
+                A_grad[4*i + 1][1] = - _sign * temp_grad
+                A_grad[4*i + 1][5] = - _sign * temp_grad
+
+        return A_grad
+
+    def get_A_jac(self, modes, c, t):
+        r"""Method to obtain the derivatives of the drift matrix with respect to the real and imaginary parts of the modes.
+
+        Parameters
+        ----------
+        modes : numpy.ndarray
+            Classical modes.
+        c : numpy.ndarray
+            Derived constants and controls.
+        t : float
+            Time at which the values are calculated.
+        
+        Returns
+        -------
+        A_jac : numpy.ndarray
+            Derivatives of the drift matrix, in the format :math:`\partial A / \partial y_{k}` along the first axis, where :math:`y = \left[ \mathrm{Re} \alpha_{L}, \mathrm{Im} \alpha_{L}, \mathrm{Re} \beta_{L}, \mathrm{Im} \beta_{L}, ... \right]`.
+        """
+
+        # extract frequently used variables
+        g_0s = self.params['g_0s']
+
+        # initialize derivatives
+        A_jac = np.zeros((2 * self.num_modes, ) + self.dim_corrs, dtype=np.float64)
+
+        # update derivatives
+        for i in range(2):
+            # sign of mode
+            _sign = - 2.0 * (i - 0.5)
+            # X quadratures
+            A_jac[2][4*i + 0][1] = - g_0s[0]
+            A_jac[6][4*i + 0][1] = - _sign * g_0s[1]
+            A_jac[1][4*i + 0][2] = - g_0s[0]
+            A_jac[5][4*i + 0][2] = - _sign * g_0s[1]
+            A_jac[2][4*i + 0][5] = - g_0s[0]
+            A_jac[6][4*i + 0][5] = _sign * g_0s[1]
+            A_jac[1][4*i + 0][6] = - g_0s[0]
+            A_jac[5][4*i + 0][6] = _sign * g_0s[1]
+            # Y quadratures
+            A_jac[2][4*i + 1][0] = g_0s[0]
+            A_jac[6][4*i + 1][0] = _sign * g_0s[1]
+            A_jac[0][4*i + 1][2] = g_0s[0]
+            A_jac[4][4*i + 1][2] = _sign * g_0s[1]
+            A_jac[2][4*i + 1][4] = g_0s[0]
+            A_jac[6][4*i + 1][4] = - _sign * g_0s[1]
+            A_jac[0][4*i + 1][6] = g_0s[0]
+            A_jac[4][4*i + 1][6] = - _sign * g_0s[1]
+            # P quadratures
+            A_jac[0][4*i + 3][0] = g_0s[0]
+            A_jac[4][4*i + 3][0] = _sign * g_0s[1]
+            A_jac[1][4*i + 3][1] = g_0s[0]
+            A_jac[5][4*i + 3][1] = _sign * g_0s[1]
+            A_jac[0][4*i + 3][4] = g_0s[0]
+            A_jac[4][4*i + 3][4] = - _sign * g_0s[1]
+            A_jac[1][4*i + 3][5] = g_0s[0]
+            A_jac[5][4*i + 3][5] = - _sign * g_0s[1]
+
+        return A_jac
     
+
     def get_D(self, modes, corrs, c, t):
         """Method to obtain the noise matrix.
         
@@ -371,6 +735,44 @@ class Uni_01(BaseSystem):
 
         return self.D
 
+    def get_D_grad(self, modes, corrs, c, t, key):
+        """Method to obtain the derivatives of the noise matrix with respect to a parameter.
+
+        Parameters
+        ----------
+        modes : numpy.ndarray
+            Classical modes.
+        corrs : numpy.ndarray
+            Quantum correlations.
+        c : numpy.ndarray
+            Derived constants and controls.
+        t : float
+            Time at which the values are calculated.
+        key : str
+            Key of the parameter. Available options are ``'delta'``, ``'eta'``.
+        
+        Returns
+        -------
+        D_grad : numpy.ndarray
+            Derivatives of the noise matrix.
+        """
+
+        assert key in ['delta', 'eta'], 'Parameter ``key`` should be either ``delta`` or ``eta``'
+
+        # initialize derivatives
+        D_grad = np.zeros(self.dim_corrs, dtype=np.float64)
+
+        # transmission coefficient of the optical channel
+        if key == 'eta':
+            temp_grad = np.sqrt(self.params['kappas'][0] * self.params['kappas'][1] / self.params['eta']) / 2.0
+            for i in range(2):
+                # sign of mode
+                _sign = - 2.0 * (i - 0.5)
+                D_grad[4*i + 0][4*i + 0] = _sign * temp_grad
+                D_grad[4*i + 1][4*i + 1] = _sign * temp_grad
+
+        return D_grad
+
     def get_ivc(self):
         """Method to obtain the initial values of the modes, correlations and derived constants and controls.
         
@@ -385,10 +787,10 @@ class Uni_01(BaseSystem):
         """
  
         # initial mode amplitudes
-        iv_modes = np.zeros(self.num_modes, dtype=np.complex_)
+        iv_modes = np.zeros(self.num_modes, dtype=np.complex128)
 
         # initial quadrature correlations
-        iv_corrs = np.zeros(self.dim_corrs, dtype=np.float_)
+        iv_corrs = np.zeros(self.dim_corrs, dtype=np.float64)
         for i in range(2):
             # alternate index 
             _ai = 1 if i == 0 else 0
@@ -440,4 +842,99 @@ class Uni_01(BaseSystem):
         # mechanical modes
         dbeta_dts = [1.0j * gs[i] * np.conjugate(alphas[i]) + (- self.params['gammas'][i] - 1.0j * omega_ms[i]) * betas[i] for i in range(2)]
         
-        return np.array([dalpha_dts[0], dbeta_dts[0], dalpha_dts[1], dbeta_dts[1]], dtype=np.complex_)
\ No newline at end of file
+        return np.array([dalpha_dts[0], dbeta_dts[0], dalpha_dts[1], dbeta_dts[1]], dtype=np.complex128)
+
+    def get_mode_rates_grad(self, modes, c, t, key):
+        """Method to obtain the derivatives of the rates of change of the modes with respect to a parameter.
+
+        Parameters
+        ----------
+        modes : numpy.ndarray
+            Classical modes.
+        c : numpy.ndarray
+            Derived constants and controls.
+        t : float
+            Time at which the values are calculated.
+        key : str
+            Key of the parameter. Available options are ``'delta'``, ``'eta'``.
+        
+        Returns
+        -------
+        mode_rates_grad : numpy.ndarray
+            Derivatives of the rates of change of the modes.
+        """
+
+        assert key in ['delta', 'eta'], 'Parameter ``key`` should be either ``delta`` or ``eta``'
+
+        # extract frequently used variables
+        alphas = modes[::2]
+        betas = modes[1::2]
+
+        # initialize derivatives
+        mode_rates_grad = np.zeros(self.num_modes, dtype=np.complex128)
+
+        # detuning of the right mechanical mode
+        if key == 'delta':
+            mode_rates_grad[2] = 1.0j * self.params['Delta_0_sign'] * alphas[1]
+            mode_rates_grad[3] = - 1.0j * betas[1]
+        # transmission coefficient of the optical channel
+        elif key == 'eta':
+            temp_grad = np.sqrt(self.params['kappas'][0] * self.params['kappas'][1] / self.params['eta']) / 2.0
+            mode_rates_grad[2] = - 2.0 * temp_grad * alphas[0] + (0.5 / np.sqrt(self.params['eta']) - 0.5 / np.sqrt(1.0 - self.params['eta'])) * self.params['A_l']
+
+        return mode_rates_grad
+
+    def get_mode_rates_jac(self, modes, c, t):
+        r"""Method to obtain the Jacobian of the rates of change of the modes.
+
+        The rates and the modes are in the real form :math:`\left[ \mathrm{Re} \alpha_{L}, \mathrm{Im} \alpha_{L}, \mathrm{Re} \beta_{L}, \mathrm{Im} \beta_{L}, ... \right]`.
+
+        Parameters
+        ----------
+        modes : numpy.ndarray
+            Classical modes.
+        c : numpy.ndarray
+            Derived constants and controls.
+        t : float
+            Time at which the values are calculated.
+        
+        Returns
+        -------
+        mode_rates_jac : numpy.ndarray
+            Jacobian of the rates of change of the modes.
+        """
+
+        # extract frequently used variables
+        alphas = modes[::2]
+        betas = modes[1::2]
+        temp = np.sqrt(self.params['eta'] * self.params['kappas'][0] * self.params['kappas'][1])
+
+        # effective values
+        omega_ms = [self.params['omega_mL'], self.params['omega_mL'] + self.params['delta']]
+        Deltas = [self.params['Delta_0_sign'] * omega_ms[i] + 2.0 * self.params['g_0s'][i] * np.real(betas[i]) for i in range(2)]
+        gs = [self.params['g_0s'][i] * alphas[i] for i in range(2)]
+
+        # initialize Jacobian
+        mode_rates_jac = np.zeros(self.dim_corrs, dtype=np.float64)
+
+        # update Jacobian
+        for i in range(2):
+            # optical modes
+            mode_rates_jac[4*i + 0][4*i + 0] = - self.params['kappas'][i]
+            mode_rates_jac[4*i + 0][4*i + 1] = - Deltas[i]
+            mode_rates_jac[4*i + 0][4*i + 2] = - 2.0 * np.imag(gs[i])
+            mode_rates_jac[4*i + 1][4*i + 0] = Deltas[i]
+            mode_rates_jac[4*i + 1][4*i + 1] = - self.params['kappas'][i]
+            mode_rates_jac[4*i + 1][4*i + 2] = 2.0 * np.real(gs[i])
+            # mechanical modes
+            mode_rates_jac[4*i + 2][4*i + 2] = - self.params['gammas'][i]
+            mode_rates_jac[4*i + 2][4*i + 3] = omega_ms[i]
+            mode_rates_jac[4*i + 3][4*i + 0] = 2.0 * np.real(gs[i])
+            mode_rates_jac[4*i + 3][4*i + 1] = 2.0 * np.imag(gs[i])
+            mode_rates_jac[4*i + 3][4*i + 2] = - omega_ms[i]
+            mode_rates_jac[4*i + 3][4*i + 3] = - self.params['gammas'][i]
+        # unidirectional coupling
+        mode_rates_jac[4][0] = - 2.0 * temp
+        mode_rates_jac[5][1] = - 2.0 * temp
+
+        return mode_rates_jac
\ No newline at end of file
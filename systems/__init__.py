@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+ 
+"""Systems of coupled QOM systems.
+
+The classes are imported lazily on first access, so that importing the package does not load :mod:`qom` until a system is used.
+"""
+
+__authors__ = ["Sampreet Kalita"]
+__toolbox__ = 'qom-v1.0.1'
+__created__ = "2026-10-18"
+__updated__ = "2026-10-19"
+
+# dependencies
+import importlib
+
+# modules of the classes
+_modules = {
+    'Bi_00' : 'systems.Bidirectional',
+    'Bi_02' : 'systems.Models',
+    'Uni_00': 'systems.Unidirectional',
+    'Uni_01': 'systems.Unidirectional',
+    'Uni_03': 'systems.Models'
+}
+
+__all__ = list(_modules.keys())
+
+def __getattr__(name):
+    # import the module of the class on first access
+    if name in _modules:
+        return getattr(importlib.import_module(_modules[name]), name)
+    raise AttributeError('module ``systems`` has no attribute ``{}``'.format(name))
+
+def __dir__():
+    return sorted(list(globals().keys()) + __all__)
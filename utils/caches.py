@@ -0,0 +1,370 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Module to cache the trajectories of the coupled QOM systems in shared memory."""
+
+__authors__ = ["Sampreet Kalita"]
+__toolbox__ = 'qom-v1.0.1'
+__created__ = "2026-10-18"
+__updated__ = "2026-10-19"
+
+# dependencies
+from collections import OrderedDict
+from multiprocessing import resource_tracker, shared_memory, util
+import atexit
+import ctypes
+import hashlib
+import json
+import logging
+import numpy as np
+import os
+import time
+
+# local modules
+from utils.solvers import HLESolver
+
+# module logger
+logger = logging.getLogger(__name__)
+
+# size of the header of the segments, in the format [ready, pid, num_times, num_modes, dim, itemsize]
+_header_size = 6 * np.dtype(np.int64).itemsize
+# solver parameters defining the window of a trajectory
+_window_keys = [key for key in HLESolver.solver_defaults if key not in ['output_stride'] + HLESolver.output_ignored_keys] + ['t_index_min', 't_index_max']
+
+def _attach(name):
+    # attach to an existing segment without handing its lifetime to this process
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        shm = shared_memory.SharedMemory(name=name)
+        resource_tracker.unregister(shm._name, 'shared_memory')
+        return shm
+
+def _unlink(shm):
+    # unlink a segment attached without handing its lifetime to this process
+    try:
+        if not hasattr(shm, '_track'):
+            # register again as the name is unregistered on unlink
+            resource_tracker.register(shm._name, 'shared_memory')
+        shm.unlink()
+    except FileNotFoundError:
+        # unlinked by a sibling process
+        if not hasattr(shm, '_track'):
+            resource_tracker.unregister(shm._name, 'shared_memory')
+
+def _is_alive(pid):
+    # check if a process exists without signalling it
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        # owned by another user
+        pass
+    return True
+
+class TrajectoryCache():
+    r"""Class to cache the windows of the classical modes and quantum correlations in shared memory.
+
+    Each trajectory is stored in a named segment of shared memory, whose name is derived from the class of the system, the parameters of the system and the parameters of the solver.
+    Sibling processes hence attach to the same segment by name and read the trajectories without copies.
+    The segments created by a process are evicted in the least-recently-used order once their total size exceeds ``max_bytes``.
+    Only the process which created the cache unlinks its segments, so that a copy inherited by a forked process never releases the segments of its parent.
+    Each segment records the process writing it, and a segment whose writer exited before marking it as ready is unlinked and treated as a miss.
+
+    Parameters
+    ----------
+    max_bytes : int, optional
+        Maximum total size of the segments created by the process. Default is :math:`2^{28}`.
+    timeout : float, optional
+        Maximum time in seconds to wait for a segment being written by another process. Default is :math:`600.0`.
+    """
+
+    def __init__(self, max_bytes=2**28, timeout=600.0):
+        """Class constructor for TrajectoryCache."""
+
+        # set attributes
+        self.max_bytes = max_bytes
+        self.timeout = timeout
+        # process owning the segments
+        self.pid = os.getpid()
+        # segments created by the process, in the order of use
+        self.owned = OrderedDict()
+        # segments attached by the process
+        self.attached = dict()
+        # evicted segments with views still in use
+        self.closing = list()
+
+    def get_key(self, SystemClass, system_params, solver_params):
+        """Method to obtain the key of a trajectory.
+
+        Parameters
+        ----------
+        SystemClass : :class:`qom.systems.BaseSystem`
+            Class of the system.
+        system_params : dict
+            Parameters of the system, updated over the defaults of the class.
+        solver_params : dict
+            Parameters of the solver. Only the parameters of the integration and the window are used, so that different measures share the same key.
+
+        Returns
+        -------
+        key : str
+            Name of the segment.
+        """
+
+        # complete parameters of the system
+        params = dict(getattr(SystemClass, 'system_defaults', {}), **system_params)
+        # parameters of the integration
+        solver_params = {key: solver_params[key] for key in _window_keys if key in solver_params}
+        # canonical representation
+        text = json.dumps([SystemClass.__module__ + '.' + SystemClass.__name__, params, solver_params], sort_keys=True, default=str)
+
+        return 'sbu_' + hashlib.sha1(text.encode()).hexdigest()[:24]
+
+    def _get_views(self, shm):
+        # read-only views of the modes and the correlations
+        # the views own an export of the buffer, which keeps the segment mapped while they are in use
+        buf = (ctypes.c_char * shm.size).from_buffer(shm.buf)
+        num_times, num_modes, dim, itemsize = [int(item) for item in np.frombuffer(buf, dtype=np.int64, count=6)[2:]]
+        dtype = np.dtype('float{}'.format(8 * itemsize))
+        offset = _header_size
+        Modes = np.ndarray((num_times, num_modes), dtype=np.result_type(dtype, np.complex64), buffer=buf, offset=offset)
+        offset += Modes.nbytes
+        Corrs = np.ndarray((num_times, dim, dim), dtype=dtype, buffer=buf, offset=offset)
+        Modes.flags.writeable = False
+        Corrs.flags.writeable = False
+        return Modes, Corrs
+
+    def get(self, key):
+        """Method to obtain a cached trajectory.
+
+        Parameters
+        ----------
+        key : str
+            Key of the trajectory.
+
+        Returns
+        -------
+        Modes : numpy.ndarray
+            Classical modes, or ``None`` if not cached.
+        Corrs : numpy.ndarray
+            Quantum correlations, or ``None`` if not cached.
+        """
+
+        # segments of the process
+        if key in self.owned:
+            self.owned.move_to_end(key)
+            return self._get_views(self.owned[key])
+        if key in self.attached:
+            return self._get_views(self.attached[key])
+
+        # segments of sibling processes
+        try:
+            shm = _attach(key)
+        except FileNotFoundError:
+            return None, None
+
+        # wait until written
+        header = np.ndarray((6, ), dtype=np.int64, buffer=shm.buf)
+        time_start = time.time()
+        while header[0] == 0:
+            # writer exited before marking as ready
+            if header[1] != 0 and not _is_alive(int(header[1])):
+                logger.warning('Unlinking stale segment {} of process {}\n'.format(key, int(header[1])))
+                del header
+                _unlink(shm)
+                shm.close()
+                return None, None
+            if time.time() - time_start > self.timeout:
+                del header
+                shm.close()
+                return None, None
+            time.sleep(0.01)
+        del header
+
+        self.attached[key] = shm
+        return self._get_views(shm)
+
+    def put(self, key, Modes, Corrs):
+        """Method to cache a trajectory.
+
+        Parameters
+        ----------
+        key : str
+            Key of the trajectory.
+        Modes : numpy.ndarray
+            Classical modes.
+        Corrs : numpy.ndarray
+            Quantum correlations, whose single or double precision is retained.
+
+        Returns
+        -------
+        Modes : numpy.ndarray
+            Cached classical modes.
+        Corrs : numpy.ndarray
+            Cached quantum correlations.
+        """
+
+        # extract frequently used variables
+        Corrs = np.asarray(Corrs)
+        Corrs = Corrs if Corrs.dtype in [np.float32, np.float64] else Corrs.astype(np.float64)
+        Modes = np.asarray(Modes, dtype=np.result_type(Corrs.dtype, np.complex64))
+        size = _header_size + Modes.nbytes + Corrs.nbytes
+
+        # create segment
+        try:
+            shm = shared_memory.SharedMemory(name=key, create=True, size=size)
+        except FileExistsError:
+            # written by a sibling process
+            _Modes, _Corrs = self.get(key)
+            if _Modes is not None:
+                return _Modes, _Corrs
+            return Modes, Corrs
+
+        # write trajectory before marking as ready
+        header = np.ndarray((6, ), dtype=np.int64, buffer=shm.buf)
+        header[1] = os.getpid()
+        header[2:] = [Modes.shape[0], Modes.shape[1], Corrs.shape[1], Corrs.dtype.itemsize]
+        offset = _header_size
+        np.ndarray(Modes.shape, dtype=Modes.dtype, buffer=shm.buf, offset=offset)[:] = Modes
+        offset += Modes.nbytes
+        np.ndarray(Corrs.shape, dtype=Corrs.dtype, buffer=shm.buf, offset=offset)[:] = Corrs
+        header[0] = 1
+        del header
+
+        # update index and evict
+        self.owned[key] = shm
+        self.evict()
+
+        return self._get_views(shm)
+
+    def get_size(self):
+        """Method to obtain the total size of the segments created by the process.
+
+        Returns
+        -------
+        size : int
+            Total size in bytes.
+        """
+
+        return sum(shm.size for shm in self.owned.values())
+
+    def _release(self, shm):
+        # unlink a segment only in the process which created it
+        if os.getpid() == self.pid:
+            try:
+                shm.unlink()
+            except FileNotFoundError:
+                # unlinked by a sibling process
+                resource_tracker.unregister(shm._name, 'shared_memory')
+        self._close(shm)
+
+    def _close(self, shm):
+        # close the mapping once no views remain
+        try:
+            shm.close()
+        except BufferError:
+            self.closing.append(shm)
+
+    def evict(self):
+        """Method to evict the least-recently-used segments until the total size is within the bound.
+
+        The most recent segment is always retained.
+        """
+
+        while len(self.owned) > 1 and self.get_size() > self.max_bytes:
+            key, shm = self.owned.popitem(last=False)
+            logger.debug('Evicting {}\n'.format(key))
+            self._release(shm)
+
+        # retry pending closures
+        closing, self.closing = self.closing, list()
+        for shm in closing:
+            self._close(shm)
+
+    def clear(self):
+        """Method to release all segments of the process."""
+
+        for shm in self.attached.values():
+            self._close(shm)
+        for shm in self.owned.values():
+            self._release(shm)
+        self.attached, self.owned = dict(), OrderedDict()
+
+# cache of the process
+_cache = None
+
+def get_cache(max_bytes=None):
+    """Function to obtain the trajectory cache of the current process.
+
+    A process forked after its parent obtained the cache inherits the cache of the parent, and hence creates its own cache with its own finalizer.
+
+    Parameters
+    ----------
+    max_bytes : int, optional
+        Maximum total size of the segments created by the process, updating the bound of an existing cache.
+
+    Returns
+    -------
+    cache : :class:`TrajectoryCache`
+        Cache of the process.
+    """
+
+    global _cache
+    if _cache is None or _cache.pid != os.getpid():
+        _cache = TrajectoryCache()
+        # release segments at exit, including the worker processes which skip the handlers of atexit
+        atexit.register(_cache.clear)
+        util.Finalize(_cache, _cache.clear, exitpriority=10)
+    if max_bytes is not None:
+        _cache.max_bytes = max_bytes
+        _cache.evict()
+
+    return _cache
+
+def get_modes_corrs(SystemClass, system_params, params, cache=None, cb_update=None):
+    """Function to obtain the window of the classical modes and quantum correlations of a system from the cache, integrating only on a miss.
+
+    The window is between the time indices ``t_index_min`` and ``t_index_max`` of the solver parameters, and the times outside it are not stored.
+
+    Parameters
+    ----------
+    SystemClass : :class:`qom.systems.BaseSystem`
+        Class of the system.
+    system_params : dict
+        Parameters of the system.
+    params : dict
+        Parameters of the solver.
+    cache : :class:`TrajectoryCache`, optional
+        Cache of the trajectories. Default is the cache of the process.
+    cb_update : callable, optional
+        Callback function to update status and progress.
+
+    Returns
+    -------
+    Modes : numpy.ndarray
+        Read-only classical modes in the window.
+    Corrs : numpy.ndarray
+        Read-only quantum correlations in the window.
+    """
+
+    # extract frequently used variables
+    cache = cache if cache is not None else get_cache()
+    key = cache.get_key(SystemClass, system_params, params)
+
+    # cached trajectory
+    Modes, Corrs = cache.get(key)
+    if Modes is not None:
+        return Modes, Corrs
+
+    # integrate
+    Modes, Corrs = HLESolver(
+        system=SystemClass(
+            params=system_params,
+            cb_update=cb_update
+        ),
+        params=dict(params, output_stride=None)
+    ).get_modes_corrs()
+
+    return cache.put(key, Modes, Corrs)
@@ -0,0 +1,502 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Module to continue the periodic orbits of the classical modes of the coupled QOM systems in a parameter."""
+
+__authors__ = ["Sampreet Kalita"]
+__toolbox__ = 'qom-v1.0.1'
+__created__ = "2026-10-18"
+__updated__ = "2026-10-19"
+
+# dependencies
+import copy
+import logging
+import numpy as np
+import os
+import scipy.integrate as si
+
+# module logger
+logger = logging.getLogger(__name__)
+
+# labels of the bifurcations
+bifurcation_labels = ['fold', 'period_doubling', 'torus', 'branch_point']
+
+class OrbitContinuation():
+    r"""Class to continue a periodic orbit of the classical modes in a parameter of a system by pseudo-arclength continuation.
+
+    The orbits are obtained by single shooting with the unknowns :math:`z = \left( x, T, p \right)`, where :math:`x` is a point of the orbit in the real form, :math:`T` the period and :math:`p` the parameter.
+    Each point of the branch solves :math:`\phi_{T} (x; p) - x = 0` with the phase condition :math:`f (x_{0}; p_{0}) \cdot (x - x_{0}) = 0` on the previous point :math:`z_{0}` and the pseudo-arclength condition :math:`\tau \cdot (z - z_{0}) = \Delta s` on the previous tangent :math:`\tau`, which are solved by Newton iterations from the predictor :math:`z_{0} + \Delta s \tau`.
+    The components of :math:`z` are scaled by the extent of the initial orbit, the initial period and the span of the parameter.
+
+    The monodromy matrix :math:`M` is integrated along with the orbit from the variational equation :math:`\dot{\Phi} = A \Phi`, where :math:`A` is the Jacobian of the rates of the modes in the real form obtained from ``get_mode_rates_jac`` of the system, and the derivative of the orbit with respect to the parameter from :math:`\dot{s} = A s + \partial_{p} f`.
+    The eigenvalues of :math:`M` are the Floquet multipliers, of which the one closest to unity is along the orbit.
+    Between consecutive points, a sign change of :math:`\mathrm{d} p / \mathrm{d} s` marks a fold, and a change of the number of unstable multipliers is labelled by the critical multiplier closest to the unit circle, as a torus (Neimark-Sacker) bifurcation for a complex pair, a period-doubling bifurcation for a negative real multiplier and a branch point otherwise.
+
+    Parameters
+    ----------
+    SystemClass : :class:`qom.systems.BaseSystem`
+        Class of the system.
+    system_params : dict
+        Parameters of the system.
+    key : str
+        Key of the continued parameter.
+    bounds : tuple
+        Initial and final values of the parameter, formatted as ``(p_start, p_end)``.
+    params : dict, optional
+        Parameters of the continuation. The continuation parameters are:
+        ================    ====================================================
+        key                 meaning
+        ================    ====================================================
+        ds                  (*float*) initial step of the scaled arclength. Default is :math:`0.01`.
+        ds_min              (*float*) minimum step below which the continuation stops. Default is :math:`10^{-5}`.
+        ds_max              (*float*) maximum step. Default is :math:`0.05`.
+        max_points          (*int*) maximum number of points of the branch. Default is :math:`500`.
+        max_period_ratio    (*float*) maximum ratio of the period to the initial period, above which the orbit is assumed to approach a homoclinic orbit. Default is :math:`10.0`.
+        newton_tol          (*float*) tolerance of the scaled Newton steps. Default is :math:`10^{-8}`.
+        newton_max_iter     (*int*) maximum number of Newton iterations. Default is :math:`8`.
+        ode_atol            (*float*) absolute tolerance of the integrator. Default is :math:`10^{-10}`.
+        ode_rtol            (*float*) relative tolerance of the integrator. Default is :math:`10^{-10}`.
+        mu_tol              (*float*) tolerance of the moduli of the multipliers to count them as unstable. Default is :math:`10^{-4}`.
+        fd_step             (*float*) relative step of the finite differences of the rates with respect to the parameter. Default is :math:`10^{-6}`.
+        t_dim               (*int*) number of times at which each orbit is sampled. Default is :math:`64`.
+        ================    ====================================================
+    """
+
+    # default parameters of the continuation
+    continuation_defaults = {
+        'ds'                : 0.01,
+        'ds_min'            : 1e-5,
+        'ds_max'            : 0.05,
+        'max_points'        : 500,
+        'max_period_ratio'  : 10.0,
+        'newton_tol'        : 1e-8,
+        'newton_max_iter'   : 8,
+        'ode_atol'          : 1e-10,
+        'ode_rtol'          : 1e-10,
+        'mu_tol'            : 1e-4,
+        'fd_step'           : 1e-6,
+        't_dim'             : 64
+    }
+
+    def __init__(self, SystemClass, system_params, key, bounds, params={}):
+        """Class constructor for OrbitContinuation."""
+
+        # set attributes
+        self.SystemClass = SystemClass
+        self.system_params = copy.deepcopy(system_params)
+        self.key = key
+        self.bounds = (float(bounds[0]), float(bounds[1]))
+        self.params = copy.deepcopy(self.continuation_defaults)
+        self.params.update({key: value for key, value in params.items() if key in self.continuation_defaults})
+
+        # extract frequently used variables
+        system = self.get_system(self.bounds[0])
+        self.num_modes = system.num_modes
+        self.dim = 2 * system.num_modes
+        self.c = system.get_ivc()[2]
+        self.scale = None
+
+    def get_system(self, p):
+        """Method to obtain the system at a value of the parameter.
+
+        Parameters
+        ----------
+        p : float
+            Value of the parameter.
+
+        Returns
+        -------
+        system : :class:`qom.systems.BaseSystem`
+            Instance of the system.
+        """
+
+        return self.SystemClass(
+            params=dict(self.system_params, **{self.key: float(p)})
+        )
+
+    def _get_mode_rates(self, system, x, t):
+        # rates of the real-form modes
+        return np.asarray(system.get_mode_rates(np.ascontiguousarray(x).view(np.complex128), self.c, t), dtype=np.complex128).view(np.float64)
+
+    def _get_rates(self, t, y, systems):
+        # extract orbit, monodromy and derivative with respect to the parameter
+        dim = self.dim
+        x = y[:dim]
+        Phi = y[dim:dim + dim**2].reshape((dim, dim))
+        s = y[dim + dim**2:]
+
+        # rates and their Jacobian
+        system, system_plus, system_minus = systems
+        A = system.get_mode_rates_jac(x.view(np.complex128), self.c, t)
+        f_p = (self._get_mode_rates(system_plus, x, t) - self._get_mode_rates(system_minus, x, t)) / (2.0 * self.h)
+
+        return np.concatenate((self._get_mode_rates(system, x, t), A.dot(Phi).ravel(), A.dot(s) + f_p))
+
+    def get_orbit(self, x, T, p, samples=False):
+        """Method to integrate an orbit over a period along with its monodromy matrix.
+
+        Parameters
+        ----------
+        x : numpy.ndarray
+            Initial point of the orbit in the real form.
+        T : float
+            Period of the orbit.
+        p : float
+            Value of the parameter.
+        samples : bool, optional
+            Option to return the orbit at ``t_dim`` times over the period. Default is ``False``.
+
+        Returns
+        -------
+        x_T : numpy.ndarray
+            Final point of the orbit.
+        M : numpy.ndarray
+            Monodromy matrix.
+        s_T : numpy.ndarray
+            Derivative of the final point with respect to the parameter.
+        X : numpy.ndarray
+            Points of the orbit at the sampled times, returned only if ``samples`` is ``True``.
+        """
+
+        # systems for the finite differences
+        dim = self.dim
+        self.h = self.params['fd_step'] * max(abs(p), abs(self.bounds[1] - self.bounds[0]))
+        systems = (self.get_system(p), self.get_system(p + self.h), self.get_system(p - self.h))
+
+        # integrate over a period
+        y_0 = np.concatenate((x, np.eye(dim).ravel(), np.zeros(dim)))
+        t_eval = np.linspace(0.0, T, self.params['t_dim']) if samples else None
+        sol = si.solve_ivp(self._get_rates, (0.0, T), y_0, method='DOP853', t_eval=t_eval, args=(systems, ), atol=self.params['ode_atol'], rtol=self.params['ode_rtol'])
+        assert sol.success, 'Integration failed with message ``{}``'.format(sol.message)
+        y_T = sol.y[:, -1]
+        x_T, M, s_T = y_T[:dim], y_T[dim:dim + dim**2].reshape((dim, dim)), y_T[dim + dim**2:]
+
+        if samples:
+            return x_T, M, s_T, sol.y[:dim].transpose()
+
+        return x_T, M, s_T
+
+    def _get_jacobian(self, z, z_ref):
+        # residual and Jacobian of the orbit with the phase condition on the reference
+        dim = self.dim
+        x, T, p = z[:dim], z[dim], z[dim + 1]
+        x_T, M, s_T = self.get_orbit(x, T, p)
+        f_T = self._get_mode_rates(self.get_system(p), x_T, 0.0)
+        f_ref = self._get_mode_rates(self.get_system(z_ref[dim + 1]), z_ref[:dim], 0.0)
+
+        G = np.concatenate((x_T - x, [f_ref.dot(x - z_ref[:dim])]))
+        J = np.zeros((dim + 1, dim + 2), dtype=np.float64)
+        J[:dim, :dim] = M - np.eye(dim)
+        J[:dim, dim] = f_T
+        J[:dim, dim + 1] = s_T
+        J[dim, :dim] = f_ref
+
+        return G, J, M
+
+    def correct(self, z, z_ref, tau=None, ds=0.0):
+        """Method to correct a predicted point of the branch by Newton iterations.
+
+        Parameters
+        ----------
+        z : numpy.ndarray
+            Predicted point, formatted as :math:`\\left( x, T, p \\right)`.
+        z_ref : numpy.ndarray
+            Previous point of the branch.
+        tau : numpy.ndarray, optional
+            Scaled tangent at the previous point. Default is ``None`` to keep the parameter fixed.
+        ds : float, optional
+            Step of the scaled arclength. Default is :math:`0.0`.
+
+        Returns
+        -------
+        z : numpy.ndarray
+            Corrected point, or ``None`` if the iterations do not converge.
+        J : numpy.ndarray
+            Jacobian of the orbit and the phase condition at the corrected point, scaled by the components.
+        M : numpy.ndarray
+            Monodromy matrix at the corrected point.
+        num_iter : int
+            Number of iterations.
+        """
+
+        # extract frequently used variables
+        dim = self.dim
+        z = z.copy()
+
+        for num_iter in range(1, self.params['newton_max_iter'] + 1):
+            G, J, M = self._get_jacobian(z, z_ref)
+
+            # pseudo-arclength or fixed parameter
+            if tau is not None:
+                row = tau / self.scale
+                g = tau.dot((z - z_ref) / self.scale) - ds
+            else:
+                row = np.zeros(dim + 2)
+                row[dim + 1] = 1.0
+                g = z[dim + 1] - z_ref[dim + 1]
+
+            # Newton step
+            dz = np.linalg.solve(np.vstack((J, row)), - np.append(G, g))
+            z += dz
+            if not np.all(np.isfinite(z)) or z[dim] <= 0.0:
+                return None, None, None, num_iter
+            if np.max(np.abs(dz / self.scale)) < self.params['newton_tol']:
+                G, J, M = self._get_jacobian(z, z_ref)
+                return z, J * self.scale, M, num_iter
+
+        return None, None, None, num_iter
+
+    def get_multipliers(self, M):
+        """Method to obtain the Floquet multipliers of an orbit.
+
+        Parameters
+        ----------
+        M : numpy.ndarray
+            Monodromy matrix.
+
+        Returns
+        -------
+        mus : numpy.ndarray
+            Multipliers sorted by decreasing moduli, with the multiplier along the orbit removed.
+        num_unstable : int
+            Number of multipliers outside the unit circle.
+        """
+
+        mus = np.linalg.eigvals(M)
+        mus = np.delete(mus, np.argmin(np.abs(mus - 1.0)))
+        mus = mus[np.argsort(- np.abs(mus))]
+
+        return mus, int(np.sum(np.abs(mus) > 1.0 + self.params['mu_tol']))
+
+    def get_bifurcation(self, tau_p_prev, tau_p, num_unstable_prev, num_unstable, mus):
+        """Method to detect a bifurcation between two consecutive points of the branch.
+
+        Parameters
+        ----------
+        tau_p_prev : float
+            Component of the parameter of the tangent at the previous point.
+        tau_p : float
+            Component of the parameter of the tangent at the current point.
+        num_unstable_prev : int
+            Number of unstable multipliers at the previous point.
+        num_unstable : int
+            Number of unstable multipliers at the current point.
+        mus : numpy.ndarray
+            Multipliers at the current point (see :meth:`get_multipliers`).
+
+        Returns
+        -------
+        label : str
+            Label of the bifurcation in :obj:`bifurcation_labels`, or ``None`` if no bifurcation is detected.
+        """
+
+        # turning point of the parameter
+        if np.sign(tau_p) != np.sign(tau_p_prev):
+            return 'fold'
+
+        # critical multiplier closest to the unit circle
+        if num_unstable != num_unstable_prev:
+            mu = mus[np.argmin(np.abs(np.abs(mus) - 1.0))]
+            if abs(mu.imag) > self.params['mu_tol']:
+                return 'torus'
+            if mu.real < 0.0:
+                return 'period_doubling'
+            return 'branch_point'
+
+        return None
+
+    def run(self, modes, period, cb_update=None):
+        """Method to continue a periodic orbit from the initial value of the parameter.
+
+        Parameters
+        ----------
+        modes : numpy.ndarray
+            Classical modes at a point of the periodic orbit at the initial value of the parameter.
+        period : float
+            Approximate period of the orbit.
+        cb_update : callable, optional
+            Callback function to update progress, formatted as ``cb_update(num_points, p)``.
+
+        Returns
+        -------
+        branch : dict
+            Branch with the keys ``'xs'`` (values of the parameter), ``'periods'``, ``'modes'`` (points of the orbits), ``'multipliers'`` (see :meth:`get_multipliers`), ``'stable'``, ``'orbits'`` (orbits at ``t_dim`` times over their periods), ``'bifurcation_indices'`` (indices of the points following the bifurcations) and ``'bifurcation_labels'``.
+        """
+
+        # extract frequently used variables
+        dim = self.dim
+        p_start, p_end = self.bounds
+        p_min, p_max = min(p_start, p_end), max(p_start, p_end)
+        direction = np.sign(p_end - p_start) if p_end != p_start else 1.0
+        x_0 = np.asarray(modes, dtype=np.complex128).view(np.float64).copy()
+        self.scale = np.concatenate((np.full(dim, max(np.max(np.abs(x_0)), 1e-12)), [period, max(p_max - p_min, 1e-12)]))
+
+        # correct the initial orbit at fixed parameter
+        z_0 = np.concatenate((x_0, [period, p_start]))
+        z, J, M, _ = self.correct(z_0, z_0)
+        assert z is not None, 'Initial orbit of ``{}`` did not converge at ``{} = {}``'.format(self.SystemClass.__name__, self.key, p_start)
+
+        # initial tangent from the null space
+        tau = np.linalg.svd(J)[2][-1]
+        tau *= direction * np.sign(tau[dim + 1]) if tau[dim + 1] != 0.0 else 1.0
+
+        # branch
+        points, taus, Ms = [z], [tau], [M]
+        ds = self.params['ds']
+        while len(points) < self.params['max_points']:
+            # predict and correct
+            z_pred = points[-1] + ds * tau * self.scale
+            z, J, M, num_iter = self.correct(z_pred, points[-1], tau, ds)
+
+            # adapt step
+            if z is None:
+                ds /= 2.0
+                if ds < self.params['ds_min']:
+                    logger.warning('Stopped the continuation at ``{} = {}`` below the minimum step\n'.format(self.key, points[-1][dim + 1]))
+                    break
+                continue
+            if num_iter <= 3:
+                ds = min(1.5 * ds, self.params['ds_max'])
+
+            # tangent oriented along the previous tangent
+            tau = np.linalg.solve(np.vstack((J, tau)), np.append(np.zeros(dim + 1), 1.0))
+            tau /= np.linalg.norm(tau)
+            points.append(z)
+            taus.append(tau)
+            Ms.append(M)
+            if cb_update is not None:
+                cb_update(len(points), z[dim + 1])
+
+            # stop conditions
+            if z[dim + 1] < p_min or z[dim + 1] > p_max:
+                break
+            if z[dim] > self.params['max_period_ratio'] * period:
+                logger.warning('Stopped the continuation at ``{} = {}`` with period {:.2f}, possibly near a homoclinic orbit\n'.format(self.key, z[dim + 1], z[dim]))
+                break
+
+        # multipliers and bifurcations
+        mus, num_unstables = zip(*[self.get_multipliers(M) for M in Ms])
+        idxs, labels = list(), list()
+        for i in range(1, len(points)):
+            label = self.get_bifurcation(taus[i - 1][dim + 1], taus[i][dim + 1], num_unstables[i - 1], num_unstables[i], mus[i])
+            if label is not None:
+                idxs.append(i)
+                labels.append(label)
+                logger.info('Detected {} between ``{} = {:.6f}`` and ``{:.6f}``\n'.format(label, self.key, points[i - 1][dim + 1], points[i][dim + 1]))
+
+        # orbits
+        Z = np.array(points)
+        orbits = np.array([self.get_orbit(z[:dim], z[dim], z[dim + 1], samples=True)[3] for z in Z])
+
+        return {
+            'xs'                    : Z[:, dim + 1],
+            'periods'               : Z[:, dim],
+            'modes'                 : Z[:, :dim].copy().view(np.complex128),
+            'multipliers'           : np.array(mus),
+            'stable'                : np.array(num_unstables) == 0,
+            'orbits'                : orbits.copy().view(np.complex128),
+            'bifurcation_indices'   : np.array(idxs, dtype=np.int64),
+            'bifurcation_labels'    : np.array(labels, dtype=str)
+        }
+
+def get_file_path(params_looper):
+    """Function to obtain the path of the data file of a branch continued along the axis ``X`` of a looper.
+
+    Parameters
+    ----------
+    params_looper : dict
+        Parameters of the looper.
+
+    Returns
+    -------
+    file_path : str
+        Path of the ``.npz`` file.
+    """
+
+    return params_looper['file_path_prefix'] + '_branch_x={}_{}_{}.npz'.format(params_looper['X']['var'], params_looper['X']['min'], params_looper['X']['max'])
+
+def run_continuation(config, params={}, cb_update=None):
+    """Function to continue the periodic orbit of a system along the axis ``X`` of the configuration of a sweep.
+
+    The orbit at the minimum of the axis is obtained by relaxing the classical modes with :meth:`utils.floquet.FloquetSolver.get_limit_cycle` and continued up to the maximum of the axis with :class:`OrbitContinuation`.
+    Along with the branch, the amplitudes :math:`\\left( \\max \\mathrm{Re} \\beta - \\min \\mathrm{Re} \\beta \\right) / 2` of the modes of ``'indices'`` are saved as ``'amplitudes'``, and the quantum phase synchronization averaged over one period of the periodic correlations of the stable orbits (see :class:`utils.floquet.FloquetSolver`) as ``'sync_p'``, with ``nan`` for the unstable orbits.
+    For the plotters, ``'vs'`` contains the amplitudes of the first mode of ``'indices'`` on the stable and the unstable orbits, with ``nan`` elsewhere, such that the branch can be drawn with the type ``'lines'``.
+
+    Parameters
+    ----------
+    config : dict
+        Configuration of the sweep (see :func:`utils.loopers.get_config`).
+    params : dict, optional
+        Parameters of the continuation superseding those of the ``'continuation'`` key of the configuration (see :class:`OrbitContinuation`).
+    cb_update : callable, optional
+        Callback function to update progress, formatted as ``cb_update(num_points, p)``.
+
+    Returns
+    -------
+    file_path : str
+        Path of the data file.
+    branch : dict
+        Branch of the periodic orbits.
+    """
+
+    # local modules
+    import systems
+    from utils.floquet import FloquetSolver
+    from utils.measures import get_sync_p
+
+    # extract frequently used variables
+    params_looper = config['looper']
+    key = params_looper['X']['var']
+    bounds = (params_looper['X']['min'], params_looper['X']['max'])
+    indices = config['solver'].get('indices', [1, 3])
+    SystemClass = getattr(systems, config['system_name'])
+    system_params = dict(config['system'], **{key: float(bounds[0])})
+
+    # initial orbit
+    modes, period = FloquetSolver(
+        system=SystemClass(
+            params=system_params
+        ),
+        params=config['solver']
+    ).get_limit_cycle()
+    assert modes is not None, 'No periodic orbit of ``{}`` found at ``{} = {}``'.format(config['system_name'], key, bounds[0])
+
+    # continue
+    branch = OrbitContinuation(
+        SystemClass=SystemClass,
+        system_params=system_params,
+        key=key,
+        bounds=bounds,
+        params=dict(config.get('continuation', {}), **params)
+    ).run(
+        modes=modes,
+        period=period,
+        cb_update=cb_update
+    )
+
+    # measures
+    amplitudes = (np.max(branch['orbits'][:, :, indices].real, axis=1) - np.min(branch['orbits'][:, :, indices].real, axis=1)) / 2.0
+    sync_p = np.full(len(branch['xs']), np.nan)
+    for i in np.flatnonzero(branch['stable']):
+        Modes, Corrs = FloquetSolver(
+            system=SystemClass(
+                params=dict(system_params, **{key: float(branch['xs'][i])})
+            ),
+            params=config['solver']
+        ).get_modes_corrs(
+            modes=branch['modes'][i],
+            period=branch['periods'][i]
+        )
+        if Modes is not None:
+            sync_p[i] = np.mean(get_sync_p(Modes, Corrs, indices))
+    branch['amplitudes'] = amplitudes
+    branch['sync_p'] = sync_p
+    branch['vs'] = np.array([np.where(branch['stable'], amplitudes[:, 0], np.nan), np.where(branch['stable'], np.nan, amplitudes[:, 0])])
+
+    # save
+    file_path = get_file_path(params_looper)
+    os.makedirs(os.path.dirname(file_path) or '.', exist_ok=True)
+    np.savez_compressed(file_path, **branch)
+    logger.info('Saved {}\n'.format(file_path))
+
+    return file_path, branch
@@ -0,0 +1,391 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Module to run Monte Carlo ensembles of the coupled QOM systems over the disorder of their parameters."""
+
+__authors__ = ["Sampreet Kalita"]
+__toolbox__ = 'qom-v1.0.1'
+__created__ = "2026-10-18"
+__updated__ = "2026-10-19"
+
+# dependencies
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+import copy
+import json
+import logging
+import numpy as np
+import os
+import scipy.stats as ss
+
+# local modules
+from utils.loopers import get_config_hash, get_value, load_file, save_partial, sweep_defaults
+
+# module logger
+logger = logging.getLogger(__name__)
+
+# default parameters of the ensembles
+ensemble_defaults = {
+    'file_path'     : 'data/v3.0_qom-v1.0.1/ensemble.npz',
+    'disorder'      : {},
+    'design'        : 'sobol',
+    'seed'          : 0,
+    'num_samples'   : 1024,
+    'min_samples'   : 128,
+    'chunk_size'    : 64,
+    'quantiles'     : [0.05, 0.5, 0.95],
+    'confidence'    : 0.95,
+    'rtol'          : 1e-2,
+    'atol'          : 1e-6
+}
+# designs of the samples
+designs = ['random', 'lhs', 'sobol']
+# distributions of the disorder
+distributions = ['normal', 'lognormal', 'uniform']
+
+def get_ensemble_config(file_path):
+    """Function to load the configuration of an ensemble from a JSON or YAML file.
+
+    The configuration follows that of the sweeps (see :func:`utils.loopers.get_config`), with the key ``'ensemble'`` in place of ``'looper'``, whose parameters are:
+
+    ============    ====================================================
+    key             meaning
+    ============    ====================================================
+    file_path       (*str*) path of the ``.npz`` file of the ensemble. Default is ``'data/v3.0_qom-v1.0.1/ensemble.npz'``.
+    disorder        (*dict*) disorder of the parameters of the system, formatted as ``{key: {'dist': dist, 'spread': spread}}``. The disordered values are :math:`x (1 + s z)` for ``'normal'`` with standard normal :math:`z`, :math:`x e^{s z}` for ``'lognormal'`` and :math:`x (1 + s (2 u - 1))` for ``'uniform'`` with standard uniform :math:`u`, where :math:`x` is the nominal value and :math:`s` the relative spread. Each element of a list is disordered independently. Default is ``{}``.
+    design          (*str*) design of the samples. Available options are ``'random'`` (seeded pseudorandom numbers), ``'lhs'`` (Latin hypercube) and ``'sobol'`` (scrambled Sobol sequence). Default is ``'sobol'``.
+    seed            (*int*) seed of the random numbers. Default is :math:`0`.
+    num_samples     (*int*) maximum number of samples. Default is :math:`1024`.
+    min_samples     (*int*) minimum number of samples before the convergence is checked. Default is :math:`128`.
+    chunk_size      (*int*) number of samples in each chunk. Default is :math:`64`.
+    quantiles       (*list*) quantiles of the measures. Default is :math:`\\left[ 0.05, 0.5, 0.95 \\right]`.
+    confidence      (*float*) confidence level of the intervals. Default is :math:`0.95`.
+    rtol            (*float*) relative half-width of the confidence intervals below which the ensemble is converged. Default is :math:`10^{-2}`.
+    atol            (*float*) absolute half-width of the confidence intervals below which the ensemble is converged. Default is :math:`10^{-6}`.
+    ============    ====================================================
+
+    Parameters
+    ----------
+    file_path : str
+        Path of the configuration file.
+
+    Returns
+    -------
+    config : dict
+        Configuration of the ensemble updated over the defaults.
+    """
+
+    # update defaults
+    config = copy.deepcopy({key: value for key, value in sweep_defaults.items() if key != 'looper'})
+    config['ensemble'] = copy.deepcopy(ensemble_defaults)
+    for key, value in load_file(file_path).items():
+        if type(value) is dict and key in config:
+            config[key].update(value)
+        else:
+            config[key] = value
+
+    # validate parameters
+    assert config['ensemble']['design'] in designs, 'Parameter ``design`` should be one of ``{}``'.format(designs)
+    for key, value in config['ensemble']['disorder'].items():
+        assert value['dist'] in distributions, 'Distribution of ``{}`` should be one of ``{}``'.format(key, distributions)
+
+    return config
+
+def get_dimensions(system_params, disorder):
+    """Function to obtain the disordered dimensions of the parameters.
+
+    Parameters
+    ----------
+    system_params : dict
+        Parameters of the system, including the defaults.
+    disorder : dict
+        Disorder of the parameters (see :func:`get_ensemble_config`).
+
+    Returns
+    -------
+    dims : list
+        Disordered dimensions, formatted as ``[(key, index), ...]``, with ``None`` as the index of scalar parameters.
+    """
+
+    dims = list()
+    for key in disorder:
+        assert key in system_params, 'Parameter ``{}`` is not a parameter of the system'.format(key)
+        if type(system_params[key]) is list:
+            dims += [(key, i) for i in range(len(system_params[key]))]
+        else:
+            dims.append((key, None))
+
+    return dims
+
+def get_samples(system_params, disorder, num_samples, design='sobol', seed=0):
+    """Function to obtain the disordered values of the parameters.
+
+    Parameters
+    ----------
+    system_params : dict
+        Parameters of the system, including the defaults.
+    disorder : dict
+        Disorder of the parameters (see :func:`get_ensemble_config`).
+    num_samples : int
+        Number of samples.
+    design : str, optional
+        Design of the samples. Default is ``'sobol'``.
+    seed : int, optional
+        Seed of the random numbers. Default is :math:`0`.
+
+    Returns
+    -------
+    samples : numpy.ndarray
+        Disordered values with a trailing axis for the dimensions (see :func:`get_dimensions`).
+    """
+
+    # extract frequently used variables
+    dims = get_dimensions(system_params, disorder)
+
+    # standard uniform values
+    if design == 'sobol':
+        U = ss.qmc.Sobol(d=len(dims), scramble=True, seed=seed).random(int(2**np.ceil(np.log2(max(num_samples, 1)))))[:num_samples]
+    elif design == 'lhs':
+        U = ss.qmc.LatinHypercube(d=len(dims), seed=seed).random(num_samples)
+    else:
+        U = np.random.default_rng(seed).random((num_samples, len(dims)))
+    U = np.clip(U, 1e-12, 1.0 - 1e-12)
+
+    # disordered values
+    samples = np.zeros_like(U)
+    for j, (key, index) in enumerate(dims):
+        x = system_params[key][index] if index is not None else system_params[key]
+        s = disorder[key]['spread']
+        if disorder[key]['dist'] == 'normal':
+            samples[:, j] = x * (1.0 + s * ss.norm.ppf(U[:, j]))
+        elif disorder[key]['dist'] == 'lognormal':
+            samples[:, j] = x * np.exp(s * ss.norm.ppf(U[:, j]))
+        else:
+            samples[:, j] = x * (1.0 + s * (2.0 * U[:, j] - 1.0))
+
+    return samples
+
+def get_system_params(system_params, dims, sample):
+    """Function to obtain the parameters of a system for a disordered sample.
+
+    Parameters
+    ----------
+    system_params : dict
+        Parameters of the system.
+    dims : list
+        Disordered dimensions (see :func:`get_dimensions`).
+    sample : numpy.ndarray
+        Disordered values.
+
+    Returns
+    -------
+    system_params : dict
+        Updated parameters of the system.
+    """
+
+    system_params = copy.deepcopy(system_params)
+    for j, (key, index) in enumerate(dims):
+        if index is not None:
+            system_params[key][index] = float(sample[j])
+        else:
+            system_params[key] = float(sample[j])
+
+    return system_params
+
+def get_statistics(values, quantiles=[0.05, 0.5, 0.95], confidence=0.95):
+    r"""Function to obtain the statistics of the measures of the samples.
+
+    The confidence intervals of the means are :math:`\bar{x} \pm z \sigma / \sqrt{N}` and those of the quantiles :math:`p` are the order statistics at :math:`N p \pm z \sqrt{N p (1 - p)}`, where :math:`z` is the standard normal quantile of the confidence level.
+    For the Sobol and Latin hypercube designs, the intervals assume independent samples and are hence conservative.
+    Without finite samples, the means, quantiles and intervals are ``nan`` and the standard deviations are infinite.
+
+    Parameters
+    ----------
+    values : numpy.ndarray
+        Measures of the samples, with a trailing axis for multiple measures.
+    quantiles : list, optional
+        Quantiles of the measures. Default is :math:`\left[ 0.05, 0.5, 0.95 \right]`.
+    confidence : float, optional
+        Confidence level of the intervals. Default is :math:`0.95`.
+
+    Returns
+    -------
+    stats : dict
+        Statistics with the keys ``'num_samples'``, ``'mean'``, ``'std'``, ``'mean_ci'`` (with a trailing axis for the bounds), ``'quantiles'`` and ``'quantile_cis'`` (with a leading axis for the quantiles).
+    """
+
+    # extract frequently used variables
+    values = values[np.all(np.isfinite(values), axis=1)]
+    N = len(values)
+    z = ss.norm.ppf(0.5 + confidence / 2.0)
+    ps = np.array(quantiles, dtype=np.float64)
+
+    # no finite samples
+    if N == 0:
+        nans = np.full(values.shape[1:], np.nan)
+        return {
+            'num_samples'   : N,
+            'mean'          : nans,
+            'std'           : np.full_like(nans, np.inf),
+            'mean_ci'       : np.stack([nans, nans], axis=-1),
+            'quantiles'     : np.full((len(ps), ) + values.shape[1:], np.nan),
+            'quantile_cis'  : np.full((len(ps), ) + values.shape[1:] + (2, ), np.nan)
+        }
+
+    # means
+    mean = np.mean(values, axis=0)
+    std = np.std(values, axis=0, ddof=1) if N > 1 else np.full_like(mean, np.inf)
+    half_width = z * std / np.sqrt(N)
+
+    # quantiles from the order statistics
+    sorted_values = np.sort(values, axis=0)
+    spreads = z * np.sqrt(N * ps * (1.0 - ps))
+    idxs_lower = np.clip(np.floor(N * ps - spreads).astype(int), 0, N - 1)
+    idxs_upper = np.clip(np.ceil(N * ps + spreads).astype(int), 0, N - 1)
+
+    return {
+        'num_samples'   : N,
+        'mean'          : mean,
+        'std'           : std,
+        'mean_ci'       : np.stack([mean - half_width, mean + half_width], axis=-1),
+        'quantiles'     : np.quantile(values, ps, axis=0),
+        'quantile_cis'  : np.stack([sorted_values[idxs_lower], sorted_values[idxs_upper]], axis=-1)
+    }
+
+def get_convergence(stats, rtol=1e-2, atol=1e-6):
+    """Function to check the convergence of the statistics of the measures.
+
+    The statistics are converged if the half-widths of the confidence intervals of all means and quantiles are below the maximum of ``atol`` and ``rtol`` times their values.
+
+    Parameters
+    ----------
+    stats : dict
+        Statistics of the measures (see :func:`get_statistics`).
+    rtol : float, optional
+        Relative tolerance of the half-widths. Default is :math:`10^{-2}`.
+    atol : float, optional
+        Absolute tolerance of the half-widths. Default is :math:`10^{-6}`.
+
+    Returns
+    -------
+    converged : bool
+        Convergence of the statistics.
+    """
+
+    for key, key_ci in [('mean', 'mean_ci'), ('quantiles', 'quantile_cis')]:
+        half_widths = (stats[key_ci][..., 1] - stats[key_ci][..., 0]) / 2.0
+        if not np.all(half_widths <= np.maximum(atol, rtol * np.abs(stats[key]))):
+            return False
+
+    return True
+
+def _run_chunk(args):
+    # evaluate the samples of a chunk
+    system_name, params_solver, system_params, dims, samples, idxs = args
+    values = [np.atleast_1d(get_value(system_name, params_solver, get_system_params(system_params, dims, sample))) for sample in samples]
+    return idxs, np.array(values)
+
+def run_ensemble(config, num_workers=1, resume=False, cb_update=None):
+    """Function to run a Monte Carlo ensemble over the disorder of the parameters of a system.
+
+    The disordered samples are drawn up front from the seeded design (see :func:`get_samples`) and evaluated in chunks with :func:`utils.loopers.get_value` in parallel processes, such that the options of the solver (for example, ``'floquet'``) apply to each sample.
+    At most two chunks per process are pending at a time, and after each completed chunk the running statistics are updated and the values are saved to a partial file, from which an interrupted ensemble can be resumed as the samples are regenerated from the seed.
+    The partial file stores the hash of the configuration (see :func:`utils.loopers.get_config_hash`), the seed, the design and the disorder, which should match those of the configuration to resume.
+    Once at least ``min_samples`` samples are completed, the ensemble stops early if the statistics are converged (see :func:`get_convergence`).
+    A failed evaluation of a sample is raised, keeping the completed chunks in the partial file, and samples with values which are not finite are excluded from the statistics.
+
+    Parameters
+    ----------
+    config : dict
+        Configuration of the ensemble (see :func:`get_ensemble_config`).
+    num_workers : int, optional
+        Number of parallel processes. Default is :math:`1`.
+    resume : bool, optional
+        Option to resume from the partial file. Default is ``False``.
+    cb_update : callable, optional
+        Callback function to stream the running statistics, formatted as ``cb_update(stats)``.
+
+    Returns
+    -------
+    file_path : str
+        Path of the data file.
+    stats : dict
+        Statistics of the measures of the completed samples, along with the key ``'converged'``.
+    """
+
+    # local modules
+    import systems
+
+    # extract frequently used variables
+    params = config['ensemble']
+    SystemClass = getattr(systems, config['system_name'])
+    system_params = dict(copy.deepcopy(getattr(SystemClass, 'system_defaults', {})), **copy.deepcopy(config['system']))
+    dims = get_dimensions(system_params, params['disorder'])
+    samples = get_samples(system_params, params['disorder'], params['num_samples'], params['design'], params['seed'])
+    file_path = params['file_path']
+    file_path_partial = file_path[:-4] + '_partial.npz'
+    chunk_size = params['chunk_size']
+    # values identifying the samples in the partial file
+    identifiers = dict(config=get_config_hash(config), **{key: json.dumps(params[key], sort_keys=True) for key in ['seed', 'design', 'disorder']})
+    logger.info('Running {} samples of {} over {} disordered dimensions\n'.format(len(samples), config['system_name'], len(dims)))
+
+    # resume completed samples
+    values = np.full((len(samples), len(config['solver']['measure_codes'])), np.nan, dtype=np.float64)
+    done = np.zeros(len(samples), dtype=bool)
+    if resume and os.path.isfile(file_path_partial):
+        partial = np.load(file_path_partial)
+        assert partial['values'].shape == values.shape, 'Samples of the partial file differ from those of the configuration'
+        for key, value in identifiers.items():
+            assert key in partial and str(partial[key]) == value, 'Value of ``{}`` of the partial file differs from that of the configuration, found ``{}``'.format(key, partial[key] if key in partial else None)
+        values, done = partial['values'], partial['done']
+        logger.info('Resuming {} with {} of {} samples\n'.format(file_path, int(np.sum(done)), len(samples)))
+    os.makedirs(os.path.dirname(file_path) or '.', exist_ok=True)
+
+    # chunks of pending samples in the order of the design
+    pending = np.flatnonzero(~ done)
+    args = [(config['system_name'], config['solver'], system_params, dims, samples[idxs], idxs) for idxs in [pending[i:i + chunk_size] for i in range(0, len(pending), chunk_size)]]
+
+    stats = None
+    def update(idxs, _values):
+        nonlocal stats
+        values[idxs] = _values
+        done[idxs] = True
+        save_partial(file_path_partial, values=values, done=done, **identifiers)
+        stats = get_statistics(values[done], params['quantiles'], params['confidence'])
+        stats['converged'] = bool(stats['num_samples'] >= params['min_samples'] and get_convergence(stats, params['rtol'], params['atol']))
+        if cb_update is not None:
+            cb_update(stats)
+        return stats['converged']
+
+    # evaluate chunks
+    if num_workers > 1:
+        with ProcessPoolExecutor(max_workers=num_workers) as executor:
+            futures = set()
+            converged = False
+            while (len(args) > 0 or len(futures) > 0) and not converged:
+                while len(args) > 0 and len(futures) < 2 * num_workers:
+                    futures.add(executor.submit(_run_chunk, args.pop(0)))
+                completed, futures = wait(futures, return_when=FIRST_COMPLETED)
+                for future in completed:
+                    converged = update(*future.result()) or converged
+            for future in futures:
+                future.cancel()
+    else:
+        for arg in args:
+            if update(*_run_chunk(arg)):
+                break
+
+    # statistics of the resumed samples
+    if stats is None:
+        stats = get_statistics(values[done], params['quantiles'], params['confidence'])
+        stats['converged'] = bool(stats['num_samples'] >= params['min_samples'] and get_convergence(stats, params['rtol'], params['atol']))
+    if stats['converged']:
+        logger.info('Converged after {} of {} samples\n'.format(int(np.sum(done)), len(samples)))
+    else:
+        logger.warning('Not converged after {} of {} samples\n'.format(int(np.sum(done)), len(samples)))
+
+    # save completed samples
+    np.savez_compressed(file_path, samples=samples[done], values=values[done], keys=np.array(['{}[{}]'.format(key, index) if index is not None else key for key, index in dims]), measure_codes=np.array(config['solver']['measure_codes']), quantile_levels=np.array(params['quantiles']), **{key: value for key, value in stats.items()})
+    os.remove(file_path_partial)
+    logger.info('Saved {}\n'.format(file_path))
+
+    return file_path, stats
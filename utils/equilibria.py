@@ -0,0 +1,384 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Module to obtain the classical fixed points of the coupled QOM systems."""
+
+__authors__ = ["Sampreet Kalita"]
+__toolbox__ = 'qom-v1.0.1'
+__created__ = "2026-10-18"
+__updated__ = "2026-10-18"
+
+# dependencies
+import logging
+import numpy as np
+
+# module logger
+logger = logging.getLogger(__name__)
+
+# classes of the points by their fixed points
+stability_labels = ['stable', 'bistable', 'hopf', 'unstable']
+
+def get_photon_numbers(A, kappa, Delta_0, chi):
+    r"""Function to obtain the intracavity photon numbers of a single driven optomechanical system at its fixed points.
+
+    The fixed points of :math:`\dot{\alpha} = \left( - \kappa + i \Delta \right) \alpha + A` with the shifted detuning :math:`\Delta = \Delta_{0} + \chi \left| \alpha \right|^{2}` satisfy the cubic equation :math:`\chi^{2} n^{3} + 2 \Delta_{0} \chi n^{2} + \left( \kappa^{2} + \Delta_{0}^{2} \right) n - \left| A \right|^{2} = 0` in the photon number :math:`n = \left| \alpha \right|^{2}`, which has up to three positive roots in the bistable regime.
+
+    Parameters
+    ----------
+    A : complex
+        Amplitude of the drive.
+    kappa : float
+        Optical decay rate.
+    Delta_0 : float
+        Detuning without the radiation pressure.
+    chi : float
+        Shift of the detuning per photon.
+
+    Returns
+    -------
+    ns : numpy.ndarray
+        Sorted non-negative photon numbers.
+    """
+
+    # linear cavity
+    if chi == 0.0:
+        return np.array([np.abs(A)**2 / (kappa**2 + Delta_0**2)])
+
+    # real non-negative roots
+    roots = np.roots([chi**2, 2.0 * Delta_0 * chi, kappa**2 + Delta_0**2, - np.abs(A)**2])
+    scale = np.max(np.abs(roots)) if len(roots) > 0 else 1.0
+    ns = np.real(roots[np.abs(np.imag(roots)) <= 1e-9 * scale])
+
+    return np.sort(ns[ns >= 0.0])
+
+def get_seeds(system, c=None, t=0.0):
+    r"""Function to obtain the initial guesses of the fixed points from the bistability of the uncoupled systems.
+
+    The optical modes are visited in order, and each is treated as a single optomechanical system driven by the rate of change of its mode with the mode emptied, which includes the laser and the modes of the systems visited before it.
+    Each positive root of :func:`get_photon_numbers` with the shift :math:`\chi_{j} = 2 g_{0j}^{2} \omega_{mj} / \left( \gamma_{j}^{2} + \omega_{mj}^{2} \right)` gives the modes :math:`\alpha_{j} = A_{j} / \left( \kappa_{j} - i \Delta_{j} \right)` and :math:`\beta_{j} = i g_{0j} n_{j} / \left( \gamma_{j} + i \omega_{mj} \right)`, and the guesses are all combinations over the systems.
+
+    Parameters
+    ----------
+    system : :class:`qom.systems.BaseSystem`
+        Instance of the system with the modes :math:`\left[ \alpha_{L}, \beta_{L}, \alpha_{R}, \beta_{R} \right]` in the laboratory frame.
+    c : numpy.ndarray, optional
+        Derived constants and controls. Default is the value from ``get_ivc``.
+    t : float, optional
+        Time at which the rates are calculated. Default is :math:`0.0`.
+
+    Returns
+    -------
+    seeds : list
+        Initial guesses of the classical modes.
+    """
+
+    # extract frequently used variables
+    params = system.params
+    c = c if c is not None else system.get_ivc()[2]
+    omega_ms = [params['omega_mL'], params['omega_mL'] + params['delta']]
+
+    seeds = [np.zeros(system.num_modes, dtype=np.complex128)]
+    for j in range(2):
+        # extract frequently used variables
+        g_0, gamma, kappa = params['g_0s'][j], params['gammas'][j], params['kappas'][j]
+        chi = 2.0 * g_0**2 * omega_ms[j] / (gamma**2 + omega_ms[j]**2)
+        Delta_0 = params['Delta_0_sign'] * omega_ms[j]
+
+        _seeds = list()
+        for seed in seeds:
+            # effective drive with the optical mode emptied
+            A = np.asarray(system.get_mode_rates(seed, c, t))[2*j]
+            for n in get_photon_numbers(A, kappa, Delta_0, chi):
+                _seed = seed.copy()
+                _seed[2*j] = A / (kappa - 1.0j * (Delta_0 + chi * n))
+                _seed[2*j + 1] = 1.0j * g_0 * n / (gamma + 1.0j * omega_ms[j])
+                _seeds.append(_seed)
+        seeds = _seeds
+
+    return seeds
+
+def get_fixed_point(system, modes, c=None, t=0.0, tol=1e-10, max_iter=50):
+    r"""Function to obtain a fixed point of the classical modes by the Newton iteration.
+
+    The iteration uses the analytic Jacobian ``get_mode_rates_jac`` in the real form :math:`\left[ \mathrm{Re} \alpha_{L}, \mathrm{Im} \alpha_{L}, ... \right]`, with the steps halved until the residual decreases.
+
+    Parameters
+    ----------
+    system : :class:`qom.systems.BaseSystem`
+        Instance of the system, implementing ``get_mode_rates_jac``.
+    modes : numpy.ndarray
+        Initial guess of the classical modes.
+    c : numpy.ndarray, optional
+        Derived constants and controls. Default is the value from ``get_ivc``.
+    t : float, optional
+        Time at which the rates are calculated. Default is :math:`0.0`.
+    tol : float, optional
+        Tolerance of the residual relative to the rates at vanishing modes. Default is :math:`10^{-10}`.
+    max_iter : int, optional
+        Maximum number of iterations. Default is :math:`50`.
+
+    Returns
+    -------
+    modes : numpy.ndarray
+        Classical modes at the last iteration.
+    converged : bool
+        Option indicating the convergence.
+    """
+
+    # validate system
+    assert hasattr(system, 'get_mode_rates_jac'), 'System should implement ``get_mode_rates_jac`` for the Newton iteration'
+
+    # extract frequently used variables
+    c = c if c is not None else system.get_ivc()[2]
+    func = lambda y: np.asarray(system.get_mode_rates(y.view(np.complex128), c, t), dtype=np.complex128).view(np.float64)
+    scale = 1.0 + np.linalg.norm(func(np.zeros(2 * system.num_modes)))
+    y = np.array(modes, dtype=np.complex128).view(np.float64).copy()
+    F = func(y)
+    res = np.linalg.norm(F)
+
+    for _ in range(max_iter):
+        if res <= tol * scale:
+            break
+
+        # Newton step
+        try:
+            dy = np.linalg.solve(np.asarray(system.get_mode_rates_jac(y.view(np.complex128), c, t), dtype=np.float64), - F)
+        except np.linalg.LinAlgError:
+            break
+
+        # halve until the residual decreases
+        s = 1.0
+        while s >= 2.0**-10:
+            _F = func(y + s * dy)
+            _res = np.linalg.norm(_F)
+            if _res < res:
+                break
+            s /= 2.0
+        else:
+            break
+        y, F, res = y + s * dy, _F, _res
+
+    return y.view(np.complex128).copy(), bool(res <= tol * scale)
+
+def get_fixed_points(system, c=None, t=0.0, tol=1e-10, max_iter=50):
+    r"""Function to obtain all branches of the fixed points of the classical modes along with their linear stability.
+
+    The initial guesses are obtained with :func:`get_seeds` and refined with :func:`get_fixed_point`, and the stability follows from the eigenvalues of the drift matrix ``get_A`` at each fixed point.
+    A branch with all eigenvalues in the left half-plane is stable, whereas a branch with a complex pair in the right half-plane undergoes self-sustained oscillations.
+
+    Parameters
+    ----------
+    system : :class:`qom.systems.BaseSystem`
+        Instance of the system (see :func:`get_seeds`).
+    c : numpy.ndarray, optional
+        Derived constants and controls. Default is the value from ``get_ivc``.
+    t : float, optional
+        Time at which the rates are calculated. Default is :math:`0.0`.
+    tol : float, optional
+        Tolerance of the residual relative to the rates at vanishing modes. Default is :math:`10^{-10}`.
+    max_iter : int, optional
+        Maximum number of iterations. Default is :math:`50`.
+
+    Returns
+    -------
+    branches : list
+        Distinct fixed points ordered by the largest real part of the eigenvalues, each as a dictionary with the keys ``'modes'``, ``'eigs'`` (eigenvalues of the drift matrix) and ``'stable'``.
+    """
+
+    # extract frequently used variables
+    c = c if c is not None else system.get_ivc()[2]
+
+    branches = list()
+    for seed in get_seeds(system, c, t):
+        modes, converged = get_fixed_point(system, seed, c, t, tol, max_iter)
+        if not converged:
+            continue
+
+        # distinct fixed points
+        if any([np.allclose(modes, branch['modes'], rtol=1e-6, atol=1e-9) for branch in branches]):
+            continue
+
+        # linear stability
+        eigs = np.linalg.eigvals(np.array(system.get_A(modes, c, t), dtype=np.float64))
+        branches.append({
+            'modes'     : modes,
+            'eigs'      : eigs,
+            'stable'    : bool(np.max(np.real(eigs)) < 0.0)
+        })
+
+    return sorted(branches, key=lambda branch: np.max(np.real(branch['eigs'])))
+
+def get_iv_modes(system, c=None, t=0.0):
+    r"""Function to obtain the initial values of the classical modes at a stable fixed point.
+
+    The most stable branch of :func:`get_fixed_points` is returned if it is stable, such that the trajectory starts without the transient of the modes.
+    Otherwise, the system self-oscillates and the initial values of the system are returned, as the limit cycles of the mechanical modes are typically far larger than the unstable fixed points and are reached faster from the transient of switching on the drive.
+
+    Parameters
+    ----------
+    system : :class:`qom.systems.BaseSystem`
+        Instance of the system (see :func:`get_seeds`).
+    c : numpy.ndarray, optional
+        Derived constants and controls. Default is the value from ``get_ivc``.
+    t : float, optional
+        Time at which the rates are calculated. Default is :math:`0.0`.
+
+    Returns
+    -------
+    iv_modes : numpy.ndarray
+        Initial values of the classical modes.
+    """
+
+    # stable fixed point
+    branches = get_fixed_points(system, c, t)
+    if len(branches) > 0 and branches[0]['stable']:
+        return branches[0]['modes']
+
+    logger.info('No stable fixed point found for {}, using the initial values of the system\n'.format(system.name))
+
+    return system.get_ivc()[0]
+
+def get_stability(system, c=None, t=0.0):
+    r"""Function to classify a point by the linear stability of its fixed points.
+
+    ==============  ================================================================================================================
+    label           meaning
+    ==============  ================================================================================================================
+    stable          a single stable fixed point, to which the trajectories settle.
+    bistable        multiple stable fixed points, selected by the initial values.
+    hopf            no stable fixed point, with a complex pair of eigenvalues in the right half-plane at the least unstable branch, giving self-sustained oscillations.
+    unstable        no stable fixed point and no such pair, or no fixed point found.
+    ==============  ================================================================================================================
+
+    Parameters
+    ----------
+    system : :class:`qom.systems.BaseSystem`
+        Instance of the system (see :func:`get_seeds`).
+    c : numpy.ndarray, optional
+        Derived constants and controls. Default is the value from ``get_ivc``.
+    t : float, optional
+        Time at which the rates are calculated. Default is :math:`0.0`.
+
+    Returns
+    -------
+    label : str
+        Class of the point, one of :obj:`stability_labels`.
+    branches : list
+        Branches of the fixed points (see :func:`get_fixed_points`).
+    """
+
+    # extract frequently used variables
+    branches = get_fixed_points(system, c, t)
+    num_stable = len([branch for branch in branches if branch['stable']])
+
+    if num_stable == 1:
+        return 'stable', branches
+    if num_stable > 1:
+        return 'bistable', branches
+    if len(branches) > 0:
+        eigs = branches[0]['eigs']
+        if np.any(np.abs(np.imag(eigs[np.real(eigs) >= 0.0])) > 0.0):
+            return 'hopf', branches
+
+    return 'unstable', branches
+
+def get_steady_corrs(system, modes, c=None, t=0.0):
+    r"""Function to obtain the steady-state quantum correlations at a stable fixed point.
+
+    The correlations solve the Lyapunov equation :math:`A V + V A^{T} + D = 0` with the drift matrix :math:`A` and the noise matrix :math:`D` at the fixed point.
+
+    Parameters
+    ----------
+    system : :class:`qom.systems.BaseSystem`
+        Instance of the system.
+    modes : numpy.ndarray
+        Classical modes at the fixed point.
+    c : numpy.ndarray, optional
+        Derived constants and controls. Default is the value from ``get_ivc``.
+    t : float, optional
+        Time at which the matrices are calculated. Default is :math:`0.0`.
+
+    Returns
+    -------
+    corrs : numpy.ndarray
+        Steady-state quantum correlations.
+    """
+
+    # dependencies
+    from scipy.linalg import solve_continuous_lyapunov
+
+    # extract frequently used variables
+    _, iv_corrs, _c = system.get_ivc()
+    c = c if c is not None else _c
+    A = np.array(system.get_A(modes, c, t), dtype=np.float64)
+    D = np.array(system.get_D(modes, iv_corrs, c, t), dtype=np.float64)
+
+    # symmetrize against the round-off
+    V = solve_continuous_lyapunov(A, - D)
+
+    return (V + V.transpose()) / 2.0
+
+def get_steady_corrs_batch(As, Ds, method='eig', rtol=1e-8, chunk_size=1024):
+    r"""Function to obtain the steady-state quantum correlations at many stable fixed points in a vectorized way.
+
+    For the method ``'eig'``, the drift matrices are diagonalized as :math:`A = P \Lambda P^{-1}` in a single call, such that each Lyapunov equation :math:`A V + V A^{T} + D = 0` reduces to :math:`\tilde{V}_{ij} = - \tilde{D}_{ij} / \left( \lambda_{i} + \lambda_{j} \right)` with :math:`\tilde{D} = P^{-1} D P^{-T}` and :math:`V = P \tilde{V} P^{T}`.
+    The equations whose relative residuals exceed ``rtol``, as for nearly defective drift matrices, are solved again by the method ``'kron'``.
+    For the method ``'kron'``, each equation is written in the Kronecker form :math:`\left( A \otimes I + I \otimes A \right) \mathrm{vec} \left( V \right) = - \mathrm{vec} \left( D \right)` and the stacked systems are solved by :func:`numpy.linalg.solve` in chunks bounding the memory.
+
+    Parameters
+    ----------
+    As : numpy.ndarray
+        Drift matrices at the fixed points, stacked along the first axis.
+    Ds : numpy.ndarray
+        Noise matrices at the fixed points, stacked along the first axis.
+    method : str, optional
+        Method of the solution. Available options are ``'eig'`` and ``'kron'``. Default is ``'eig'``.
+    rtol : float, optional
+        Maximum residual of the method ``'eig'`` relative to the norms of the noise matrices. Default is :math:`10^{-8}`.
+    chunk_size : int, optional
+        Number of equations solved in each call of the method ``'kron'``. Default is :math:`1024`.
+
+    Returns
+    -------
+    Corrs : numpy.ndarray
+        Steady-state quantum correlations, stacked along the first axis.
+    """
+
+    # validate parameters
+    methods = ['eig', 'kron']
+    assert method in methods, 'Parameter ``method`` should be one of ``{}``'.format(methods)
+
+    # extract frequently used variables
+    As = np.asarray(As, dtype=np.float64)
+    Ds = np.asarray(Ds, dtype=np.float64)
+    num, dim = As.shape[0], As.shape[-1]
+    Corrs = np.zeros((num, dim, dim), dtype=np.float64)
+
+    # diagonalization
+    if method == 'eig':
+        with np.errstate(all='ignore'):
+            lambdas, P = np.linalg.eig(As)
+            P_inv = np.linalg.inv(P)
+            V = P @ (- (P_inv @ Ds @ P_inv.transpose(0, 2, 1)) / (lambdas[:, :, np.newaxis] + lambdas[:, np.newaxis, :])) @ P.transpose(0, 2, 1)
+            Corrs = np.real(V)
+            Corrs = (Corrs + Corrs.transpose(0, 2, 1)) / 2.0
+
+            # residuals relative to the noise
+            res = np.linalg.norm(As @ Corrs + Corrs @ As.transpose(0, 2, 1) + Ds, axis=(1, 2)) / np.maximum(np.linalg.norm(Ds, axis=(1, 2)), np.finfo(np.float64).tiny)
+        idxs = np.flatnonzero(~ (res <= rtol))
+        if len(idxs) == 0:
+            return Corrs
+        logger.debug('Solving {} of {} equations in the Kronecker form\n'.format(len(idxs), num))
+    else:
+        idxs = np.arange(num)
+
+    # Kronecker sums in the row-major vectorization
+    I = np.eye(dim)
+    for i in range(0, len(idxs), chunk_size):
+        _idxs = idxs[i:i + chunk_size]
+        K = (np.einsum('bij,kl->bikjl', As[_idxs], I) + np.einsum('ij,bkl->bikjl', I, As[_idxs])).reshape((len(_idxs), dim**2, dim**2))
+        V = np.linalg.solve(K, - Ds[_idxs].reshape((len(_idxs), dim**2, 1))).reshape((len(_idxs), dim, dim))
+        # symmetrize against the round-off
+        Corrs[_idxs] = (V + V.transpose(0, 2, 1)) / 2.0
+
+    return Corrs
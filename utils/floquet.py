@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Module to obtain the periodic quantum correlations on the limit cycles of the coupled QOM systems."""
+
+__authors__ = ["Sampreet Kalita"]
+__toolbox__ = 'qom-v1.0.1'
+__created__ = "2026-10-18"
+__updated__ = "2026-10-18"
+
+# dependencies
+import copy
+import logging
+import numpy as np
+import scipy.integrate as si
+import scipy.linalg as sl
+
+# module logger
+logger = logging.getLogger(__name__)
+
+class FloquetSolver():
+    r"""Class to solve the periodic quantum correlations on a limit cycle of the classical modes.
+
+    Only the classical modes are integrated up to the maximum time, after which the period :math:`T` of the limit cycle is obtained from the upward crossings of the mean of its most varying real-form component.
+    Over one period from a crossing, the propagator :math:`\Phi (t)` of :math:`\dot{\Phi} = A (t) \Phi` and the correlations :math:`W (t)` of :math:`\dot{W} = A W + W A^{T} + D` with :math:`W (0) = 0` are integrated along with the modes.
+    The periodic correlations then follow from the periodic Lyapunov equation :math:`V (0) = \Phi (T) V (0) \Phi^{T} (T) + W (T)` as :math:`V (t) = \Phi (t) V (0) \Phi^{T} (t) + W (t)`.
+
+    The linearization about an autonomous limit cycle has a unit Floquet multiplier along the cycle, whose fluctuations diffuse instead of relaxing.
+    This direction is projected out with the spectral projector :math:`P` of the remaining multipliers, transported as :math:`P (t) = \Phi (t) P \Phi^{-1} (t)`, such that the correlations are those transverse to the cycle.
+
+    Parameters
+    ----------
+    system : :class:`qom.systems.BaseSystem`
+        Instance of the system.
+    params : dict
+        Parameters for the solver. The solver parameters are:
+        ================    ====================================================
+        key                 meaning
+        ================    ====================================================
+        ode_atol            (*float*) absolute tolerance of the integrator. Default is :math:`10^{-10}`.
+        ode_rtol            (*float*) relative tolerance of the integrator. Default is :math:`10^{-8}`.
+        t_min               (*float*) minimum time. Default is :math:`0.0`.
+        t_max               (*float*) time up to which the classical modes relax to the limit cycle. Default is :math:`1000.0`.
+        t_dim               (*int*) number of time points, whose spacing sets that of the outputs over the period. Default is :math:`10001`.
+        t_span              (*float*) span of times after ``t_max`` in which the period is obtained. Default is :math:`200.0`.
+        period_rtol         (*float*) maximum distance between the modes after one period, relative to the extent of the limit cycle. Default is :math:`10^{-3}`.
+        ================    ====================================================
+    """
+
+    # default parameters of the solver
+    solver_defaults = {
+        'ode_atol'      : 1e-10,
+        'ode_rtol'      : 1e-8,
+        't_min'         : 0.0,
+        't_max'         : 1000.0,
+        't_dim'         : 10001,
+        't_span'        : 200.0,
+        'period_rtol'   : 1e-3
+    }
+
+    def __init__(self, system, params={}):
+        """Class constructor for FloquetSolver."""
+
+        # set attributes
+        self.system = system
+        self.params = copy.deepcopy(self.solver_defaults)
+        self.params.update({key: value for key, value in params.items() if key in self.solver_defaults})
+
+        # initial values
+        self.iv_modes, self.iv_corrs, self.c = system.get_ivc()
+        self.dim_m = 2 * system.num_modes
+
+        # systems driving the correlations
+        self.systems = [system]
+
+        # results
+        self.period = None
+        self.multipliers = None
+
+    def _get_mode_rates(self, t, y):
+        # rates of the real-form modes
+        return np.asarray(self.system.get_mode_rates(y.view(np.complex128), self.c, t), dtype=np.complex128).view(np.float64)
+
+    def _get_rates(self, t, y):
+        # extract modes, propagator and correlations of each system
+        dim = self.dim_m
+        modes = y[:dim].view(np.complex128)
+        Phi = y[dim:dim + dim**2].reshape((dim, dim))
+        Ws = y[dim + dim**2:].reshape((-1, dim, dim))
+
+        # drift matrix
+        A = np.array(self.system.get_A(modes, self.c, t), dtype=np.float64)
+        rates = [self._get_mode_rates(t, y[:dim]), A.dot(Phi).ravel()]
+
+        # noise matrices
+        for system, W in zip(self.systems, Ws):
+            D = np.array(system.get_D(modes, W, self.c, t), dtype=np.float64)
+            rates.append((A.dot(W) + W.dot(A.transpose()) + D).ravel())
+
+        return np.concatenate(rates)
+
+    def get_limit_cycle(self):
+        """Method to obtain a point on the limit cycle of the classical modes and its period.
+
+        Returns
+        -------
+        modes : numpy.ndarray
+            Classical modes at an upward crossing of the section, or ``None`` if no periodic limit cycle is found.
+        period : float
+            Period of the limit cycle, or ``None`` if no periodic limit cycle is found.
+        """
+
+        # extract frequently used variables
+        t_max, t_span = self.params['t_max'], self.params['t_span']
+        kwargs = {
+            'method': 'DOP853',
+            'atol'  : self.params['ode_atol'],
+            'rtol'  : self.params['ode_rtol']
+        }
+
+        # relax the classical modes
+        y_0 = np.asarray(self.iv_modes, dtype=np.complex128).view(np.float64)
+        y_1 = si.solve_ivp(self._get_mode_rates, (self.params['t_min'], t_max), y_0, **kwargs).y[:, -1]
+        sol = si.solve_ivp(self._get_mode_rates, (t_max, t_max + t_span), y_1, dense_output=True, **kwargs)
+
+        # upward crossings of the mean of the most varying component
+        T = np.linspace(t_max, t_max + t_span, 20 * int(t_span) + 1)
+        Y = sol.sol(T)
+        k = np.argmax(np.std(Y, axis=1))
+        x = Y[k] - np.mean(Y[k])
+        idxs = np.flatnonzero((x[:-1] < 0.0) & (x[1:] >= 0.0))
+        if len(idxs) < 3:
+            return None, None
+        ts = T[idxs] - x[idxs] * (T[idxs + 1] - T[idxs]) / (x[idxs + 1] - x[idxs])
+
+        # period from the last crossings
+        period = float(np.mean(np.diff(ts[-3:])))
+        t_0 = ts[-3]
+        extent = np.max(np.ptp(Y, axis=1))
+        error = np.max(np.abs(sol.sol(t_0 + period) - sol.sol(t_0))) / extent
+        if error > self.params['period_rtol']:
+            logger.info('No periodic limit cycle found for {} with relative error {:.2e}\n'.format(self.system.name, error))
+            return None, None
+
+        return sol.sol(t_0).view(np.complex128).copy(), period
+
+    def get_modes_corrs(self, systems=None, modes=None, period=None):
+        """Method to obtain the classical modes and the periodic quantum correlations over one period of the limit cycle.
+
+        Parameters
+        ----------
+        systems : list, optional
+            Systems sharing the classical modes and the drift matrix of the system, whose noise matrices drive the correlations. Default is ``None`` for the system of the solver.
+        modes : numpy.ndarray, optional
+            Classical modes at a point of a known periodic orbit. Default is ``None`` to obtain the limit cycle with :meth:`get_limit_cycle`.
+        period : float, optional
+            Period of the known periodic orbit, required along with ``modes``.
+
+        Returns
+        -------
+        Modes : numpy.ndarray
+            Classical modes at the output times, or ``None`` if no stable periodic limit cycle is found.
+        Corrs : numpy.ndarray
+            Periodic quantum correlations at the output times, with a leading axis for the systems if ``systems`` is given, or ``None`` if no stable periodic limit cycle is found.
+        """
+
+        # limit cycle
+        if modes is None:
+            modes, period = self.get_limit_cycle()
+        if modes is None:
+            return None, None
+        self.period = period
+
+        # output times spanning the period uniformly
+        dim = self.dim_m
+        dt = (self.params['t_max'] - self.params['t_min']) / (self.params['t_dim'] - 1)
+        T = np.linspace(0.0, period, max(1, int(round(period / dt))), endpoint=False)
+
+        # propagator and correlations over one period
+        self.systems = systems if systems is not None else [self.system]
+        y_0 = np.concatenate((modes.view(np.float64), np.eye(dim).ravel(), np.zeros(len(self.systems) * dim**2)))
+        sol = si.solve_ivp(self._get_rates, (0.0, period), y_0, method='DOP853', t_eval=np.append(T, period), atol=self.params['ode_atol'], rtol=self.params['ode_rtol'])
+        Phis = sol.y[dim:dim + dim**2].transpose().reshape((-1, dim, dim))
+        Ws = sol.y[dim + dim**2:].transpose().reshape((-1, len(self.systems), dim, dim))
+        Phi = Phis[-1]
+
+        # project out the unit multiplier along the cycle
+        mus, U = np.linalg.eig(Phi)
+        self.multipliers = mus
+        k = np.argmin(np.abs(mus - 1.0))
+        mus_transverse = np.delete(mus, k)
+        if np.max(np.abs(mus_transverse)) >= 1.0:
+            logger.info('Unstable limit cycle found for {} with multiplier {:.4f}\n'.format(self.system.name, np.max(np.abs(mus_transverse))))
+            return None, None
+        u = np.real(U[:, k])
+        w = np.real(np.linalg.inv(U)[k])
+        P = np.eye(dim) - np.outer(u, w) / w.dot(u)
+
+        # periodic Lyapunov equations of the transverse correlations
+        V_0s = [sl.solve_discrete_lyapunov(P.dot(Phi), P.dot(W).dot(P.transpose())) for W in Ws[-1]]
+
+        # transported correlations over the period
+        Corrs = np.zeros((len(self.systems), len(T), dim, dim), dtype=np.float64)
+        for i in range(len(T)):
+            P_t = Phis[i].dot(P).dot(np.linalg.inv(Phis[i]))
+            for k, V_0 in enumerate(V_0s):
+                V = P_t.dot(Phis[i].dot(V_0).dot(Phis[i].transpose()) + Ws[i, k]).dot(P_t.transpose())
+                Corrs[k, i] = (V + V.transpose()) / 2.0
+        Modes = sol.y[:dim, :-1].transpose().copy().view(np.complex128)
+
+        return Modes, Corrs if systems is not None else Corrs[0]
@@ -0,0 +1,487 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Module to run the sweeps of the coupled QOM systems as graphs of cached stages."""
+
+__authors__ = ["Sampreet Kalita"]
+__toolbox__ = 'qom-v1.0.1'
+__created__ = "2026-10-18"
+__updated__ = "2026-10-19"
+
+# dependencies
+from concurrent.futures import as_completed, ProcessPoolExecutor
+import hashlib
+import json
+import logging
+import numpy as np
+import os
+import shutil
+
+# local modules
+from utils.loopers import get_axes, get_file_path, get_system_params
+
+# module logger
+logger = logging.getLogger(__name__)
+
+# stages of the graph, in the order of their dependencies
+stages = ['trajectory', 'measure', 'aggregate', 'plot']
+# solver parameters used only by the measures
+measure_keys = ['measure_codes', 'indices']
+# solver parameters without effect on the values
+ignored_keys = ['show_progress', 'cache', 'cache_dir']
+
+def get_hash(params):
+    """Function to obtain the content hash of the parameters of a stage.
+
+    Parameters
+    ----------
+    params : dict
+        Parameters of the stage, including the hashes of its parent stages.
+
+    Returns
+    -------
+    hash : str
+        Hexadecimal hash of the parameters.
+    """
+
+    return hashlib.sha1(json.dumps(params, sort_keys=True, default=str).encode('utf-8')).hexdigest()[:16]
+
+def _run_chunk(args):
+    # integrate the windows of the points of a chunk
+    system_name, params_solver, system_params, keys, points, idxs = args
+
+    # local modules
+    import systems
+    from utils.solvers import get_solver_params, HLESolver
+
+    SystemClass = getattr(systems, system_name)
+    Modes, Corrs = list(), list()
+    for point in points:
+        _system_params = get_system_params(system_params, keys, point)
+        # select integrator for the current point
+        _params_solver = get_solver_params(
+            system=SystemClass(
+                params=_system_params
+            ),
+            params=params_solver
+        )
+        # the windows are stored by the graph and are not shared across processes
+        _Modes, _Corrs = HLESolver(
+            system=SystemClass(
+                params=_system_params
+            ),
+            params=dict(_params_solver, output_stride=None)
+        ).get_modes_corrs()
+        Modes.append(_Modes)
+        Corrs.append(_Corrs)
+    return idxs, np.array(Modes), np.array(Corrs)
+
+class RunGraph():
+    r"""Class to run a sweep as a graph of stages cached by the hashes of their contents.
+
+    The sweep is split into the stages
+
+    ==============  ================================================================================================================
+    stage           description
+    ==============  ================================================================================================================
+    trajectory      windows of the classical modes and quantum correlations at all points, depending on the system, the axes of the looper and the parameters of the integration.
+    measure         values of a measure in the window at all points, depending on the trajectories and ``'indices'``, with one stage for each code in ``'measure_codes'``.
+    aggregate       values of the measures averaged over the window, depending on the measures, saved in the format of the loopers.
+    plot            figure of the averaged values, depending on the aggregate and the parameters of the ``'plotter'`` section.
+    ==============  ================================================================================================================
+
+    The hash of each stage is derived from its own parameters and the hashes of its parent stages, and its output is stored in the cache directory under the name of the stage and its hash.
+    A change in the configuration hence invalidates only the stages downstream of it, such that an edit of the plotter only redraws the figure and an added measure reuses the stored trajectories.
+    The trajectories are stored as memory-mapped arrays in the precision of the solver and are resumed after interruptions.
+
+    Parameters
+    ----------
+    config : dict
+        Configuration of the sweep (see :func:`utils.loopers.get_config`), with an optional ``'plotter'`` section of the parameters of :class:`qom.ui.plotters.MPLPlotter`.
+    params : dict, optional
+        Parameters of the graph. Refer to :obj:`graph_defaults` for the currently supported keys.
+    cb_update : callable, optional
+        Callback function to update progress, formatted as ``cb_update(stage, num_done, num_total)``.
+
+    .. note:: All the options defined in ``params`` supersede individual function arguments. Their details are:
+
+        ==============  ================================================================================================================
+        key             value
+        ==============  ================================================================================================================
+        cache_dir       (*str*) directory of the outputs of the stages. Default is ``'data/v3.0_qom-v1.0.1/graph'``.
+        num_workers     (*int*) number of parallel processes for the trajectories. Default is :math:`1`.
+        chunk_size      (*int*) number of points in each chunk. Default is ``None`` for the number of points divided among the workers.
+        ==============  ================================================================================================================
+    """
+
+    # default parameters of the graph
+    graph_defaults = {
+        'cache_dir'     : 'data/v3.0_qom-v1.0.1/graph',
+        'num_workers'   : 1,
+        'chunk_size'    : None
+    }
+
+    def __init__(self, config, params={}, cb_update=None):
+        """Class constructor for RunGraph."""
+
+        # set attributes
+        self.config = config
+        self.params = dict()
+        for key in self.graph_defaults:
+            self.params[key] = params.get(key, self.graph_defaults[key])
+        self.cb_update = cb_update
+
+        # extract frequently used variables
+        self.axes = get_axes(config['looper'])
+        self.keys = [axis[0] for axis in self.axes]
+        grids = np.meshgrid(*[axis[1] for axis in self.axes[::-1]], indexing='ij')[::-1]
+        self.points = np.stack([grid.ravel() for grid in grids], axis=-1)
+        self.file_path = get_file_path(config['looper'])
+
+        # hashes of the stages
+        self.hashes = self.get_hashes()
+
+    def get_hashes(self):
+        """Method to obtain the hashes of all stages.
+
+        Returns
+        -------
+        hashes : dict
+            Hashes of the stages, with the hashes of the measures keyed by their codes.
+        """
+
+        # extract frequently used variables
+        params_solver = self.config['solver']
+        hashes = dict()
+
+        # trajectories depend on the system, the axes and the integration
+        hashes['trajectory'] = get_hash({
+            'system_name'   : self.config['system_name'],
+            'system'        : self.config['system'],
+            'axes'          : {axis: self.config['looper'][axis] for axis in ['X', 'Y'] if axis in self.config['looper']},
+            'solver'        : {key: value for key, value in params_solver.items() if key not in measure_keys + ignored_keys}
+        })
+
+        # measures depend on the trajectories and the indices
+        hashes['measure'] = {measure_code: get_hash({
+            'trajectory'    : hashes['trajectory'],
+            'measure_code'  : measure_code,
+            'indices'       : params_solver.get('indices', [1, 3])
+        }) for measure_code in params_solver['measure_codes']}
+
+        # aggregate depends on the measures in order
+        hashes['aggregate'] = get_hash({
+            'measure'       : [hashes['measure'][measure_code] for measure_code in params_solver['measure_codes']]
+        })
+
+        # plot depends on the aggregate and the plotter
+        hashes['plot'] = get_hash({
+            'aggregate'     : hashes['aggregate'],
+            'plotter'       : self.config.get('plotter', None)
+        })
+
+        return hashes
+
+    def get_path(self, stage, measure_code=None):
+        """Method to obtain the path of the output of a stage.
+
+        Parameters
+        ----------
+        stage : str
+            Name of the stage. Available options are ``'trajectory'``, ``'measure'``, ``'aggregate'`` and ``'plot'``.
+        measure_code : str, optional
+            Code of the measure for the ``'measure'`` stage.
+
+        Returns
+        -------
+        path : str
+            Path of the output, which is a directory for the ``'trajectory'`` stage.
+        """
+
+        # validate parameters
+        assert stage in stages, 'Parameter ``stage`` should be one of ``{}``'.format(stages)
+
+        _hash = self.hashes[stage][measure_code] if stage == 'measure' else self.hashes[stage]
+        extension = {
+            'trajectory': '',
+            'measure'   : '.npy',
+            'aggregate' : '.npz',
+            'plot'      : '.png'
+        }[stage]
+        return os.path.join(self.params['cache_dir'], stage + '_' + _hash + extension)
+
+    def get_status(self):
+        """Method to obtain the stages with stored outputs.
+
+        Returns
+        -------
+        status : dict
+            Availability of the outputs of the stages, with that of the measures keyed by their codes.
+        """
+
+        return {
+            'trajectory': os.path.isfile(os.path.join(self.get_path('trajectory'), 'done.npy')) and bool(np.all(np.load(os.path.join(self.get_path('trajectory'), 'done.npy')))),
+            'measure'   : {measure_code: os.path.isfile(self.get_path('measure', measure_code)) for measure_code in self.config['solver']['measure_codes']},
+            'aggregate' : os.path.isfile(self.get_path('aggregate')),
+            'plot'      : os.path.isfile(self.get_path('plot'))
+        }
+
+    def _update(self, stage, num_done, num_total):
+        # update progress
+        if self.cb_update is not None:
+            self.cb_update(stage, num_done, num_total)
+
+    def run_trajectory(self):
+        """Method to run the stage of the trajectories.
+
+        The windows are integrated in chunks of points and written to memory-mapped arrays after each chunk, such that an interrupted stage resumes from the completed chunks.
+
+        Returns
+        -------
+        Modes : numpy.memmap
+            Read-only classical modes in the window at all points.
+        Corrs : numpy.memmap
+            Read-only quantum correlations in the window at all points.
+        """
+
+        # extract frequently used variables
+        dir_path = self.get_path('trajectory')
+        file_path_done = os.path.join(dir_path, 'done.npy')
+        num_points = len(self.points)
+        num_workers = self.params['num_workers']
+        chunk_size = self.params['chunk_size'] if self.params['chunk_size'] is not None else max(1, int(np.ceil(num_points / max(1, num_workers) / 4)))
+
+        # resume completed points
+        done = np.load(file_path_done) if os.path.isfile(file_path_done) else np.zeros(num_points, dtype=bool)
+        pending = np.flatnonzero(~ done)
+        if len(pending) == 0:
+            logger.info('Reusing trajectory {}\n'.format(self.hashes['trajectory']))
+            return self.get_trajectory()
+        logger.info('Running trajectory {} with {} of {} points pending\n'.format(self.hashes['trajectory'], len(pending), num_points))
+        os.makedirs(dir_path, exist_ok=True)
+
+        # chunks of pending points
+        chunks = [pending[i:i + chunk_size] for i in range(0, len(pending), chunk_size)]
+        params_solver = {key: value for key, value in self.config['solver'].items() if key not in measure_keys}
+        args = [(self.config['system_name'], params_solver, self.config['system'], self.keys, self.points[idxs], idxs) for idxs in chunks]
+        arrays = dict()
+
+        def update(idxs, Modes, Corrs):
+            # open or create the arrays from the shapes of the first chunk
+            for name, values in zip(['Modes', 'Corrs'], [Modes, Corrs]):
+                if name not in arrays:
+                    file_path = os.path.join(dir_path, name + '.npy')
+                    if os.path.isfile(file_path):
+                        arrays[name] = np.load(file_path, mmap_mode='r+')
+                    else:
+                        arrays[name] = np.lib.format.open_memmap(file_path, mode='w+', dtype=values.dtype, shape=(num_points, ) + values.shape[1:])
+                arrays[name][idxs] = values
+                arrays[name].flush()
+            done[idxs] = True
+            np.save(file_path_done, done)
+            self._update('trajectory', int(np.sum(done)), num_points)
+
+        # evaluate chunks
+        if num_workers > 1:
+            with ProcessPoolExecutor(max_workers=num_workers) as executor:
+                for future in as_completed([executor.submit(_run_chunk, arg) for arg in args]):
+                    update(*future.result())
+        else:
+            for arg in args:
+                update(*_run_chunk(arg))
+        arrays.clear()
+
+        return self.get_trajectory()
+
+    def get_trajectory(self):
+        """Method to obtain the stored trajectories.
+
+        Returns
+        -------
+        Modes : numpy.memmap
+            Read-only classical modes in the window at all points.
+        Corrs : numpy.memmap
+            Read-only quantum correlations in the window at all points.
+        """
+
+        # extract frequently used variables
+        dir_path = self.get_path('trajectory')
+
+        return np.load(os.path.join(dir_path, 'Modes.npy'), mmap_mode='r'), np.load(os.path.join(dir_path, 'Corrs.npy'), mmap_mode='r')
+
+    def run_measure(self, measure_code):
+        """Method to run the stage of a measure.
+
+        The quantum phase synchronization is obtained with :func:`utils.measures.get_sync_p` for all points at once, and the other measures with :class:`qom.solvers.measure.QCMSolver` at each point.
+
+        Parameters
+        ----------
+        measure_code : str
+            Code of the measure.
+
+        Returns
+        -------
+        Measures : numpy.ndarray
+            Values of the measure in the window at all points.
+        """
+
+        # reuse stored measure
+        file_path = self.get_path('measure', measure_code)
+        if os.path.isfile(file_path):
+            logger.info('Reusing measure {} {}\n'.format(measure_code, self.hashes['measure'][measure_code]))
+            return np.load(file_path)
+
+        # extract frequently used variables
+        Modes, Corrs = self.run_trajectory()
+        logger.info('Running measure {} {}\n'.format(measure_code, self.hashes['measure'][measure_code]))
+        indices = self.config['solver'].get('indices', [1, 3])
+        num_points, num_times = Modes.shape[:2]
+        chunk_size = max(1, 2**26 // max(1, Corrs[0].nbytes))
+        Measures = np.zeros((num_points, num_times), dtype=np.float64)
+
+        # evaluate chunks of points
+        for i in range(0, num_points, chunk_size):
+            _Modes = np.asarray(Modes[i:i + chunk_size])
+            _Corrs = np.asarray(Corrs[i:i + chunk_size])
+            if measure_code == 'sync_p':
+                # local modules
+                from utils.measures import get_sync_p
+
+                Measures[i:i + chunk_size] = get_sync_p(_Modes.reshape((-1, ) + _Modes.shape[2:]), _Corrs.reshape((-1, ) + _Corrs.shape[2:]), indices).reshape(_Modes.shape[:2])
+            else:
+                # qom modules
+                from qom.solvers.measure import QCMSolver
+
+                for j in range(len(_Modes)):
+                    Measures[i + j] = QCMSolver(
+                        Modes=_Modes[j],
+                        Corrs=_Corrs[j],
+                        params={
+                            'measure_codes' : [measure_code],
+                            'indices'       : indices
+                        }
+                    ).get_measures()[:, 0]
+            self._update('measure', min(i + chunk_size, num_points), num_points)
+
+        # save atomically
+        file_path_temp = file_path[:-4] + '_temp.npy'
+        np.save(file_path_temp, Measures)
+        os.replace(file_path_temp, file_path)
+
+        return Measures
+
+    def run_aggregate(self):
+        """Method to run the stage of the aggregate.
+
+        The measures are averaged over the window with :func:`utils.measures.get_average` and saved to the data file of the looper, as ``values[y_index][x_index]`` with a trailing axis for multiple measures.
+
+        Returns
+        -------
+        V : numpy.ndarray
+            Averaged values of the measures.
+        """
+
+        # reuse stored aggregate
+        file_path = self.get_path('aggregate')
+        if os.path.isfile(file_path):
+            logger.info('Reusing aggregate {}\n'.format(self.hashes['aggregate']))
+            V = np.load(file_path)['arr_0']
+        else:
+            # local modules
+            from utils.measures import get_average
+
+            values = np.stack([get_average(self.run_measure(measure_code), axis=1) for measure_code in self.config['solver']['measure_codes']], axis=-1)
+            logger.info('Running aggregate {}\n'.format(self.hashes['aggregate']))
+            V = values.reshape(tuple(len(axis[1]) for axis in self.axes[::-1]) + (values.shape[1], ))
+            if V.shape[-1] == 1:
+                V = V[..., 0]
+            np.savez_compressed(file_path, V)
+
+        # save in the format of the loopers
+        os.makedirs(os.path.dirname(self.file_path) or '.', exist_ok=True)
+        shutil.copyfile(file_path, self.file_path)
+
+        return V
+
+    def run_plot(self, V=None):
+        """Method to run the stage of the plot.
+
+        The figure is drawn with :class:`qom.ui.plotters.MPLPlotter` using the ``'plotter'`` section of the configuration and saved next to the data file.
+
+        Parameters
+        ----------
+        V : numpy.ndarray, optional
+            Averaged values of the measures. Default is the output of the aggregate stage.
+
+        Returns
+        -------
+        file_path : str
+            Path of the figure, or ``None`` if the configuration has no ``'plotter'`` section.
+        """
+
+        # validate configuration
+        if self.config.get('plotter', None) is None:
+            return None
+
+        # reuse stored plot
+        file_path = self.get_path('plot')
+        if os.path.isfile(file_path):
+            logger.info('Reusing plot {}\n'.format(self.hashes['plot']))
+        else:
+            # dependencies
+            import matplotlib
+            matplotlib.use('Agg')
+            import matplotlib.pyplot as plt
+
+            # qom modules
+            from qom.ui.plotters import MPLPlotter
+
+            # extract frequently used variables
+            V = V if V is not None else self.run_aggregate()
+            logger.info('Running plot {}\n'.format(self.hashes['plot']))
+            xs = self.axes[0][1]
+            ys = self.axes[1][1] if len(self.axes) > 1 else None
+
+            # plotter
+            plotter = MPLPlotter(
+                axes={},
+                params=self.config['plotter']
+            )
+            if ys is None:
+                plotter.update(
+                    vs=np.transpose(V) if np.ndim(V) > 1 else V,
+                    xs=xs
+                )
+            else:
+                plotter.update(
+                    vs=V[..., 0] if np.ndim(V) > 2 else V,
+                    xs=xs,
+                    ys=ys
+                )
+            plt.savefig(file_path + '.temp.png')
+            plt.close('all')
+            os.replace(file_path + '.temp.png', file_path)
+
+        # save next to the data file
+        shutil.copyfile(file_path, self.file_path[:-4] + '.png')
+
+        return self.file_path[:-4] + '.png'
+
+    def run(self):
+        """Method to run all stages, reusing the stored outputs of the unchanged stages.
+
+        Returns
+        -------
+        file_path : str
+            Path of the data file.
+        V : numpy.ndarray
+            Averaged values of the measures.
+        """
+
+        # ensure cache directory
+        os.makedirs(self.params['cache_dir'], exist_ok=True)
+
+        V = self.run_aggregate()
+        self.run_plot(V)
+
+        return self.file_path, V
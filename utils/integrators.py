@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Module containing exponential integrators for the coupled QOM systems."""
+
+__authors__ = ["Sampreet Kalita"]
+__toolbox__ = 'qom-v1.0.1'
+__created__ = "2026-10-18"
+__updated__ = "2026-10-18"
+
+# dependencies
+import numpy as np
+import scipy.linalg as sl
+
+def get_phi_functions(Z, order=3):
+    r"""Function to obtain the matrix exponential and the :math:`\varphi`-functions of a matrix.
+
+    The functions :math:`\varphi_{k} (Z) = \sum_{j} Z^{j} / (j + k)!` are obtained from the exponential of the augmented matrix :math:`\left[ \left[ Z, I, 0 \right], \left[ 0, 0, I \right], \left[ 0, 0, 0 \right] \right]`, which remains accurate for eigenvalues close to zero.
+
+    Parameters
+    ----------
+    Z : numpy.ndarray
+        Square matrix.
+    order : int, optional
+        Highest order of the :math:`\varphi`-functions. Default is :math:`3`.
+
+    Returns
+    -------
+    phis : list
+        Matrix exponential followed by the :math:`\varphi`-functions, in the format :math:`\left[ e^{Z}, \varphi_{1} (Z), ..., \varphi_{order} (Z) \right]`.
+    """
+
+    # augmented matrix
+    dim = Z.shape[0]
+    M = np.zeros(((order + 1) * dim, (order + 1) * dim), dtype=Z.dtype)
+    M[:dim, :dim] = Z
+    for k in range(order):
+        M[k * dim:(k + 1) * dim, (k + 1) * dim:(k + 2) * dim] = np.eye(dim)
+
+    # exponential of augmented matrix
+    E = sl.expm(M)
+
+    return [E[:dim, k * dim:(k + 1) * dim] for k in range(order + 1)]
+
+class ETDRK4():
+    r"""Class to integrate semi-linear ODEs with the fourth-order exponential time-differencing Runge-Kutta scheme.
+
+    The ODE is formatted as :math:`\dot{y} = L y + f_{0} + N(t, y)`, where the linear part :math:`L` and the constant forcing :math:`f_{0}` are propagated exactly and only the nonlinear part :math:`N` is integrated numerically, following the scheme of Cox and Matthews.
+    The propagators are precomputed once for a given step size in double precision and stored in the precision of the constant forcing.
+
+    Parameters
+    ----------
+    L : numpy.ndarray
+        Linear operator.
+    f_0 : numpy.ndarray
+        Constant forcing.
+    func_N : callable
+        Nonlinear part, formatted as ``func_N(t, y)``.
+    h : float
+        Step size.
+    """
+
+    def __init__(self, L, f_0, func_N, h):
+        """Class constructor for ETDRK4."""
+
+        # set attributes
+        self.f_0 = f_0
+        self.func_N = func_N
+        self.h = h
+
+        # propagators for the full and half steps
+        L = np.asarray(L, dtype=np.float64)
+        dtype = np.asarray(f_0).dtype
+        self.E, phi_1, phi_2, phi_3 = get_phi_functions(h * L, order=3)
+        self.E_2, phi_1_2 = get_phi_functions(h * L / 2.0, order=1)
+        self.Q = h / 2.0 * phi_1_2
+        # coefficients of the final stage
+        self.f_1 = h * (phi_1 - 3.0 * phi_2 + 4.0 * phi_3)
+        self.f_2 = h * 2.0 * (phi_2 - 2.0 * phi_3)
+        self.f_3 = h * (- phi_2 + 4.0 * phi_3)
+        # update precision
+        self.E, self.E_2, self.Q, self.f_1, self.f_2, self.f_3 = [item.astype(dtype) for item in [self.E, self.E_2, self.Q, self.f_1, self.f_2, self.f_3]]
+
+    def step(self, t, y):
+        """Method to advance the state by a single step.
+
+        Parameters
+        ----------
+        t : float
+            Current time.
+        y : numpy.ndarray
+            Current state.
+
+        Returns
+        -------
+        y : numpy.ndarray
+            State after a single step.
+        """
+
+        # stages
+        N_y = self.func_N(t, y) + self.f_0
+        E_2_y = self.E_2.dot(y)
+        a = E_2_y + self.Q.dot(N_y)
+        N_a = self.func_N(t + self.h / 2.0, a) + self.f_0
+        b = E_2_y + self.Q.dot(N_a)
+        N_b = self.func_N(t + self.h / 2.0, b) + self.f_0
+        c = self.E_2.dot(a) + self.Q.dot(2.0 * N_b - N_y)
+        N_c = self.func_N(t + self.h, c) + self.f_0
+
+        return self.E.dot(y) + self.f_1.dot(N_y) + self.f_2.dot(N_a + N_b) + self.f_3.dot(N_c)
+
+    def integrate(self, T, y_0):
+        """Method to integrate the state over a grid of times.
+
+        The spacings of the grid should be integer multiples of the step size.
+
+        Parameters
+        ----------
+        T : numpy.ndarray
+            Times.
+        y_0 : numpy.ndarray
+            State at the first time.
+
+        Returns
+        -------
+        Ys : numpy.ndarray
+            States at all times.
+        """
+
+        # number of steps between consecutive times
+        num_steps = np.round(np.diff(T) / self.h).astype(int)
+
+        # integrate
+        Ys = np.zeros((len(T), len(y_0)), dtype=y_0.dtype)
+        Ys[0] = y = y_0
+        for i in range(1, len(T)):
+            t = T[i - 1]
+            for _ in range(num_steps[i - 1]):
+                y = self.step(t, y)
+                t += self.h
+            Ys[i] = y
+
+        return Ys
@@ -0,0 +1,671 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Module to run parameter sweeps of the coupled QOM systems from configurations."""
+
+__authors__ = ["Sampreet Kalita"]
+__toolbox__ = 'qom-v1.0.1'
+__created__ = "2026-10-18"
+__updated__ = "2026-10-19"
+
+# dependencies
+from concurrent.futures import as_completed, ProcessPoolExecutor
+import copy
+import hashlib
+import json
+import logging
+import numpy as np
+import os
+import time
+
+# module logger
+logger = logging.getLogger(__name__)
+
+# default configuration of the sweeps
+sweep_defaults = {
+    'system_name'   : 'Bi_00',
+    'looper'        : {
+        'file_path_prefix'  : 'data/v3.0_qom-v1.0.1/sweep'
+    },
+    'solver'        : {
+        'measure_codes' : ['sync_p'],
+        'indices'       : [1, 3],
+        'ode_method'    : 'vode'
+    },
+    'system'        : {}
+}
+
+def load_file(file_path):
+    """Function to load a configuration from a JSON or YAML file.
+
+    Parameters
+    ----------
+    file_path : str
+        Path of the configuration file.
+
+    Returns
+    -------
+    config : dict
+        Loaded configuration.
+    """
+
+    with open(file_path, 'r') as file:
+        if os.path.splitext(file_path)[1] in ['.yaml', '.yml']:
+            # dependencies
+            import yaml
+
+            return yaml.safe_load(file)
+
+        return json.load(file)
+
+def get_config(file_path):
+    """Function to load the configuration of a sweep from a JSON or YAML file.
+
+    The configuration follows the parameters of the scripts, with the keys ``'system_name'`` (name of the class in :mod:`systems`), ``'looper'`` (``'file_path_prefix'`` and the axes ``'X'`` and optionally ``'Y'``, each with ``'var'``, ``'min'``, ``'max'`` and ``'dim'``), ``'solver'`` and ``'system'``.
+
+    Parameters
+    ----------
+    file_path : str
+        Path of the configuration file.
+
+    Returns
+    -------
+    config : dict
+        Configuration of the sweep updated over the defaults.
+    """
+
+    # update defaults
+    config = copy.deepcopy(sweep_defaults)
+    for key, value in load_file(file_path).items():
+        if type(value) is dict and key in config:
+            config[key].update(value)
+        else:
+            config[key] = value
+    assert 'X' in config['looper'], 'Configuration should contain the axis ``X`` of the looper'
+
+    return config
+
+def get_axes(params_looper):
+    """Function to obtain the values of the axes of a sweep.
+
+    Parameters
+    ----------
+    params_looper : dict
+        Parameters of the looper.
+
+    Returns
+    -------
+    axes : list
+        Axes of the sweep, in the format ``[(var, values), ...]``, ordered as ``X`` followed by ``Y``.
+    """
+
+    return [(params_looper[axis]['var'], np.linspace(params_looper[axis]['min'], params_looper[axis]['max'], params_looper[axis]['dim'])) for axis in ['X', 'Y'] if axis in params_looper]
+
+def get_file_path(params_looper):
+    """Function to obtain the path of the data file of a sweep following the format of the loopers.
+
+    Parameters
+    ----------
+    params_looper : dict
+        Parameters of the looper.
+
+    Returns
+    -------
+    file_path : str
+        Path of the ``.npz`` file.
+    """
+
+    return params_looper['file_path_prefix'] + ''.join(['_{}={}_{}_{}_{}'.format(axis.lower(), params_looper[axis]['var'], params_looper[axis]['min'], params_looper[axis]['max'], params_looper[axis]['dim']) for axis in ['X', 'Y'] if axis in params_looper]) + '.npz'
+
+def get_config_hash(config):
+    """Function to obtain the hash of the parts of the configuration of a sweep or an ensemble which determine its values.
+
+    Parameters
+    ----------
+    config : dict
+        Configuration of the sweep or the ensemble, whose axes are read from the key ``'looper'`` if present.
+
+    Returns
+    -------
+    config_hash : str
+        Hash of the name of the system, the axes and the parameters of the solver and the system.
+    """
+
+    # canonical representation
+    text = json.dumps([config['system_name'], {axis: config['looper'][axis] for axis in ['X', 'Y'] if axis in config.get('looper', {})}, config['solver'], config['system']], sort_keys=True, default=str)
+
+    return hashlib.sha1(text.encode()).hexdigest()
+
+def save_partial(file_path, **arrays):
+    """Function to atomically rewrite the partial file of a sweep or an ensemble.
+
+    The arrays are written to a temporary file, which then replaces the partial file, such that an interruption never leaves a truncated file.
+
+    Parameters
+    ----------
+    file_path : str
+        Path of the ``.npz`` file.
+    arrays : dict
+        Arrays to save, formatted as ``{name: array}``.
+    """
+
+    with open(file_path + '.temp', 'wb') as file:
+        np.savez(file, **arrays)
+    os.replace(file_path + '.temp', file_path)
+
+def get_system_params(system_params, keys, point):
+    """Function to obtain the parameters of a system at a point of a sweep.
+
+    The key ``'n_ths'`` sets the same thermal occupancy for all mechanical modes.
+
+    Parameters
+    ----------
+    system_params : dict
+        Parameters of the system.
+    keys : list
+        Keys of the swept parameters.
+    point : numpy.ndarray
+        Values of the swept parameters, in the order of the keys.
+
+    Returns
+    -------
+    system_params : dict
+        Updated parameters of the system.
+    """
+
+    system_params = copy.deepcopy(system_params)
+    for i, key in enumerate(keys):
+        system_params[key] = [float(point[i])] * len(system_params.get('n_ths', [0.0, 0.0])) if key == 'n_ths' else float(point[i])
+
+    return system_params
+
+def get_value(system_name, params_solver, system_params):
+    """Function to obtain the averaged measures of a system at a single point.
+
+    The window of the trajectory is integrated once and shared through :func:`utils.caches.get_modes_corrs`.
+    If ``'floquet'`` is set in the solver parameters, the window is instead replaced by one period of the periodic correlations on the limit cycle obtained with :class:`utils.floquet.FloquetSolver`, falling back to the integration for points without a stable periodic limit cycle.
+    The measures are obtained with :func:`get_measures`.
+
+    Parameters
+    ----------
+    system_name : str
+        Name of the class in :mod:`systems`.
+    params_solver : dict
+        Parameters of the solver and the measures.
+    system_params : dict
+        Parameters of the system.
+
+    Returns
+    -------
+    values : numpy.ndarray
+        Measures averaged over the window of times, in the order of ``'measure_codes'``.
+    """
+
+    # local modules
+    import systems
+    from utils.caches import get_modes_corrs
+    from utils.solvers import get_solver_params
+
+    # select integrator for the current point
+    SystemClass = getattr(systems, system_name)
+    params_solver = get_solver_params(
+        system=SystemClass(
+            params=system_params
+        ),
+        params=params_solver
+    )
+
+    # periodic correlations on the limit cycle
+    Modes = None
+    if params_solver.get('floquet', False):
+        # local modules
+        from utils.floquet import FloquetSolver
+
+        Modes, Corrs = FloquetSolver(
+            system=SystemClass(
+                params=system_params
+            ),
+            params=params_solver
+        ).get_modes_corrs()
+
+    # get cached window
+    if Modes is None:
+        Modes, Corrs = get_modes_corrs(
+            SystemClass=SystemClass,
+            system_params=system_params,
+            params=params_solver
+        )
+
+    return get_measures(Modes, Corrs, params_solver)
+
+def get_thermal_values(system_name, params_solver, system_params, n_ths):
+    """Function to obtain the averaged measures of a system for many thermal occupancies along a single classical trajectory.
+
+    The correlations for all occupancies are superposed from those of a few basis occupancies with :class:`utils.thermal.ThermalSolver`.
+
+    Parameters
+    ----------
+    system_name : str
+        Name of the class in :mod:`systems`.
+    params_solver : dict
+        Parameters of the solver and the measures.
+    system_params : dict
+        Parameters of the system.
+    n_ths : numpy.ndarray
+        Thermal occupancies, each used for all mechanical modes.
+
+    Returns
+    -------
+    values : numpy.ndarray
+        Measures averaged over the window of times for each occupancy, with a trailing axis in the order of ``'measure_codes'``.
+    """
+
+    # local modules
+    import systems
+    from utils.thermal import ThermalSolver
+
+    Modes, Corrs = ThermalSolver(
+        SystemClass=getattr(systems, system_name),
+        system_params=system_params,
+        params=params_solver
+    ).get_modes_corrs(n_ths)
+
+    return np.array([get_measures(Modes, _Corrs, params_solver) for _Corrs in Corrs])
+
+def get_noise_values(system_name, params_solver, system_params, weights, iv_corrs=None):
+    """Function to obtain the averaged measures of a system for many reweightings of the components of its noise matrix along a single classical trajectory.
+
+    The correlations driven by each component are integrated once with :class:`utils.noises.NoiseSolver` and combined for each reweighting.
+
+    Parameters
+    ----------
+    system_name : str
+        Name of the class in :mod:`systems`.
+    params_solver : dict
+        Parameters of the solver and the measures.
+    system_params : dict
+        Parameters of the system.
+    weights : list
+        Weights of the components superseding those of the system for each reweighting, formatted as ``[{name: weight}, ...]``.
+    iv_corrs : list, optional
+        Initial values of the quantum correlations for each reweighting. Default is ``None`` for those of the reweighted components (see :meth:`utils.noises.NoiseSolver.get_iv_corrs`).
+
+    Returns
+    -------
+    values : numpy.ndarray
+        Measures averaged over the window of times for each reweighting, with a trailing axis in the order of ``'measure_codes'``.
+    """
+
+    # local modules
+    import systems
+    from utils.noises import NoiseSolver
+
+    solver = NoiseSolver(
+        system=getattr(systems, system_name)(
+            params=system_params
+        ),
+        params=params_solver
+    )
+
+    iv_corrs = iv_corrs if iv_corrs is not None else [None] * len(weights)
+
+    return np.array([get_measures(*solver.get_modes_corrs(weights[k], iv_corrs[k]), params_solver) for k in range(len(weights))])
+
+def get_measures(Modes, Corrs, params_solver):
+    """Function to obtain the measures averaged over a window of the classical modes and quantum correlations.
+
+    The quantum phase synchronization is obtained locally with :func:`utils.measures.get_sync_p` and the other measures with :class:`qom.solvers.measure.QCMSolver`.
+
+    Parameters
+    ----------
+    Modes : numpy.ndarray
+        Classical modes in the window.
+    Corrs : numpy.ndarray
+        Quantum correlations in the window.
+    params_solver : dict
+        Parameters of the solver and the measures.
+
+    Returns
+    -------
+    values : numpy.ndarray
+        Measures averaged over the window of times, in the order of ``'measure_codes'``.
+    """
+
+    # local modules
+    from utils.measures import get_average, get_sync_p
+
+    # local measures
+    values = dict()
+    if 'sync_p' in params_solver['measure_codes']:
+        values['sync_p'] = get_average(get_sync_p(Modes, Corrs, params_solver.get('indices', [1, 3])))
+
+    # measures of the toolbox
+    measure_codes = [measure_code for measure_code in params_solver['measure_codes'] if measure_code not in values]
+    if len(measure_codes) > 0:
+        # qom modules
+        from qom.solvers.measure import QCMSolver
+
+        Measures = QCMSolver(
+            Modes=Modes,
+            Corrs=Corrs,
+            params=dict(params_solver, measure_codes=measure_codes)
+        ).get_measures()
+        values.update(zip(measure_codes, get_average(Measures)))
+
+    return np.array([values[measure_code] for measure_code in params_solver['measure_codes']])
+
+def get_stability_map(config, cb_update=None):
+    """Function to classify the points of a sweep by the linear stability of their fixed points.
+
+    Parameters
+    ----------
+    config : dict
+        Configuration of the sweep (see :func:`get_config`).
+    cb_update : callable, optional
+        Callback function to update progress, formatted as ``cb_update(num_done, num_points)``.
+
+    Returns
+    -------
+    labels : numpy.ndarray
+        Indices of the classes in :obj:`utils.equilibria.stability_labels`, in the format of the loopers as ``labels[y_index][x_index]``.
+    Modes : numpy.ndarray
+        Classical modes at the fixed points of the stable points, in the format of the loopers with a trailing axis for the modes, and ``nan`` elsewhere.
+    """
+
+    # local modules
+    import systems
+    from utils.equilibria import get_stability, stability_labels
+
+    # extract frequently used variables
+    axes = get_axes(config['looper'])
+    keys = [axis[0] for axis in axes]
+    grids = np.meshgrid(*[axis[1] for axis in axes[::-1]], indexing='ij')[::-1]
+    points = np.stack([grid.ravel() for grid in grids], axis=-1)
+    SystemClass = getattr(systems, config['system_name'])
+
+    labels = np.zeros(len(points), dtype=np.int64)
+    Modes = None
+    for idx, point in enumerate(points):
+        system_params = get_system_params(config['system'], keys, point)
+        system = SystemClass(
+            params=system_params
+        )
+        label, branches = get_stability(system)
+        labels[idx] = stability_labels.index(label)
+        if Modes is None:
+            Modes = np.full((len(points), system.num_modes), np.nan, dtype=np.complex128)
+        if label == 'stable':
+            Modes[idx] = branches[0]['modes']
+        if cb_update is not None:
+            cb_update(idx + 1, len(points))
+
+    # format of the loopers
+    shape = tuple(len(axis[1]) for axis in axes[::-1])
+
+    return labels.reshape(shape), Modes.reshape(shape + (Modes.shape[-1], ))
+
+def get_steady_values(config, points, Modes):
+    """Function to obtain the measures at many stable points of a sweep from their fixed points without integration.
+
+    The quantum correlations of all points are obtained from a single batched solution of the Lyapunov equations (see :func:`utils.equilibria.get_steady_corrs_batch`), such that the measures are constant in time.
+    The quantum phase synchronization is obtained for all points at once with :func:`utils.measures.get_sync_p` and the other measures with :class:`qom.solvers.measure.QCMSolver` at each point.
+
+    Parameters
+    ----------
+    config : dict
+        Configuration of the sweep (see :func:`get_config`).
+    points : numpy.ndarray
+        Values of the swept parameters at the points, in the order of the axes.
+    Modes : numpy.ndarray
+        Classical modes at the stable fixed points of the points.
+
+    Returns
+    -------
+    values : numpy.ndarray
+        Measures at the points, with a trailing axis in the order of ``'measure_codes'``.
+    """
+
+    # local modules
+    import systems
+    from utils.equilibria import get_steady_corrs_batch
+    from utils.measures import get_sync_p
+
+    # extract frequently used variables
+    keys = [axis[0] for axis in get_axes(config['looper'])]
+    params_solver = config['solver']
+    SystemClass = getattr(systems, config['system_name'])
+
+    # drift and noise matrices at the fixed points
+    As, Ds = list(), list()
+    for k, point in enumerate(points):
+        system_params = get_system_params(config['system'], keys, point)
+        system = SystemClass(
+            params=system_params
+        )
+        _, iv_corrs, c = system.get_ivc()
+        As.append(np.array(system.get_A(Modes[k], c, 0.0), dtype=np.float64))
+        Ds.append(np.array(system.get_D(Modes[k], iv_corrs, c, 0.0), dtype=np.float64))
+    Corrs = get_steady_corrs_batch(np.array(As), np.array(Ds))
+
+    # local measures
+    values = dict()
+    if 'sync_p' in params_solver['measure_codes']:
+        values['sync_p'] = get_sync_p(Modes, Corrs, params_solver.get('indices', [1, 3]))
+
+    # measures of the toolbox
+    measure_codes = [measure_code for measure_code in params_solver['measure_codes'] if measure_code not in values]
+    if len(measure_codes) > 0:
+        # qom modules
+        from qom.solvers.measure import QCMSolver
+
+        Measures = np.array([QCMSolver(
+            Modes=Modes[k:k + 1],
+            Corrs=Corrs[k:k + 1],
+            params=dict(params_solver, measure_codes=measure_codes)
+        ).get_measures()[0] for k in range(len(points))])
+        values.update(zip(measure_codes, np.transpose(Measures)))
+
+    return np.stack([values[measure_code] for measure_code in params_solver['measure_codes']], axis=-1)
+
+def _run_chunk(args):
+    # evaluate the points of a chunk
+    system_name, params_solver, system_params, keys, points, idxs = args
+    t_start = time.time()
+
+    # thermal occupancies along a single trajectory
+    if 'n_ths' in keys:
+        k = keys.index('n_ths')
+        values = get_thermal_values(system_name, params_solver, get_system_params(system_params, keys[:k] + keys[k + 1:], np.delete(points[0], k)), points[:, k])
+        return idxs, values, (os.getpid(), t_start, time.time())
+
+    values = list()
+    for point in points:
+        values.append(np.atleast_1d(get_value(system_name, params_solver, get_system_params(system_params, keys, point))))
+    return idxs, np.array(values), (os.getpid(), t_start, time.time())
+
+def run_sweep(config, num_workers=1, chunk_size=None, resume=False, cb_update=None, monitor=None, symmetry=None, num_samples=4, rtol=1e-2, prepass=False):
+    """Function to run a sweep over one or two system parameters.
+
+    The points are split into chunks evaluated in parallel processes.
+    After each chunk, the values are atomically saved to a partial file next to the data file, from which an interrupted sweep with the same configuration can be resumed.
+    The completed values are saved in the format of the loopers, as ``values[y_index][x_index]`` with a trailing axis for multiple measures.
+    With a monitor, the progress and partial results are streamed while the sweep runs, and an abort requested by its clients stops the sweep while keeping the partial file.
+    With a symmetry declared by the system (see :func:`utils.symmetries.get_mirror`), a few sampled points and their images are evaluated first.
+    If their values agree within ``rtol``, only the independent points are evaluated and the rest are reconstructed from them, otherwise all points are evaluated.
+    With the pre-pass, the points are first classified by :func:`get_stability_map`, and the stable points are evaluated at once by :func:`get_steady_values` instead of the integration.
+    The classes are saved next to the data file, with the suffix ``_stability`` before its extension, with the indices of the classes in ``labels`` (in the format of the loopers) and their names in ``names``.
+    Sweeps of ``'n_ths'`` evaluate all occupancies of each point of the other parameters in a single chunk along one classical trajectory (see :func:`get_thermal_values`).
+
+    Parameters
+    ----------
+    config : dict
+        Configuration of the sweep (see :func:`get_config`).
+    num_workers : int, optional
+        Number of parallel processes. Default is :math:`1`.
+    chunk_size : int, optional
+        Number of points in each chunk. Default is the number of points divided among the workers.
+    resume : bool, optional
+        Option to resume from the partial file, which should have been saved with the same system, axes and parameters. Default is ``False``.
+    cb_update : callable, optional
+        Callback function to update progress, formatted as ``cb_update(num_done, num_points)``.
+    monitor : :class:`utils.monitors.SweepMonitor`, optional
+        Monitor to stream the progress and the partial results.
+    symmetry : str, optional
+        Name of the symmetry of the system to reduce the sweep. Default is ``None`` for no reduction.
+    num_samples : int, optional
+        Number of points sampled to verify the symmetry. Default is :math:`4`.
+    rtol : float, optional
+        Maximum relative deviation of the sampled points from their images. Default is :math:`10^{-2}`.
+    prepass : bool, optional
+        Option to evaluate the stable points without integration. Default is ``False``.
+
+    Returns
+    -------
+    file_path : str
+        Path of the data file.
+    V : numpy.ndarray
+        Values of the measures, or ``None`` if the sweep was aborted.
+    """
+
+    # extract frequently used variables
+    axes = get_axes(config['looper'])
+    keys = [axis[0] for axis in axes]
+    grids = np.meshgrid(*[axis[1] for axis in axes[::-1]], indexing='ij')[::-1]
+    points = np.stack([grid.ravel() for grid in grids], axis=-1)
+    file_path = get_file_path(config['looper'])
+    file_path_partial = file_path[:-4] + '_partial.npz'
+    config_hash = get_config_hash(config)
+    chunk_size = chunk_size if chunk_size is not None else max(1, int(np.ceil(len(points) / max(1, num_workers) / 4)))
+
+    # images of the points under the symmetry
+    mirror = None
+    stages = [np.arange(len(points))]
+    if symmetry is not None:
+        # local modules
+        import systems
+        from utils.symmetries import get_mirror, get_representatives, get_samples, get_symmetry_error
+
+        mirror = get_mirror(
+            SystemClass=getattr(systems, config['system_name']),
+            name=symmetry,
+            system_params=config['system'],
+            axes=axes,
+            measure_codes=config['solver']['measure_codes'],
+            indices=config['solver'].get('indices', [1, 3])
+        )
+        samples = get_samples(mirror, num_samples)
+        stages = [np.union1d(samples, mirror[samples]), get_representatives(mirror)]
+        logger.info('Reducing {} points to {} independent points under the symmetry {}\n'.format(len(points), len(stages[1]), symmetry))
+
+    # resume completed points
+    values, done = None, np.zeros(len(points), dtype=bool)
+    if resume and os.path.isfile(file_path_partial):
+        partial = np.load(file_path_partial)
+        assert 'config_hash' in partial and str(partial['config_hash']) == config_hash, 'Partial file ``{}`` was saved with a different configuration and cannot be resumed'.format(file_path_partial)
+        values, done = partial['values'], partial['done']
+        logger.info('Resuming {} with {} of {} points\n'.format(file_path, int(np.sum(done)), len(points)))
+    os.makedirs(os.path.dirname(file_path) or '.', exist_ok=True)
+
+    # stable points without integration
+    steady = np.zeros(len(points), dtype=bool)
+    if prepass:
+        # local modules
+        from utils.equilibria import stability_labels
+
+        labels, Modes_steady = get_stability_map(config)
+        np.savez_compressed(file_path[:-4] + '_stability.npz', labels=labels, names=np.array(stability_labels))
+        steady = labels.ravel() == stability_labels.index('stable')
+        Modes_steady = Modes_steady.reshape((len(points), -1))
+        logger.info('Classified {} points as {}\n'.format(len(points), ', '.join(['{} {}'.format(int(np.sum(labels == i)), label) for i, label in enumerate(stability_labels)])))
+
+    def update(idxs, _values, info):
+        nonlocal values
+        if values is None:
+            values = np.full((len(points), _values.shape[1]), np.nan, dtype=np.float64)
+        values[idxs] = _values
+        done[idxs] = True
+        save_partial(file_path_partial, values=values, done=done, config_hash=config_hash)
+        if monitor is not None:
+            monitor.update(idxs, _values, info)
+        if cb_update is not None:
+            cb_update(int(np.sum(done)), len(points))
+
+    # start monitor
+    if monitor is not None:
+        monitor.start(
+            num_workers=num_workers,
+            values=values,
+            done=done
+        )
+    aborted = lambda: monitor is not None and monitor.aborted.is_set()
+
+    def evaluate(idxs):
+        # chunks of pending points
+        pending = idxs[~ done[idxs]]
+        chunks = [pending[i:i + chunk_size] for i in range(0, len(pending), chunk_size)]
+        if 'n_ths' in keys:
+            # thermal occupancies of each point of the other parameters
+            others = np.delete(points[pending], keys.index('n_ths'), axis=1)
+            _, groups = np.unique(others, axis=0, return_inverse=True)
+            chunks = [pending[groups.ravel() == i] for i in range(int(np.max(groups, initial=-1)) + 1)]
+        args = [(config['system_name'], config['solver'], config['system'], keys, points[_idxs], _idxs) for _idxs in chunks]
+
+        # evaluate chunks
+        if num_workers > 1:
+            with ProcessPoolExecutor(max_workers=num_workers) as executor:
+                futures = [executor.submit(_run_chunk, arg) for arg in args]
+                for future in as_completed(futures):
+                    update(*future.result())
+                    if aborted():
+                        for _future in futures:
+                            _future.cancel()
+                        break
+        else:
+            for arg in args:
+                update(*_run_chunk(arg))
+                if aborted():
+                    break
+
+    try:
+        # stable points at once
+        idxs = np.flatnonzero(steady & ~ done)
+        if len(idxs) > 0:
+            update(idxs, get_steady_values(config, points[idxs], Modes_steady[idxs]), None)
+
+        for i in range(len(stages)):
+            evaluate(stages[i])
+            if aborted():
+                break
+
+            # verify the symmetry on the sampled points
+            if mirror is not None and i == 0:
+                error = get_symmetry_error(values, mirror, samples) if len(samples) > 0 else 0.0
+                if error > rtol:
+                    logger.warning('Rejected the symmetry {} with relative deviation {:.2e} above {:.2e}, evaluating all points\n'.format(symmetry, error, rtol))
+                    mirror = None
+                    stages[1] = np.arange(len(points))
+                else:
+                    logger.info('Verified the symmetry {} with relative deviation {:.2e} on {} points\n'.format(symmetry, error, len(samples)))
+
+        # reconstruct the images
+        if mirror is not None and not aborted():
+            idxs = stages[1][mirror[stages[1]] != stages[1]]
+            update(mirror[idxs], values[idxs], None)
+    finally:
+        if monitor is not None:
+            monitor.stop()
+
+    # keep partial results of an aborted sweep
+    if not np.all(done):
+        logger.warning('Aborted {} with {} of {} points, which can be resumed\n'.format(file_path, int(np.sum(done)), len(points)))
+        return file_path, None
+
+    # save in the format of the loopers
+    V = values.reshape(tuple(len(axis[1]) for axis in axes[::-1]) + (values.shape[1], ))
+    if V.shape[-1] == 1:
+        V = V[..., 0]
+    np.savez_compressed(file_path, V)
+    os.remove(file_path_partial)
+    logger.info('Saved {}\n'.format(file_path))
+
+    return file_path, V
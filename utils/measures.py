@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Module to obtain the measures of the coupled QOM systems."""
+
+__authors__ = ["Sampreet Kalita"]
+__toolbox__ = 'qom-v1.0.1'
+__created__ = "2026-10-18"
+__updated__ = "2026-10-19"
+
+# dependencies
+import numpy as np
+
+def get_average(values, axis=0):
+    """Function to obtain the long-time average of a measure with double-precision accumulation.
+
+    The values are accumulated in double precision with pairwise summation, so that averages over windows of single-precision values retain the accuracy of double precision.
+
+    Parameters
+    ----------
+    values : numpy.ndarray
+        Values of the measure at all times.
+    axis : int, optional
+        Axis of the times. Default is :math:`0`.
+
+    Returns
+    -------
+    average : numpy.ndarray
+        Average of the measure.
+    """
+
+    return np.mean(values, axis=axis, dtype=np.result_type(np.asarray(values).dtype, np.float64))
+
+def get_sync_p(Modes, Corrs, indices=[1, 3]):
+    r"""Function to obtain the quantum phase synchronization between two modes at all times.
+
+    The measure is defined as :math:`S_{p} = \frac{1}{2} \langle P_{-}^{\prime 2} \rangle^{-1}`, where :math:`P_{-}^{\prime} = \left( P_{i}^{\prime} - P_{j}^{\prime} \right) / \sqrt{2}` and :math:`P_{k}^{\prime} = - \sin \phi_{k} Q_{k} + \cos \phi_{k} P_{k}` are the momentum quadratures rotated by the phases :math:`\phi_{k}` of the classical modes.
+
+    Parameters
+    ----------
+    Modes : numpy.ndarray
+        Classical modes at all times.
+    Corrs : numpy.ndarray
+        Quantum correlations at all times.
+    indices : list, optional
+        Indices of the two modes. Default is :math:`\left[ 1, 3 \right]`.
+
+    Returns
+    -------
+    sync_p : numpy.ndarray
+        Quantum phase synchronization at all times.
+    """
+
+    # extract frequently used variables
+    i, j = indices
+    phis_i = np.angle(Modes[:, i])
+    phis_j = np.angle(Modes[:, j])
+    sin_i, cos_i = np.sin(phis_i), np.cos(phis_i)
+    sin_j, cos_j = np.sin(phis_j), np.cos(phis_j)
+
+    # rotated momentum correlations
+    corrs_P_p_ii = sin_i**2 * Corrs[:, 2*i, 2*i] - sin_i * cos_i * (Corrs[:, 2*i, 2*i + 1] + Corrs[:, 2*i + 1, 2*i]) + cos_i**2 * Corrs[:, 2*i + 1, 2*i + 1]
+    corrs_P_p_jj = sin_j**2 * Corrs[:, 2*j, 2*j] - sin_j * cos_j * (Corrs[:, 2*j, 2*j + 1] + Corrs[:, 2*j + 1, 2*j]) + cos_j**2 * Corrs[:, 2*j + 1, 2*j + 1]
+    corrs_P_p_ij = sin_i * sin_j * Corrs[:, 2*i, 2*j] - sin_i * cos_j * Corrs[:, 2*i, 2*j + 1] - cos_i * sin_j * Corrs[:, 2*i + 1, 2*j] + cos_i * cos_j * Corrs[:, 2*i + 1, 2*j + 1]
+
+    return 0.5 / (0.5 * (corrs_P_p_ii + corrs_P_p_jj) - corrs_P_p_ij)
+
+def get_sync_p_grad(Modes, Corrs, Modes_grad, Corrs_grad, indices=[1, 3]):
+    r"""Function to obtain the derivatives of the quantum phase synchronization with respect to a parameter at all times.
+
+    The derivatives follow from those of the classical modes and the quantum correlations (see :func:`get_sync_p`), where the phases change as :math:`\partial \phi_{k} = \mathrm{Im} \left( \partial \beta_{k} / \beta_{k} \right)`.
+
+    Parameters
+    ----------
+    Modes : numpy.ndarray
+        Classical modes at all times.
+    Corrs : numpy.ndarray
+        Quantum correlations at all times.
+    Modes_grad : numpy.ndarray
+        Derivatives of the classical modes at all times.
+    Corrs_grad : numpy.ndarray
+        Derivatives of the quantum correlations at all times.
+    indices : list, optional
+        Indices of the two modes. Default is :math:`\left[ 1, 3 \right]`.
+
+    Returns
+    -------
+    sync_p_grad : numpy.ndarray
+        Derivatives of the quantum phase synchronization at all times.
+    """
+
+    # extract frequently used variables
+    i, j = indices
+    phis = np.angle(Modes[:, [i, j]])
+    phis_grad = np.imag(Modes_grad[:, [i, j]] / Modes[:, [i, j]])
+    # rotated momentum directions and their conjugates
+    vs = np.stack((- np.sin(phis), np.cos(phis)), axis=-1)
+    us = np.stack((np.cos(phis), np.sin(phis)), axis=-1)
+
+    # blocks of the correlations
+    blocks = lambda C, k, l: C[:, 2*k:2*k + 2, 2*l:2*l + 2]
+    quad = lambda a, C, b: np.einsum('ta,tab,tb->t', a, C, b)
+
+    # rotated momentum correlations
+    corrs_P_p_ii = quad(vs[:, 0], blocks(Corrs, i, i), vs[:, 0])
+    corrs_P_p_jj = quad(vs[:, 1], blocks(Corrs, j, j), vs[:, 1])
+    corrs_P_p_ij = quad(vs[:, 0], blocks(Corrs, i, j), vs[:, 1])
+    # their derivatives
+    corrs_P_p_ii_grad = quad(vs[:, 0], blocks(Corrs_grad, i, i), vs[:, 0]) - 2.0 * phis_grad[:, 0] * quad(us[:, 0], blocks(Corrs, i, i), vs[:, 0])
+    corrs_P_p_jj_grad = quad(vs[:, 1], blocks(Corrs_grad, j, j), vs[:, 1]) - 2.0 * phis_grad[:, 1] * quad(us[:, 1], blocks(Corrs, j, j), vs[:, 1])
+    corrs_P_p_ij_grad = quad(vs[:, 0], blocks(Corrs_grad, i, j), vs[:, 1]) - phis_grad[:, 0] * quad(us[:, 0], blocks(Corrs, i, j), vs[:, 1]) - phis_grad[:, 1] * quad(vs[:, 0], blocks(Corrs, i, j), us[:, 1])
+
+    # variance of the momentum difference
+    var = 0.5 * (corrs_P_p_ii + corrs_P_p_jj) - corrs_P_p_ij
+    var_grad = 0.5 * (corrs_P_p_ii_grad + corrs_P_p_jj_grad) - corrs_P_p_ij_grad
+
+    return - 0.5 * var_grad / var**2
+
+def get_lyapunov_transverse(system, params, t_span=2000.0, t_renorm=10.0):
+    r"""Function to obtain the largest transverse Lyapunov exponent of the two coupled systems along their classical trajectory.
+
+    The first and second halves of the modes belong to the left and right systems, whose difference :math:`y_{-} = \left( y_{L} - y_{R} \right) / \sqrt{2}` in the real form defines the minus modes (as in :class:`systems.Unidirectional.Uni_01`).
+    The modes are first integrated until the start of the window between ``t_index_min`` and ``t_index_max`` of the solver parameters (or of the last tenth of the times without a window).
+    A perturbation of the minus modes is then propagated with the minus-mode block :math:`J_{--} = \left( J_{LL} - J_{LR} - J_{RL} + J_{RR} \right) / 2` of the Jacobian of the rates of the modes, integrated together with the modes and renormalized after every ``t_renorm``.
+    The exponent is the average logarithmic growth rate :math:`\lambda_{\perp} = \sum \ln \left| \delta y_{-} \right| / t_{span}`, which is negative for synchronized systems and vanishes for uncoupled identical systems, whose phase difference is neutral.
+    The span should extend over many mechanical periods, as the finite-time exponents converge only as :math:`1 / t_{span}`.
+
+    Parameters
+    ----------
+    system : :class:`qom.systems.BaseSystem`
+        Instance of the system, implementing ``get_mode_rates_jac``.
+    params : dict
+        Parameters for the solver.
+    t_span : float, optional
+        Span of the times over which the exponent is averaged. Default is :math:`2000.0`.
+    t_renorm : float, optional
+        Interval of the times between the renormalizations. Default is :math:`10.0`.
+
+    Returns
+    -------
+    lyapunov : float
+        Largest transverse Lyapunov exponent.
+    """
+
+    # dependencies
+    import scipy.integrate as si
+
+    # local modules
+    from utils.solvers import get_relaxed_modes
+
+    # extract frequently used variables
+    Modes, T = get_relaxed_modes(system, params, num_samples=2)
+    c = np.empty(0)
+    dim = 2 * Modes.shape[1]
+    half = dim // 2
+
+    # rates of the modes and the perturbation of the minus modes
+    def func(t, y):
+        modes = y[:dim].view(np.complex128)
+        jac = np.asarray(system.get_mode_rates_jac(modes, c, t))
+        jac_mm = 0.5 * (jac[:half, :half] - jac[:half, half:] - jac[half:, :half] + jac[half:, half:])
+        return np.concatenate((np.asarray(system.get_mode_rates(modes, c, t), dtype=np.complex128).view(np.float64), jac_mm.dot(y[dim:])))
+
+    # initial perturbation along all the minus modes
+    dy = np.ones(half, dtype=np.float64) / np.sqrt(half)
+    y = np.concatenate((Modes[0].view(np.float64), dy))
+
+    # propagate and renormalize
+    log_growth = 0.0
+    num_renorms = max(int(np.ceil(t_span / t_renorm)), 1)
+    for k in range(num_renorms):
+        t_0 = T[0] + k * t_span / num_renorms
+        sol = si.solve_ivp(func, (t_0, t_0 + t_span / num_renorms), y, method='DOP853', atol=1e-9, rtol=1e-7)
+        assert sol.success, 'Integration failed with message ``{}``'.format(sol.message)
+        y = sol.y[:, -1]
+        norm = np.linalg.norm(y[dim:])
+        log_growth += np.log(norm)
+        y[dim:] /= norm
+
+    return log_growth / t_span
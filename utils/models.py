@@ -0,0 +1,320 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Module to generate the kernels of the coupled QOM systems from symbolic model specifications."""
+
+__authors__ = ["Sampreet Kalita"]
+__toolbox__ = 'qom-v1.0.1'
+__created__ = "2026-10-18"
+__updated__ = "2026-10-18"
+
+# dependencies
+import hashlib
+import importlib.util
+import inspect
+import json
+import logging
+import numpy as np
+import os
+
+# module logger
+logger = logging.getLogger(__name__)
+
+# version of the generated code, updated whenever the generator changes
+_generator_version = 1
+
+# default directory of the generated kernels
+kernels_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'systems', 'kernels')
+
+class ModelSpec():
+    r"""Class to specify coupled bosonic modes by their Hamiltonian, losses, couplings, drives and noises.
+
+    The classical modes evolve as :math:`\dot{z}_{k} = - i \partial H / \partial z_{k}^{*} - \kappa_{k} z_{k} + \sum_{l} C_{kl} z_{l} + F_{k}`, where :math:`H` is the Hamiltonian in terms of the modes and their conjugates, :math:`\kappa_{k}` are the loss rates, :math:`C_{kl}` are the non-Hamiltonian (cascaded) couplings and :math:`F_{k}` are the drives.
+    In the real form :math:`y = \left[ \mathrm{Re} z_{0}, \mathrm{Im} z_{0}, ... \right]`, the drift matrix of the quadratures is the Jacobian of the rates and the noise matrix is specified by its entries.
+    The plus-minus modes :math:`\left( z_{k} \pm z_{l} \right) / \sqrt{2}` of each pair of modes replace the modes :math:`z_{k}` and :math:`z_{l}` respectively.
+
+    Parameters
+    ----------
+    name : str
+        Name of the model, used in the names of the generated kernels.
+    modes : list
+        Names of the modes.
+    system_defaults : dict
+        Default values of the system parameters. Each parameter is available as a symbol, and list-valued parameters as a list of symbols.
+    get_terms : callable
+        Module-level function returning the terms of the model, formatted as ``get_terms(p, z, z_c)``, where ``p`` is a dictionary of the symbols of the parameters and ``z`` and ``z_c`` are lists of the symbols of the modes and their conjugates. The returned dictionary has the keys ``'H'`` (Hamiltonian), ``'losses'`` (list of loss rates), ``'drives'`` (list of drives), ``'couplings'`` (dictionary of the non-Hamiltonian couplings, in the format ``{(k, l): C_kl}``), ``'noises'`` (dictionary of the entries of the noise matrix, in the format ``{(i, j): D_ij}`` with the symmetric entries filled automatically) and ``'occupancies'`` (list of the initial occupancies of the modes).
+    pairs : list, optional
+        Pairs of modes combined into plus-minus modes, in the format ``[(k, l), ...]``.
+    """
+
+    def __init__(self, name, modes, system_defaults, get_terms, pairs=None):
+        """Class constructor for ModelSpec."""
+
+        # set attributes
+        self.name = name
+        self.modes = modes
+        self.system_defaults = system_defaults
+        self.get_terms = get_terms
+        self.pairs = pairs
+        self.dim = 2 * len(modes)
+
+        # names of the scalar parameters in the order of the generated kernels
+        self.p_names = list()
+        for key in sorted(system_defaults):
+            value = system_defaults[key]
+            self.p_names += ['{}_{}'.format(key, i) for i in range(len(value))] if type(value) is list else [key]
+
+    def get_key(self):
+        """Method to obtain the key of the generated kernels.
+
+        The key depends only on the definition of the model, so that existing kernels are loaded without :mod:`sympy`.
+
+        Returns
+        -------
+        key : str
+            Hash of the definition.
+        """
+
+        # definition of the model
+        text = json.dumps([_generator_version, self.name, self.modes, sorted(self.system_defaults), self.pairs, inspect.getsource(self.get_terms)], default=str)
+
+        return hashlib.sha1(text.encode()).hexdigest()[:16]
+
+    def get_values(self, params):
+        """Method to obtain the values of the scalar parameters in the order of the generated kernels.
+
+        Parameters
+        ----------
+        params : dict
+            Parameters of the system.
+
+        Returns
+        -------
+        p : numpy.ndarray
+            Values of the scalar parameters.
+        """
+
+        values = list()
+        for key in sorted(self.system_defaults):
+            value = params.get(key, self.system_defaults[key])
+            values += list(value) if type(self.system_defaults[key]) is list else [value]
+
+        return np.array(values, dtype=np.float64)
+
+    def get_expressions(self):
+        """Method to obtain the symbolic expressions of the kernels.
+
+        Returns
+        -------
+        expressions : dict
+            Expressions of the kernels. The keys are ``'mode_rates'`` (rates in the real form), ``'A'`` (drift matrix), ``'A_jac'`` (derivatives of the drift matrix with respect to the real form of the modes), ``'D'`` (noise matrix) and ``'iv_corrs'`` (initial correlations), followed by ``'A_pm'``, ``'A_jac_pm'``, ``'D_pm'`` and ``'iv_corrs_pm'`` for the plus-minus modes.
+        """
+
+        # dependencies
+        import sympy as sp
+
+        # symbols of the parameters
+        p = dict()
+        for key in sorted(self.system_defaults):
+            value = self.system_defaults[key]
+            p[key] = [sp.Symbol('p_{}_{}'.format(key, i), real=True) for i in range(len(value))] if type(value) is list else sp.Symbol('p_' + key, real=True)
+        # symbols of the modes and their conjugates
+        num_modes = len(self.modes)
+        z = [sp.Symbol('z_{}'.format(k)) for k in range(num_modes)]
+        z_c = [sp.Symbol('z_c_{}'.format(k)) for k in range(num_modes)]
+        y = [sp.Symbol('y_{}'.format(i), real=True) for i in range(self.dim)]
+
+        # terms of the model
+        terms = self.get_terms(p, z, z_c)
+        couplings = terms.get('couplings', {})
+        drives = terms.get('drives', [0] * num_modes)
+
+        # rates of the modes
+        rates = [- sp.I * sp.diff(terms['H'], z_c[k]) - terms['losses'][k] * z[k] + sum(couplings.get((k, l), 0) * z[l] for l in range(num_modes)) + drives[k] for k in range(num_modes)]
+
+        # real form
+        subs = {z[k]: y[2 * k] + sp.I * y[2 * k + 1] for k in range(num_modes)}
+        subs.update({z_c[k]: y[2 * k] - sp.I * y[2 * k + 1] for k in range(num_modes)})
+        mode_rates = list()
+        for rate in rates:
+            rate = sp.expand(sp.sympify(rate).subs(subs))
+            mode_rates += [rate.coeff(sp.I, 0), rate.coeff(sp.I, 1)]
+        mode_rates = sp.Matrix(mode_rates)
+
+        # drift matrix and its derivatives
+        A = mode_rates.jacobian(y)
+        A_jac = [sp.expand(A.diff(y[i])) for i in range(self.dim)]
+
+        # noise matrix
+        D = sp.zeros(self.dim, self.dim)
+        for (i, j), value in terms['noises'].items():
+            D[i, j] = value
+            D[j, i] = value
+
+        # initial correlations
+        iv_corrs = sp.diag(*[occupancy + sp.Rational(1, 2) for occupancy in terms['occupancies'] for _ in range(2)])
+
+        expressions = {
+            'mode_rates': mode_rates,
+            'A'         : A,
+            'A_jac'     : A_jac,
+            'D'         : D,
+            'iv_corrs'  : iv_corrs
+        }
+
+        # plus-minus modes
+        if self.pairs is not None:
+            P = sp.eye(self.dim)
+            for k, l in self.pairs:
+                for q in range(2):
+                    P[2 * k + q, 2 * k + q] = P[2 * k + q, 2 * l + q] = P[2 * l + q, 2 * k + q] = 1 / sp.sqrt(2)
+                    P[2 * l + q, 2 * l + q] = - 1 / sp.sqrt(2)
+            expressions.update({
+                'A_pm'          : sp.expand(P * A * P.transpose()),
+                'A_jac_pm'      : [sp.expand(P * A_jac[i] * P.transpose()) for i in range(self.dim)],
+                'D_pm'          : sp.expand(P * D * P.transpose()),
+                'iv_corrs_pm'   : sp.expand(P * iv_corrs * P.transpose())
+            })
+
+        return expressions
+
+def _get_function(name, doc, shape, entries, p_names, dim):
+    # source of a kernel with common subexpressions eliminated
+    # dependencies
+    import sympy as sp
+    from sympy.printing.pycode import pycode
+
+    # eliminate common subexpressions among the non-vanishing entries
+    idxs = [idx for idx in entries if entries[idx] != 0]
+    replacements, reduced = sp.cse([entries[idx] for idx in idxs], symbols=sp.numbered_symbols('x_'))
+
+    lines = [
+        'def get_{}(y, p):'.format(name),
+        '    """{}"""'.format(doc),
+        '',
+        '    # extract frequently used variables',
+        '    {}, = y'.format(', '.join('y_{}'.format(i) for i in range(dim))),
+        '    {}, = p'.format(', '.join('p_' + p_name for p_name in p_names)),
+        ''
+    ]
+    if len(replacements) > 0:
+        lines.append('    # common subexpressions')
+        lines += ['    {} = {}'.format(symbol, pycode(value)) for symbol, value in replacements]
+        lines.append('')
+    lines += [
+        '    # update entries',
+        '    values = np.zeros({}, dtype=np.float64)'.format(shape)
+    ]
+    lines += ['    values[{}] = {}'.format(', '.join(str(i) for i in idx), pycode(value)) for idx, value in zip(idxs, reduced)]
+    lines += [
+        '',
+        '    return values',
+        '',
+        ''
+    ]
+
+    return '\n'.join(lines)
+
+def get_source(spec):
+    """Function to obtain the source of the generated kernels of a model.
+
+    Each kernel is formatted as ``get_<name>(y, p)``, where ``y`` is the real form of the modes and ``p`` is the array of the parameters (see :meth:`ModelSpec.get_values`).
+
+    Parameters
+    ----------
+    spec : :class:`ModelSpec`
+        Specification of the model.
+
+    Returns
+    -------
+    source : str
+        Source of the module of the kernels.
+    """
+
+    # extract frequently used variables
+    dim = spec.dim
+    expressions = spec.get_expressions()
+    docs = {
+        'mode_rates'    : 'Rates of the modes in the real form.',
+        'A'             : 'Drift matrix.',
+        'A_jac'         : 'Derivatives of the drift matrix with respect to the real form of the modes.',
+        'D'             : 'Noise matrix.',
+        'iv_corrs'      : 'Initial correlations.',
+        'A_pm'          : 'Drift matrix of the plus-minus modes.',
+        'A_jac_pm'      : 'Derivatives of the drift matrix of the plus-minus modes with respect to the real form of the modes.',
+        'D_pm'          : 'Noise matrix of the plus-minus modes.',
+        'iv_corrs_pm'   : 'Initial correlations of the plus-minus modes.'
+    }
+
+    # header
+    source = '\n'.join([
+        '# -*- coding: utf-8 -*-',
+        '',
+        '"""Kernels of the model ``{}`` generated by :mod:`utils.models`, not to be edited."""'.format(spec.name),
+        '',
+        '# dependencies',
+        'import math',
+        'import numpy as np',
+        '',
+        '# key of the model',
+        'key = \'{}\''.format(spec.get_key()),
+        '',
+        ''
+    ])
+
+    # kernels
+    for name, expression in expressions.items():
+        if type(expression) is list:
+            entries = {(k, i, j): expression[k][i, j] for k in range(dim) for i in range(dim) for j in range(dim)}
+            shape = (dim, dim, dim)
+        elif expression.shape[1] == 1:
+            entries = {(i, ): expression[i, 0] for i in range(expression.shape[0])}
+            shape = (expression.shape[0], )
+        else:
+            entries = {(i, j): expression[i, j] for i in range(dim) for j in range(dim)}
+            shape = (dim, dim)
+        source += _get_function(name, docs[name], shape, entries, spec.p_names, dim)
+
+    return source.rstrip('\n') + '\n'
+
+def get_kernels(spec, dir_path=None, rebuild=False):
+    """Function to obtain the generated kernels of a model, generating and caching them on disk if required.
+
+    Generating the kernels requires :mod:`sympy`, whereas loading the cached kernels requires only :mod:`numpy`.
+
+    Parameters
+    ----------
+    spec : :class:`ModelSpec`
+        Specification of the model.
+    dir_path : str, optional
+        Directory of the cached kernels. Default is ``systems/kernels``.
+    rebuild : bool, optional
+        Option to regenerate existing kernels. Default is ``False``.
+
+    Returns
+    -------
+    kernels : module
+        Module of the kernels.
+    """
+
+    # extract frequently used variables
+    dir_path = dir_path if dir_path is not None else kernels_dir
+    file_path = os.path.join(dir_path, '{}_{}.py'.format(spec.name, spec.get_key()))
+
+    # generate kernels
+    if rebuild or not os.path.isfile(file_path):
+        logger.info('Generating kernels of {}\n'.format(spec.name))
+        source = get_source(spec)
+        os.makedirs(dir_path, exist_ok=True)
+        # write atomically for parallel processes
+        file_path_temp = '{}.{}.tmp'.format(file_path, os.getpid())
+        with open(file_path_temp, 'w') as file:
+            file.write(source)
+        os.replace(file_path_temp, file_path)
+
+    # load kernels
+    module_spec = importlib.util.spec_from_file_location('kernels_{}'.format(spec.name), file_path)
+    kernels = importlib.util.module_from_spec(module_spec)
+    module_spec.loader.exec_module(kernels)
+
+    return kernels
@@ -0,0 +1,329 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Module to monitor the progress of the sweeps of the coupled QOM systems."""
+
+__authors__ = ["Sampreet Kalita"]
+__toolbox__ = 'qom-v1.0.1'
+__created__ = "2026-10-18"
+__updated__ = "2026-10-18"
+
+# dependencies
+import asyncio
+import datetime
+import json
+import logging
+import numpy as np
+import os
+import threading
+import time
+
+# module logger
+logger = logging.getLogger(__name__)
+
+class SweepMonitor():
+    r"""Class to stream the progress and the partial results of a sweep.
+
+    The monitor runs an event loop of :mod:`asyncio` in a background thread, which periodically rewrites a status file, redraws a preview of the partial results and broadcasts the status to the clients connected to a local socket.
+    Each broadcast contains the number of completed points, the throughput, the estimated time remaining, the utilization of each worker and the points completed since the previous broadcast.
+    A client can send the line ``abort`` to stop the sweep, which can later be resumed.
+
+    Parameters
+    ----------
+    axes : list
+        Axes of the sweep, in the format ``[(var, values), ...]``, ordered as ``X`` followed by ``Y``.
+    params : dict, optional
+        Parameters of the monitor. Refer to :obj:`monitor_defaults` for the currently supported keys.
+
+    .. note:: All the options defined in ``params`` supersede individual function arguments. Their details are:
+
+        ==============  ================================================================================================================
+        key             value
+        ==============  ================================================================================================================
+        status_file     (*str*) path of the status file rewritten at each interval. Default is ``None`` for no status file.
+        preview_file    (*str*) path of the preview of the partial results, requiring Matplotlib. Default is ``None`` for no preview.
+        host            (*str*) host of the socket. Default is ``'127.0.0.1'``.
+        port            (*int*) port of the socket. Default is ``None`` for no socket.
+        interval        (*float*) interval in seconds between the updates. Default is :math:`1.0`.
+        ==============  ================================================================================================================
+    """
+
+    # default parameters of the monitor
+    monitor_defaults = {
+        'status_file'   : None,
+        'preview_file'  : None,
+        'host'          : '127.0.0.1',
+        'port'          : None,
+        'interval'      : 1.0
+    }
+
+    def __init__(self, axes, params={}):
+        """Class constructor for SweepMonitor."""
+
+        # set attributes
+        self.axes = axes
+        self.params = dict()
+        for key in self.monitor_defaults:
+            self.params[key] = params.get(key, self.monitor_defaults[key])
+        self.lock = threading.Lock()
+        self.aborted = threading.Event()
+        self.stopped = threading.Event()
+        self.thread = None
+        self.clients = set()
+
+        # progress
+        self.num_points = int(np.prod([len(axis[1]) for axis in axes]))
+        self.num_workers = 1
+        self.values = None
+        self.done = np.zeros(self.num_points, dtype=bool)
+        self.num_resumed = 0
+        self.t_start = None
+        self.workers = dict()
+        self.pending = list()
+        self.changed = False
+
+    def start(self, num_workers=1, values=None, done=None):
+        """Method to start the monitor.
+
+        Parameters
+        ----------
+        num_workers : int, optional
+            Number of parallel processes. Default is :math:`1`.
+        values : numpy.ndarray, optional
+            Values of the points completed before the start, resumed from a partial file.
+        done : numpy.ndarray, optional
+            Completion of the points before the start.
+        """
+
+        # set progress
+        self.num_workers = num_workers
+        if values is not None:
+            self.values = np.array(values, dtype=np.float64)
+            self.done = np.array(done, dtype=bool)
+            self.changed = True
+        self.num_resumed = int(np.sum(self.done))
+        self.t_start = time.time()
+
+        # event loop
+        self.thread = threading.Thread(
+            target=lambda: asyncio.run(self._main()),
+            daemon=True
+        )
+        self.thread.start()
+
+    def update(self, idxs, values, info=None):
+        """Method to update the monitor with a completed chunk.
+
+        Parameters
+        ----------
+        idxs : numpy.ndarray
+            Indices of the points in the chunk.
+        values : numpy.ndarray
+            Values of the points in the chunk, with a trailing axis for multiple measures.
+        info : tuple, optional
+            Identifier of the worker with the start and end times of the chunk, formatted as ``(pid, t_start, t_end)``.
+        """
+
+        with self.lock:
+            if self.values is None:
+                self.values = np.full((self.num_points, values.shape[1]), np.nan, dtype=np.float64)
+            self.values[idxs] = values
+            self.done[idxs] = True
+            self.changed = True
+
+            # busy times of the workers
+            if info is not None:
+                pid, t_start, t_end = info
+                self.workers[pid] = self.workers.get(pid, 0.0) + t_end - t_start
+
+            # points to stream
+            grids = np.unravel_index(idxs, tuple(len(axis[1]) for axis in self.axes[::-1]))[::-1]
+            for k, idx in enumerate(idxs):
+                self.pending.append([float(self.axes[i][1][grids[i][k]]) for i in range(len(self.axes))] + [float(value) for value in values[k]])
+
+    def get_status(self):
+        """Method to obtain the status of the sweep.
+
+        Returns
+        -------
+        status : dict
+            Status of the sweep with the keys ``'num_done'``, ``'num_points'``, ``'fraction'``, ``'elapsed'``, ``'throughput'`` (in points per second), ``'eta'`` (in seconds, ``None`` before the first chunk), ``'utilization'`` (busy fraction of the elapsed time for each worker) and ``'aborted'``.
+        """
+
+        with self.lock:
+            num_done = int(np.sum(self.done))
+            elapsed = time.time() - self.t_start if self.t_start is not None else 0.0
+            throughput = (num_done - self.num_resumed) / elapsed if elapsed > 0.0 else 0.0
+
+            return {
+                'num_done'      : num_done,
+                'num_points'    : self.num_points,
+                'fraction'      : num_done / self.num_points,
+                'elapsed'       : elapsed,
+                'throughput'    : throughput,
+                'eta'           : (self.num_points - num_done) / throughput if throughput > 0.0 else None,
+                'utilization'   : {str(pid): busy / elapsed for pid, busy in sorted(self.workers.items())} if elapsed > 0.0 else {},
+                'aborted'       : self.aborted.is_set()
+            }
+
+    def stop(self):
+        """Method to stop the monitor after a final update."""
+
+        self.stopped.set()
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+
+    async def _main(self):
+        # serve clients
+        server = None
+        if self.params['port'] is not None:
+            server = await asyncio.start_server(self._serve, self.params['host'], self.params['port'])
+            logger.info('Streaming progress at {}:{}\n'.format(self.params['host'], self.params['port']))
+
+        # update at intervals until stopped
+        while True:
+            stopped = self.stopped.is_set()
+            await self._update()
+            if stopped:
+                break
+            await asyncio.sleep(self.params['interval'])
+
+        # close clients
+        for writer in list(self.clients):
+            writer.close()
+        if server is not None:
+            server.close()
+            await server.wait_closed()
+
+    async def _serve(self, reader, writer):
+        # register client and listen for commands
+        self.clients.add(writer)
+        try:
+            while not self.stopped.is_set():
+                line = await reader.readline()
+                if not line:
+                    break
+                if line.strip() == b'abort':
+                    logger.warning('Abort requested by a client\n')
+                    self.aborted.set()
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+        finally:
+            self.clients.discard(writer)
+
+    async def _update(self):
+        # extract frequently used variables
+        status = self.get_status()
+        with self.lock:
+            points, self.pending = self.pending, list()
+            changed, self.changed = self.changed, False
+            values = self.values.copy() if changed and self.values is not None else None
+
+        # status file
+        if self.params['status_file'] is not None:
+            _write(self.params['status_file'], json.dumps(status, indent=4))
+
+        # preview
+        if self.params['preview_file'] is not None and values is not None:
+            await asyncio.get_running_loop().run_in_executor(None, self._preview, values)
+
+        # broadcast
+        message = (json.dumps(dict(status, points=points)) + '\n').encode('utf-8')
+        for writer in list(self.clients):
+            try:
+                writer.write(message)
+                await writer.drain()
+            except ConnectionError:
+                self.clients.discard(writer)
+
+    def _preview(self, values):
+        # dependencies
+        try:
+            import matplotlib
+            matplotlib.use('Agg')
+            import matplotlib.pyplot as plt
+        except ImportError:
+            logger.warning('Matplotlib is required for the preview\n')
+            self.params['preview_file'] = None
+            return
+
+        # first measure on the grid of the axes
+        V = values[:, 0].reshape(tuple(len(axis[1]) for axis in self.axes[::-1]))
+        fig, ax = plt.subplots(figsize=(4.8, 3.6))
+        if len(self.axes) == 1:
+            ax.plot(self.axes[0][1], V, 'o-', markersize=2)
+            ax.set_ylabel('value')
+        elif np.sum(np.isfinite(V)) > 0:
+            mesh = ax.pcolormesh(self.axes[0][1], self.axes[1][1], np.ma.masked_invalid(V), shading='nearest')
+            fig.colorbar(mesh, ax=ax)
+            ax.set_ylabel(self.axes[1][0])
+        ax.set_xlabel(self.axes[0][0])
+        ax.set_title('{} of {} points'.format(int(np.sum(np.isfinite(values[:, 0]))), self.num_points))
+        fig.tight_layout()
+
+        # save atomically
+        root, extension = os.path.splitext(self.params['preview_file'])
+        fig.savefig(root + '_temp' + extension)
+        plt.close(fig)
+        os.replace(root + '_temp' + extension, self.params['preview_file'])
+
+def _write(file_path, text):
+    # rewrite a file atomically
+    os.makedirs(os.path.dirname(file_path) or '.', exist_ok=True)
+    with open(file_path + '.temp', 'w') as file:
+        file.write(text)
+    os.replace(file_path + '.temp', file_path)
+
+def get_status_line(status):
+    """Function to format the status of a sweep in a single line.
+
+    Parameters
+    ----------
+    status : dict
+        Status of the sweep (see :meth:`SweepMonitor.get_status`).
+
+    Returns
+    -------
+    line : str
+        Formatted status.
+    """
+
+    eta = str(datetime.timedelta(seconds=int(status['eta']))) if status['eta'] is not None else '-'
+    utilization = ' '.join(['{:.0f}%'.format(100 * value) for value in status['utilization'].values()])
+
+    return '{:5.1f}% | {} of {} points | {:.2f} points/s | ETA {} | workers {}'.format(100 * status['fraction'], status['num_done'], status['num_points'], status['throughput'], eta, utilization or '-')
+
+async def _watch(host, port, abort, cb_update):
+    # connect and follow the stream
+    reader, writer = await asyncio.open_connection(host, port)
+    if abort:
+        writer.write(b'abort\n')
+        await writer.drain()
+    while True:
+        line = await reader.readline()
+        if not line:
+            break
+        cb_update(json.loads(line))
+    writer.close()
+
+def watch(port, host='127.0.0.1', abort=False, cb_update=None):
+    """Function to follow the progress of a sweep streamed by a :class:`SweepMonitor`.
+
+    Parameters
+    ----------
+    port : int
+        Port of the socket.
+    host : str, optional
+        Host of the socket. Default is ``'127.0.0.1'``.
+    abort : bool, optional
+        Option to request the sweep to abort. Default is ``False``.
+    cb_update : callable, optional
+        Callback function for each status, formatted as ``cb_update(status)``. Default logs the status.
+    """
+
+    # default callback
+    if cb_update is None:
+        cb_update = lambda status: logger.info(get_status_line(status) + '\n')
+
+    asyncio.run(_watch(host, port, abort, cb_update))
@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Module to obtain the quantum correlations of the coupled QOM systems for reweighted noises along a single classical trajectory."""
+
+__authors__ = ["Sampreet Kalita"]
+__toolbox__ = 'qom-v1.0.1'
+__created__ = "2026-10-18"
+__updated__ = "2026-10-19"
+
+# dependencies
+import logging
+import numpy as np
+
+# local modules
+from utils.thermal import ThermalSolver
+
+# module logger
+logger = logging.getLogger(__name__)
+
+class NoiseSolver(ThermalSolver):
+    r"""Class to solve the quantum correlations driven by each named component of the noise matrix along a single classical trajectory.
+
+    The noise matrix is decomposed into the weighted components :math:`D = \sum_{k} w_{k} D_{k}` declared by the ``get_D_basis`` method of the system, or into the single component ``'D'`` with unit weight if the method is not implemented.
+    As the equations of the correlations are linear in the noise matrix for a given drift matrix, the correlations are superposed as :math:`V = \Phi V (0) \Phi^{T} + \sum_{k} w_{k} W_{k}`.
+    Here, :math:`\Phi` is the propagator of :math:`\dot{\Phi} = A \Phi` and :math:`W_{k}` are the correlations driven by the component :math:`D_{k}` from :math:`W_{k} (0) = 0`, which are integrated once along with the classical modes.
+    Any reweighting of the components, along with any initial correlations, then only requires a linear combination of the integrated correlations.
+    The initial correlations of a reweighting are the components declared by the ``get_iv_corrs_basis`` method of the system with the same weights, or the initial correlations of the system if the method is not implemented.
+    The parameters, the window and the integration are those of :class:`utils.thermal.ThermalSolver`.
+
+    Parameters
+    ----------
+    system : :class:`qom.systems.BaseSystem`
+        Instance of the system.
+    params : dict
+        Parameters for the solver. The solver parameters are:
+        ================    ====================================================
+        key                 meaning
+        ================    ====================================================
+        ode_method          (*str*) method of ``scipy.integrate.solve_ivp`` used to solve the ODEs. Other methods, such as ``'auto'``, are replaced by the default. Default is ``'DOP853'``.
+        ode_atol            (*float*) absolute tolerance of the integrator. Default is :math:`10^{-12}`.
+        ode_rtol            (*float*) relative tolerance of the integrator. Default is :math:`10^{-8}`.
+        t_min               (*float*) minimum time. Default is :math:`0.0`.
+        t_max               (*float*) maximum time. Default is :math:`1000.0`.
+        t_dim               (*int*) number of time points. Default is :math:`10001`.
+        t_index_min         (*int*) index of the first time of the window. Default is :math:`0`.
+        t_index_max         (*int*) index of the last time of the window. Default is ``t_dim - 1``.
+        ================    ====================================================
+    """
+
+    # default parameters of the solver
+    solver_defaults = {key: value for key, value in ThermalSolver.solver_defaults.items() if key != 'floquet'}
+
+    def __init__(self, system, params={}):
+        """Class constructor for NoiseSolver."""
+
+        # set attributes
+        self.system = system
+        self._set_params(params)
+
+        # initial values
+        self.iv_modes, self.iv_corrs, self.c = system.get_ivc()
+        self.dim_m = 2 * system.num_modes
+
+        # weights of the components
+        self.weights, D_basis = self.get_D_basis(self.iv_modes, self.iv_corrs, self.params['t_min'])
+        self.names = list(D_basis.keys())
+        assert np.allclose(sum([self.weights[name] * D_basis[name] for name in self.names]), np.array(system.get_D(self.iv_modes, self.iv_corrs, self.c, self.params['t_min']), dtype=np.float64)), 'Components of the noise matrix of ``{}`` should add up to the noise matrix'.format(system.name)
+
+        # components of the initial correlations
+        self.iv_corrs_basis = None
+        if hasattr(system, 'get_iv_corrs_basis'):
+            self.iv_corrs_basis = {name: np.array(V_k, dtype=np.float64) for name, V_k in system.get_iv_corrs_basis().items()}
+            assert sorted(self.iv_corrs_basis.keys()) == sorted(self.names), 'Components of the initial correlations of ``{}`` should be named as those of the noise matrix'.format(system.name)
+            assert np.allclose(self.get_iv_corrs(), self.iv_corrs), 'Components of the initial correlations of ``{}`` should add up to the initial correlations'.format(system.name)
+
+        # results
+        self.Modes = None
+        self.Phis = None
+        self.Corrs_basis = None
+
+    def get_D_basis(self, modes, corrs, t):
+        """Method to obtain the weights and the basis components of the noise matrix.
+
+        Parameters
+        ----------
+        modes : numpy.ndarray
+            Classical modes.
+        corrs : numpy.ndarray
+            Quantum correlations.
+        t : float
+            Time at which the values are calculated.
+
+        Returns
+        -------
+        weights : dict
+            Weights of the components, formatted as ``{name: weight}``.
+        D_basis : dict
+            Basis components of the noise matrix, formatted as ``{name: D_k}``.
+        """
+
+        # single component
+        if not hasattr(self.system, 'get_D_basis'):
+            return {'D': 1.0}, {'D': np.array(self.system.get_D(modes, corrs, self.c, t), dtype=np.float64)}
+
+        weights, D_basis = self.system.get_D_basis(modes, corrs, self.c, t)
+
+        return weights, {name: np.array(D_k, dtype=np.float64) for name, D_k in D_basis.items()}
+
+    def get_iv_corrs(self, weights={}):
+        """Method to obtain the initial correlations for reweighted components of the noise matrix.
+
+        Parameters
+        ----------
+        weights : dict, optional
+            Weights of the components superseding those of the system, formatted as ``{name: weight}``.
+
+        Returns
+        -------
+        iv_corrs : numpy.ndarray
+            Initial values of the quantum correlations.
+        """
+
+        # initial correlations of the system
+        if self.iv_corrs_basis is None:
+            return np.array(self.iv_corrs, dtype=np.float64)
+
+        _weights = dict(self.weights, **weights)
+
+        return sum([_weights[name] * self.iv_corrs_basis[name] for name in self.names])
+
+    def _get_rates(self, t, y):
+        # extract modes, propagator and correlations of each component
+        dim = self.dim_m
+        modes = y[:dim].view(np.complex128)
+        Phi = y[dim:dim + dim**2].reshape((dim, dim))
+        Vs = y[dim + dim**2:].reshape((-1, dim, dim))
+
+        # drift matrix and components of the noise matrix
+        A = np.array(self.system.get_A(modes, self.c, t), dtype=np.float64)
+        _, D_basis = self.get_D_basis(modes, Vs[0], t)
+        rates = [np.asarray(self.system.get_mode_rates(modes, self.c, t), dtype=np.complex128).view(np.float64), A.dot(Phi).ravel()]
+
+        # correlations driven by each component
+        for name, V in zip(self.names, Vs):
+            rates.append((A.dot(V) + V.dot(A.transpose()) + D_basis[name]).ravel())
+
+        return np.concatenate(rates)
+
+    def get_basis(self):
+        """Method to obtain the classical modes and the correlations driven by each component of the noise matrix in the window.
+
+        Returns
+        -------
+        Modes : numpy.ndarray
+            Classical modes at the times of the window.
+        Phis : numpy.ndarray
+            Propagators of the correlations at the times of the window.
+        Corrs_basis : dict
+            Correlations driven by each component at the times of the window, formatted as ``{name: Corrs_k}``.
+        """
+
+        # integrate once
+        if self.Modes is not None:
+            return self.Modes, self.Phis, self.Corrs_basis
+
+        # extract frequently used variables
+        dim = self.dim_m
+
+        # single classical trajectory with the correlations of each component
+        y_0 = np.concatenate((np.asarray(self.iv_modes, dtype=np.complex128).view(np.float64), np.eye(dim).ravel(), np.zeros(len(self.names) * dim**2)))
+        Y = self._integrate(y_0)
+        Corrs = Y[:, dim + dim**2:].reshape((len(Y), len(self.names), dim, dim))
+
+        # update results
+        self.Modes = Y[:, :dim].copy().view(np.complex128)
+        self.Phis = Y[:, dim:dim + dim**2].reshape((len(Y), dim, dim)).copy()
+        self.Corrs_basis = {name: Corrs[:, k].copy() for k, name in enumerate(self.names)}
+
+        return self.Modes, self.Phis, self.Corrs_basis
+
+    def get_modes_corrs(self, weights={}, iv_corrs=None):
+        """Method to obtain the classical modes and the quantum correlations in the window for reweighted components of the noise matrix.
+
+        Parameters
+        ----------
+        weights : dict, optional
+            Weights of the components superseding those of the system, formatted as ``{name: weight}``.
+        iv_corrs : numpy.ndarray, optional
+            Initial values of the quantum correlations. Default is ``None`` for those of the reweighted components (see :meth:`get_iv_corrs`).
+
+        Returns
+        -------
+        Modes : numpy.ndarray
+            Classical modes at the times of the window.
+        Corrs : numpy.ndarray
+            Quantum correlations at the times of the window.
+        """
+
+        # validate weights
+        for name in weights:
+            assert name in self.names, 'Component ``{}`` is not declared by ``{}``, available options are ``{}``'.format(name, self.system.name, self.names)
+
+        # linear combination
+        Modes, Phis, Corrs_basis = self.get_basis()
+        _weights = dict(self.weights, **weights)
+        iv_corrs = np.array(iv_corrs if iv_corrs is not None else self.get_iv_corrs(weights), dtype=np.float64)
+        Corrs = np.matmul(np.matmul(Phis, iv_corrs), Phis.transpose((0, 2, 1)))
+        for name in self.names:
+            Corrs += _weights[name] * Corrs_basis[name]
+
+        return Modes, Corrs
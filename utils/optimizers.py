@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Module to optimize the synchronization of the coupled QOM systems over their parameters."""
+
+__authors__ = ["Sampreet Kalita"]
+__toolbox__ = 'qom-v1.0.1'
+__created__ = "2026-10-18"
+__updated__ = "2026-10-19"
+
+# dependencies
+from concurrent.futures import ProcessPoolExecutor
+import copy
+import logging
+import numpy as np
+
+# local modules
+from utils.measures import get_average, get_lyapunov_transverse, get_sync_p
+from utils.sensitivity import get_func_sync_p_grad
+from utils.solvers import HLESolver
+
+# module logger
+logger = logging.getLogger(__name__)
+
+class SyncOptimizer():
+    r"""Class to optimize the synchronization of a system over a subset of its parameters.
+
+    The objective is minimized by multiple local searches, each starting from a different point within the bounds.
+    The first start is the point of the system parameters and the remaining ones are drawn uniformly.
+    The starts are run in parallel processes and the evaluations of each start are cached.
+    For the ``'sync_p'`` objective with ``'L-BFGS-B'``, the gradients are obtained from :class:`utils.sensitivity.SensitivitySolver` in the same integration.
+
+    Parameters
+    ----------
+    SystemClass : :class:`qom.systems.BaseSystem`
+        Class of the system.
+    params : dict
+        Parameters for the optimizer, the solver and the system. The keys are ``'optimizer'``, ``'solver'`` and ``'system'``, where the parameters of the optimizer are:
+        ================    ====================================================
+        key                 meaning
+        ================    ====================================================
+        objective           (*str*) objective of the optimization. Available options are ``'sync_p'`` (maximize the average quantum phase synchronization) and ``'lyapunov'`` (minimize the largest transverse Lyapunov exponent of the minus modes, see :func:`utils.measures.get_lyapunov_transverse`). Default is ``'sync_p'``.
+        keys                (*list*) keys of the system parameters to optimize. Default is ``['delta', 'lambda']``.
+        bounds              (*list*) bounds of the system parameters, in the format ``[(min, max), ...]``. Default is ``[(-0.02, 0.02), (0.0, 0.1)]``.
+        method              (*str*) method of the local searches. Available options are ``'L-BFGS-B'`` and ``'Nelder-Mead'``. Default is ``'L-BFGS-B'``.
+        use_grad            (*bool*) option to use the sensitivities for the gradients of ``'sync_p'``. Default is ``True``.
+        num_starts          (*int*) number of starts. Default is :math:`4`.
+        num_workers         (*int*) number of parallel processes. Default is :math:`1`.
+        max_iter            (*int*) maximum number of iterations of each start. Default is :math:`50`.
+        tol                 (*float*) tolerance of the local searches. Default is :math:`10^{-6}`.
+        seed                (*int*) seed of the starting points. Default is :math:`0`.
+        ================    ====================================================
+    """
+
+    # default parameters of the optimizer
+    optimizer_defaults = {
+        'objective'     : 'sync_p',
+        'keys'          : ['delta', 'lambda'],
+        'bounds'        : [(-0.02, 0.02), (0.0, 0.1)],
+        'method'        : 'L-BFGS-B',
+        'use_grad'      : True,
+        'num_starts'    : 4,
+        'num_workers'   : 1,
+        'max_iter'      : 50,
+        'tol'           : 1e-6,
+        'seed'          : 0
+    }
+
+    # available objectives
+    objectives = ['sync_p', 'lyapunov']
+    # available methods
+    methods = ['L-BFGS-B', 'Nelder-Mead']
+
+    def __init__(self, SystemClass, params):
+        """Class constructor for SyncOptimizer."""
+
+        # set attributes
+        self.SystemClass = SystemClass
+        self.params = copy.deepcopy(self.optimizer_defaults)
+        self.params.update(params.get('optimizer', {}))
+        self.params_solver = copy.deepcopy(params.get('solver', {}))
+        self.params_system = copy.deepcopy(params.get('system', {}))
+        assert self.params['objective'] in self.objectives, 'Parameter ``objective`` should be one of ``{}``'.format(self.objectives)
+        assert self.params['method'] in self.methods, 'Parameter ``method`` should be one of ``{}``'.format(self.methods)
+        assert len(self.params['keys']) == len(self.params['bounds']), 'Parameters ``keys`` and ``bounds`` should have the same length'
+
+        # option to use the sensitivities
+        self.use_grad = self.params['use_grad'] and self.params['objective'] == 'sync_p' and self.params['method'] == 'L-BFGS-B'
+
+        # cache of the evaluations
+        self.cache = dict()
+
+    def get_starts(self):
+        """Method to obtain the starting points of the local searches.
+
+        Returns
+        -------
+        X_0 : numpy.ndarray
+            Starting points.
+        """
+
+        # extract frequently used variables
+        bounds = np.array(self.params['bounds'], dtype=np.float64)
+        defaults = dict(self.SystemClass.system_defaults, **self.params_system)
+
+        # first start at the system parameters
+        x_0 = np.clip([defaults[key] for key in self.params['keys']], bounds[:, 0], bounds[:, 1])
+        # remaining starts drawn uniformly
+        rng = np.random.default_rng(self.params['seed'])
+        X_0 = rng.uniform(bounds[:, 0], bounds[:, 1], size=(self.params['num_starts'] - 1, len(bounds)))
+
+        return np.concatenate(([x_0], X_0))
+
+    def get_value(self, x):
+        """Method to obtain the value of the objective and its gradient at a point.
+
+        Parameters
+        ----------
+        x : numpy.ndarray
+            Values of the system parameters.
+
+        Returns
+        -------
+        value : float
+            Value of the objective to minimize.
+        grad : numpy.ndarray
+            Gradient of the objective, or ``None`` if unavailable.
+        """
+
+        # cached evaluations
+        cache_key = tuple(np.round(x, 12))
+        if cache_key in self.cache:
+            return self.cache[cache_key]
+
+        # update system parameters
+        system_params = copy.deepcopy(self.params_system)
+        system_params.update({key: float(x[i]) for i, key in enumerate(self.params['keys'])})
+
+        # average synchronization and its gradient
+        if self.use_grad:
+            sync_p, sync_p_grad = get_func_sync_p_grad(
+                SystemClass=self.SystemClass,
+                params=dict(self.params_solver, sens_keys=self.params['keys'])
+            )(system_params)
+            value, grad = - sync_p, - sync_p_grad
+        # largest transverse Lyapunov exponent
+        elif self.params['objective'] == 'lyapunov':
+            value = get_lyapunov_transverse(
+                system=self.SystemClass(params=system_params),
+                params=self.params_solver
+            )
+            grad = None
+        else:
+            # solve the system
+            solver = HLESolver(
+                system=self.SystemClass(params=system_params),
+                params=dict(self.params_solver, output_stride=None)
+            )
+            Modes, Corrs = solver.get_modes_corrs()
+
+            # extract window
+            window = solver.get_window()
+            indices = self.params_solver.get('indices', [1, 3])
+
+            # objective
+            value = - get_average(get_sync_p(Modes[window], Corrs[window], indices))
+            grad = None
+
+        # update cache
+        self.cache[cache_key] = (value, grad)
+
+        return value, grad
+
+    def run_start(self, x_0):
+        """Method to run a single local search.
+
+        Parameters
+        ----------
+        x_0 : numpy.ndarray
+            Starting point.
+
+        Returns
+        -------
+        result : dict
+            Result of the local search with keys ``'x'``, ``'value'``, ``'success'``, ``'num_evals'`` and ``'trace'``, where the trace contains the points and values of all evaluations.
+        """
+
+        # dependencies
+        import scipy.optimize as so
+
+        # evaluations of the start
+        trace = list()
+        def func(x):
+            value, grad = self.get_value(x)
+            trace.append({
+                'x'     : np.array(x),
+                'value' : value,
+                'grad'  : grad
+            })
+            return (value, grad) if self.use_grad else value
+
+        # local search
+        res = so.minimize(
+            fun=func,
+            x0=x_0,
+            jac=self.use_grad,
+            method=self.params['method'],
+            bounds=self.params['bounds'],
+            tol=self.params['tol'],
+            options={
+                'maxiter': self.params['max_iter']
+            }
+        )
+
+        return {
+            'x'         : np.array(res.x),
+            'value'     : float(res.fun),
+            'success'   : bool(res.success),
+            'num_evals' : len(trace),
+            'trace'     : trace
+        }
+
+    def optimize(self):
+        """Method to optimize the objective with multiple starts.
+
+        Returns
+        -------
+        result : dict
+            Result of the optimization with keys ``'x'`` (best point), ``'value'`` (best value of the objective to minimize), ``'params'`` (best system parameters), ``'starts'`` (results of all starts, see :meth:`run_start`) and ``'trace'`` (all evaluations, with the index of the start under ``'start'``).
+        """
+
+        # starting points
+        X_0 = self.get_starts()
+        logger.info('Optimizing {} over {} with {} starts\n'.format(self.params['objective'], self.params['keys'], len(X_0)))
+
+        # run starts
+        if self.params['num_workers'] > 1:
+            with ProcessPoolExecutor(max_workers=self.params['num_workers']) as executor:
+                starts = list(executor.map(self.run_start, X_0))
+        else:
+            starts = [self.run_start(x_0) for x_0 in X_0]
+
+        # combine traces
+        trace = [dict(item, start=i) for i, start in enumerate(starts) for item in start['trace']]
+
+        # best start
+        best = starts[int(np.argmin([start['value'] for start in starts]))]
+        params_best = copy.deepcopy(self.params_system)
+        params_best.update({key: float(best['x'][i]) for i, key in enumerate(self.params['keys'])})
+        logger.info('Best value {} at {}\n'.format(best['value'], params_best))
+
+        return {
+            'x'         : best['x'],
+            'value'     : best['value'],
+            'params'    : params_best,
+            'starts'    : starts,
+            'trace'     : trace
+        }
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Module to obtain the phase portraits of the modes of the coupled QOM systems."""
+
+__authors__ = ["Sampreet Kalita"]
+__toolbox__ = 'qom-v1.0.1'
+__created__ = "2026-10-18"
+__updated__ = "2026-10-19"
+
+# dependencies
+import numpy as np
+
+def _get_step(indices):
+    # constant step between the indices
+    assert len(indices) > 0, 'At least one index is required'
+    step = indices[1] - indices[0] if len(indices) > 1 else 1
+    assert step > 0 and list(indices) == list(range(indices[0], indices[0] + step * len(indices), step)), 'Indices should be increasing with a constant step, got ``{}``'.format(indices)
+
+    return step
+
+def get_views(Modes, Corrs, indices=[1, 3]):
+    r"""Function to obtain the strided views of the mean quadratures and the correlations of the selected modes at all times.
+
+    The views share the memory of the solver output without copying, such that thousands of times cost no more than their strides.
+    As the views are read-only, operations on them return new arrays, whereas reshaping the joint correlations into matrices of size :math:`2 n \times 2 n` copies them.
+
+    Parameters
+    ----------
+    Modes : numpy.ndarray
+        Classical modes at all times, of single or double complex precision.
+    Corrs : numpy.ndarray
+        Quantum correlations at all times.
+    indices : list, optional
+        Indices of the modes, increasing with a constant step. Default is :math:`\left[ 1, 3 \right]`.
+
+    Returns
+    -------
+    means : numpy.ndarray
+        Real and imaginary parts of the selected modes with shape ``(t_dim, n, 2)``, which are :math:`1 / \sqrt{2}` times the mean quadratures.
+    blocks : numpy.ndarray
+        Correlations of the quadratures of each selected mode with shape ``(t_dim, n, 2, 2)``.
+    corrs : numpy.ndarray
+        Joint correlations of the quadratures of the selected modes with shape ``(t_dim, n, 2, n, 2)``.
+    """
+
+    # extract frequently used variables
+    step = _get_step(indices)
+    num = len(indices)
+    i = indices[0]
+    assert Modes.ndim == 2 and Modes.dtype in [np.complex64, np.complex128], 'Modes should be a two-dimensional array of type ``numpy.complex64`` or ``numpy.complex128``, got shape ``{}`` and type ``{}``'.format(Modes.shape, Modes.dtype)
+    assert Corrs.shape == (len(Modes), 2 * Modes.shape[1], 2 * Modes.shape[1]), 'Corrs should be of shape ``{}``, got ``{}``'.format((len(Modes), 2 * Modes.shape[1], 2 * Modes.shape[1]), Corrs.shape)
+    assert indices[0] >= 0 and indices[-1] < Modes.shape[1], 'Indices should be within the ``{}`` modes, got ``{}``'.format(Modes.shape[1], indices)
+
+    # mean quadratures from the real parts of the modes
+    real = Modes[:, i:].real
+    s_t, s_m = real.strides
+    means = np.lib.stride_tricks.as_strided(real, shape=(len(Modes), num, 2), strides=(s_t, step * s_m, real.itemsize), writeable=False)
+
+    # sub-blocks of the correlations
+    corrs = Corrs[:, 2 * i:, 2 * i:]
+    s_t, s_r, s_c = corrs.strides
+    blocks = np.lib.stride_tricks.as_strided(corrs, shape=(len(Corrs), num, 2, 2), strides=(s_t, 2 * step * (s_r + s_c), s_r, s_c), writeable=False)
+    corrs = np.lib.stride_tricks.as_strided(corrs, shape=(len(Corrs), num, 2, num, 2), strides=(s_t, 2 * step * s_r, s_r, 2 * step * s_c, s_c), writeable=False)
+
+    return means, blocks, corrs
+
+def get_ellipses(means, blocks, num_sigmas=1.0):
+    r"""Function to obtain the Wigner ellipses of the selected modes at all times.
+
+    The Gaussian Wigner function of each mode is centred at the mean quadratures :math:`\sqrt{2} \left( \mathrm{Re} \beta, \mathrm{Im} \beta \right)` with the contours set by the correlations :math:`V`.
+    The eigenvalues :math:`\lambda_{\pm} = \frac{1}{2} \left( V_{QQ} + V_{PP} \right) \pm \sqrt{\frac{1}{4} \left( V_{QQ} - V_{PP} \right)^{2} + V_{QP}^{2}}` and the angle :math:`\theta = \frac{1}{2} \mathrm{atan2} \left( 2 V_{QP}, V_{QQ} - V_{PP} \right)` of the major axis are computed in closed form for all times and modes at once.
+
+    Parameters
+    ----------
+    means : numpy.ndarray
+        Real and imaginary parts of the modes (see :func:`get_views`).
+    blocks : numpy.ndarray
+        Correlations of the quadratures of each mode (see :func:`get_views`).
+    num_sigmas : float, optional
+        Number of standard deviations of the contours. Default is :math:`1.0`.
+
+    Returns
+    -------
+    centers : numpy.ndarray
+        Centres of the ellipses with shape ``(t_dim, n, 2)``.
+    widths : numpy.ndarray
+        Lengths of the major axes with shape ``(t_dim, n)``.
+    heights : numpy.ndarray
+        Lengths of the minor axes with shape ``(t_dim, n)``.
+    angles : numpy.ndarray
+        Angles of the major axes from the :math:`Q`-axis in radians with shape ``(t_dim, n)``, to be converted with ``numpy.degrees`` for ``matplotlib.collections.EllipseCollection``.
+    """
+
+    # extract frequently used variables
+    V_QQ = blocks[..., 0, 0]
+    V_PP = blocks[..., 1, 1]
+    V_QP = 0.5 * (blocks[..., 0, 1] + blocks[..., 1, 0])
+
+    # eigenvalues and angles
+    mean = 0.5 * (V_QQ + V_PP)
+    radius = np.hypot(0.5 * (V_QQ - V_PP), V_QP)
+    widths = 2.0 * num_sigmas * np.sqrt(mean + radius)
+    heights = 2.0 * num_sigmas * np.sqrt(np.maximum(mean - radius, 0.0))
+    angles = 0.5 * np.arctan2(2.0 * V_QP, V_QQ - V_PP)
+
+    return np.sqrt(2.0) * means, widths, heights, angles
+
+def get_phases(means, blocks):
+    r"""Function to obtain the phases of the selected modes and their uncertainties at all times.
+
+    The uncertainty of the phase :math:`\phi_{k}` of the :math:`k`-th mode is the standard deviation of its rotated momentum quadrature :math:`P_{k}^{\prime} = - \sin \phi_{k} Q_{k} + \cos \phi_{k} P_{k}` relative to the distance :math:`\sqrt{2} \left| \beta_{k} \right|` of the centre of its Wigner ellipse from the origin.
+    The uncertainties are ``nan`` where the mode vanishes (for example, at the initial time) and its phase is undefined.
+
+    Parameters
+    ----------
+    means : numpy.ndarray
+        Real and imaginary parts of the modes (see :func:`get_views`).
+    blocks : numpy.ndarray
+        Correlations of the quadratures of each mode (see :func:`get_views`).
+
+    Returns
+    -------
+    phases : numpy.ndarray
+        Phases of the modes in radians with shape ``(t_dim, n)``.
+    phase_stds : numpy.ndarray
+        Uncertainties of the phases in radians with shape ``(t_dim, n)``.
+    """
+
+    # extract frequently used variables
+    phases = np.arctan2(means[..., 1], means[..., 0])
+    sin, cos = np.sin(phases), np.cos(phases)
+
+    # rotated momentum correlations
+    corrs_P_p = sin**2 * blocks[..., 0, 0] - sin * cos * (blocks[..., 0, 1] + blocks[..., 1, 0]) + cos**2 * blocks[..., 1, 1]
+
+    # relative to the amplitudes
+    stds = np.sqrt(corrs_P_p / 2.0)
+    amplitudes = np.hypot(means[..., 0], means[..., 1])
+    phase_stds = np.divide(stds, amplitudes, out=np.full_like(stds, np.nan), where=amplitudes > 0)
+
+    return phases, phase_stds
+
+def get_phase_differences(phases, unwrap=False):
+    """Function to obtain the phase differences of the selected modes from the first mode at all times.
+
+    Parameters
+    ----------
+    phases : numpy.ndarray
+        Phases of the modes with shape ``(t_dim, n)`` (see :func:`get_phases`).
+    unwrap : bool, optional
+        Option to unwrap the differences along the times instead of wrapping them in :math:`(- \\pi, \\pi]`. Default is ``False``.
+
+    Returns
+    -------
+    phase_differences : numpy.ndarray
+        Phase differences with shape ``(t_dim, n - 1)``.
+    """
+
+    phase_differences = np.angle(np.exp(1.0j * (phases[:, 1:] - phases[:, :1])))
+
+    return np.unwrap(phase_differences, axis=0) if unwrap else phase_differences
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Module to obtain the sensitivities of the coupled QOM systems with respect to their parameters."""
+
+__authors__ = ["Sampreet Kalita"]
+__toolbox__ = 'qom-v1.0.1'
+__created__ = "2026-10-18"
+__updated__ = "2026-10-18"
+
+# dependencies
+import logging
+import numpy as np
+import scipy.linalg as sl
+
+# local modules
+from utils.measures import get_average, get_sync_p, get_sync_p_grad
+from utils.solvers import HLESolver
+
+# module logger
+logger = logging.getLogger(__name__)
+
+class SensitivitySolver(HLESolver):
+    r"""Class to solve the Heisenberg-Langevin equations along with their forward sensitivities with respect to the parameters of the system.
+
+    For each parameter :math:`\theta`, the sensitivities :math:`s = \partial \beta / \partial \theta` and :math:`S = \partial V / \partial \theta` follow the tangent-linear equations
+
+    .. math::
+        \dot{s} = J s + \partial_{\theta} f, \quad \dot{S} = A S + S A^{T} + \delta A V + V \delta A^{T} + \partial_{\theta} D,
+
+    where :math:`J` is the Jacobian of the rates of the modes and :math:`\delta A = \partial_{\theta} A + \sum_{k} \partial_{k} A s_{k}`.
+    The sensitivities are integrated in the same run as the modes and the correlations.
+
+    Parameters
+    ----------
+    system : :class:`qom.systems.BaseSystem`
+        Instance of the system, implementing ``get_mode_rates_jac``, ``get_A_jac``, ``get_mode_rates_grad``, ``get_A_grad`` and ``get_D_grad``.
+    params : dict
+        Parameters for the solver. Along with the parameters of :class:`utils.solvers.HLESolver`, the solver parameters are:
+        ================    ====================================================
+        key                 meaning
+        ================    ====================================================
+        sens_keys           (*list*) keys of the parameters of the system. Default is ``['delta']``.
+        ================    ====================================================
+    """
+
+    # default parameters of the solver
+    solver_defaults = dict(HLESolver.solver_defaults, **{
+        'sens_keys' : ['delta']
+    })
+
+    def __init__(self, system, params={}):
+        """Class constructor for SensitivitySolver."""
+
+        # initialize super class
+        super().__init__(
+            system=system,
+            params=params
+        )
+
+        # validate system
+        for name in ['get_mode_rates_jac', 'get_A_jac', 'get_mode_rates_grad', 'get_A_grad', 'get_D_grad']:
+            assert hasattr(system, name), 'System should implement ``{}`` for sensitivities'.format(name)
+
+        # exponential integrators do not support the sensitivities
+        if self.params['ode_method'] in self.methods_etd:
+            logger.info('Falling back to vode for the sensitivities\n')
+            self.params['ode_method'] = 'vode'
+            self.params['ode_is_stiff'] = True
+            self.has_jac = self.params['use_jac']
+
+        # set attributes
+        self.keys = list(self.params['sens_keys'])
+        self.dim = self.dim_m + self.dim_c
+
+    def get_rates_sens(self, t, y):
+        """Method to obtain the rates of change of the real-form state and its sensitivities.
+
+        Parameters
+        ----------
+        t : float
+            Time at which the values are calculated.
+        y : numpy.ndarray
+            Real-form state followed by its sensitivities.
+
+        Returns
+        -------
+        rates : numpy.ndarray
+            Rates of change of the real-form state and its sensitivities.
+        """
+
+        # extract modes and correlations
+        modes, corrs = self._split(y[:self.dim])
+
+        # rates of the state
+        mode_rates = np.asarray(self.system.get_mode_rates(modes, self.c, t), dtype=np.complex128)
+        A = np.array(self.system.get_A(modes, self.c, t))
+        D = np.asarray(self.system.get_D(modes, corrs, self.c, t))
+        rates = [mode_rates.view(np.float64), (A.dot(corrs) + corrs.dot(A.transpose()) + D).ravel()]
+
+        # derivatives with respect to the modes
+        mode_rates_jac = np.asarray(self.system.get_mode_rates_jac(modes, self.c, t))
+        A_jac = np.asarray(self.system.get_A_jac(modes, self.c, t))
+
+        # rates of the sensitivities
+        for k, key in enumerate(self.keys):
+            s = y[(k + 1) * self.dim:(k + 2) * self.dim]
+            s_modes = s[:self.dim_m]
+            s_corrs = s[self.dim_m:].reshape((self.dim_m, self.dim_m))
+            A_grad = np.asarray(self.system.get_A_grad(modes, self.c, t, key)) + np.einsum('kij,k->ij', A_jac, s_modes)
+            rates.append(mode_rates_jac.dot(s_modes) + np.asarray(self.system.get_mode_rates_grad(modes, self.c, t, key), dtype=np.complex128).view(np.float64))
+            rates.append((A.dot(s_corrs) + s_corrs.dot(A.transpose()) + A_grad.dot(corrs) + corrs.dot(A_grad.transpose()) + np.asarray(self.system.get_D_grad(modes, corrs, self.c, t, key))).ravel())
+
+        return np.concatenate(rates)
+
+    def get_jac_sens(self, t, y):
+        """Method to obtain the Jacobian of the real-form state and its sensitivities.
+
+        The sensitivities share the Jacobian of the state, and their dependence on the state is neglected, which only affects the convergence of the implicit iterations.
+
+        Parameters
+        ----------
+        t : float
+            Time at which the values are calculated.
+        y : numpy.ndarray
+            Real-form state followed by its sensitivities.
+
+        Returns
+        -------
+        jac : numpy.ndarray
+            Block-diagonal Jacobian.
+        """
+
+        return sl.block_diag(*([self.get_jac(t, y[:self.dim])] * (len(self.keys) + 1)))
+
+    def get_modes_corrs_sens(self):
+        """Method to obtain the classical modes, quantum correlations and their sensitivities.
+
+        Returns
+        -------
+        Modes : numpy.ndarray
+            Classical modes at the output times.
+        Corrs : numpy.ndarray
+            Quantum correlations at the output times.
+        Modes_grad : numpy.ndarray
+            Derivatives of the classical modes at the output times for each parameter.
+        Corrs_grad : numpy.ndarray
+            Derivatives of the quantum correlations at the output times for each parameter.
+        """
+
+        # initial real-form state with vanishing sensitivities
+        y_0 = np.zeros((len(self.keys) + 1) * self.dim, dtype=np.float64)
+        y_0[:self.dim] = np.concatenate((np.asarray(self.iv_modes, dtype=np.complex128).view(np.float64), np.asarray(self.iv_corrs, dtype=np.float64).ravel()))
+
+        # integrate
+        Ys = self.integrate(
+            func=self.get_rates_sens,
+            y_0=y_0,
+            jac=self.get_jac_sens if self.has_jac else None
+        ).reshape((-1, len(self.keys) + 1, self.dim)).transpose((1, 0, 2))
+
+        # extract modes and correlations
+        Modes = np.ascontiguousarray(Ys[:, :, :self.dim_m]).view(np.complex128)
+        Corrs = Ys[:, :, self.dim_m:].reshape(Ys.shape[:2] + (self.dim_m, self.dim_m))
+
+        return Modes[0], Corrs[0], Modes[1:], Corrs[1:]
+
+def get_func_sync_p_grad(SystemClass, params, cb_update=None):
+    r"""Function to obtain the function returning the average quantum phase synchronization and its gradient.
+
+    The average is taken between the time indices ``t_index_min`` and ``t_index_max`` of the solver parameters, and the gradient is with respect to the parameters in ``sens_keys``.
+
+    Parameters
+    ----------
+    SystemClass : :class:`qom.systems.BaseSystem`
+        Class of the system.
+    params : dict
+        Parameters for the solver and the measures.
+    cb_update : callable, optional
+        Callback function to update status and progress.
+
+    Returns
+    -------
+    func : callable
+        Function returning the average :math:`\langle S_{p} \rangle` and its gradient for given system parameters, formatted as ``func(system_params)``.
+    """
+
+    def func(system_params):
+        # get modes, correlations and their sensitivities in the window
+        solver = SensitivitySolver(
+            system=SystemClass(
+                params=system_params,
+                cb_update=cb_update
+            ),
+            params=dict(params, output_stride=None)
+        )
+        Modes, Corrs, Modes_grad, Corrs_grad = solver.get_modes_corrs_sens()
+
+        # extract window
+        window = solver.get_window()
+        indices = params.get('indices', [1, 3])
+
+        # average measure and its gradient
+        sync_p = get_average(get_sync_p(Modes[window], Corrs[window], indices))
+        sync_p_grad = np.array([get_average(get_sync_p_grad(Modes[window], Corrs[window], Modes_grad[k][window], Corrs_grad[k][window], indices)) for k in range(len(Modes_grad))])
+
+        return sync_p, sync_p_grad
+
+    return func
@@ -0,0 +1,781 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Module to select, configure and run the solvers for the coupled QOM systems."""
+
+__authors__ = ["Sampreet Kalita"]
+__toolbox__ = 'qom-v1.0.1'
+__created__ = "2026-10-18"
+__updated__ = "2026-10-19"
+
+# dependencies
+import copy
+import logging
+import numpy as np
+import scipy.integrate as si
+
+# module logger
+logger = logging.getLogger(__name__)
+
+# default thresholds for the selection of the integrators
+selection_defaults = {
+    'stiff_ratio_explicit'  : 1e2,
+    'stiff_ratio_implicit'  : 1e4,
+    'oscillation_ratio'     : 10.0,
+    'nonlinearity_ratio'    : 0.1,
+    'etd_rtol'              : 1e-4
+}
+
+# tolerances for the different families of integrators
+selection_tolerances = {
+    'explicit'  : {
+        'ode_atol'  : 1e-9,
+        'ode_rtol'  : 1e-6
+    },
+    'implicit'  : {
+        'ode_atol'  : 1e-10,
+        'ode_rtol'  : 1e-7
+    },
+    'split'     : {}
+}
+
+def get_stiffness(system, modes=None, t=0.0):
+    """Function to estimate the stiffness of a system from the eigenvalues of its drift matrix.
+
+    Parameters
+    ----------
+    system : :class:`qom.systems.BaseSystem`
+        Instance of the system.
+    modes : numpy.ndarray, optional
+        Classical modes at which the drift matrix is evaluated. Default is the initial values of the modes.
+    t : float, optional
+        Time at which the drift matrix is evaluated. Default is :math:`0.0`.
+
+    Returns
+    -------
+    stiffness : dict
+        Estimates of the stiffness. The keys are ``'eigs'`` (eigenvalues of the drift matrix), ``'rate_max'`` and ``'rate_min'`` (largest and smallest non-vanishing decay rates), ``'scale_max'`` and ``'scale_min'`` (largest and smallest non-vanishing moduli of the eigenvalues), ``'freq_max'`` (largest oscillation frequency) and ``'nonlinearity'`` (largest change in the drift matrix at the amplitudes set by the drive, if the system implements ``get_A_jac``).
+    """
+
+    # initial values
+    iv_modes, _, c = system.get_ivc()
+    if modes is None:
+        modes = iv_modes
+
+    # eigenvalues of the drift matrix
+    eigs = np.linalg.eigvals(np.array(system.get_A(modes, c, t)))
+    rates = np.abs(np.real(eigs))
+    rates = rates[rates > 0.0] if np.any(rates > 0.0) else np.array([0.0])
+    scales = np.abs(eigs)
+    scales = scales[scales > 0.0] if np.any(scales > 0.0) else np.array([0.0])
+
+    # strength of the nonlinearity at the amplitudes set by the drive
+    nonlinearity = None
+    if hasattr(system, 'get_A_jac'):
+        amplitude = np.max(np.abs(system.get_mode_rates(modes, c, t))) / np.max(rates)
+        nonlinearity = np.max(np.abs(system.get_A_jac(modes, c, t))) * amplitude
+
+    return {
+        'eigs'          : eigs,
+        'rate_max'      : np.max(rates),
+        'rate_min'      : np.min(rates),
+        'scale_max'     : np.max(scales),
+        'scale_min'     : np.min(scales),
+        'freq_max'      : np.max(np.abs(np.imag(eigs))),
+        'nonlinearity'  : nonlinearity
+    }
+
+def get_relaxed_modes(system, params, num_samples=16):
+    """Function to obtain samples of the classical modes after their transient.
+
+    Only the classical modes are integrated, which is cheap compared to the integration of the correlations.
+    The samples are spread evenly over the window between ``t_index_min`` and ``t_index_max`` of the solver parameters, or over the last tenth of the times without a window.
+
+    Parameters
+    ----------
+    system : :class:`qom.systems.BaseSystem`
+        Instance of the system.
+    params : dict
+        Parameters for the solver.
+    num_samples : int, optional
+        Number of samples. Default is :math:`16`.
+
+    Returns
+    -------
+    Modes : numpy.ndarray
+        Classical modes at the sampled times.
+    T : numpy.ndarray
+        Sampled times.
+    """
+
+    # extract frequently used variables
+    iv_modes, _, c = system.get_ivc()
+    t_min = params.get('t_min', 0.0)
+    t_max = params.get('t_max', 1000.0)
+    t_dim = params.get('t_dim', 10001)
+    T_all = np.linspace(t_min, t_max, t_dim)
+    t_index_min = params.get('t_index_min', None)
+    t_index_max = params.get('t_index_max', None)
+    t_0 = T_all[t_index_min] if t_index_min is not None else t_max - 0.1 * (t_max - t_min)
+    t_1 = T_all[t_index_max] if t_index_max is not None else t_max
+    T = np.linspace(t_0, t_1, num_samples)
+
+    # integrate the classical modes only
+    func = lambda t, y: np.asarray(system.get_mode_rates(y.view(np.complex128), c, t), dtype=np.complex128).view(np.float64)
+    sol = si.solve_ivp(func, (t_min, t_1), np.asarray(iv_modes, dtype=np.complex128).view(np.float64), method='DOP853', t_eval=T, atol=1e-9, rtol=1e-7)
+    assert sol.success, 'Integration failed with message ``{}``'.format(sol.message)
+
+    return sol.y.transpose().copy().view(np.complex128), T
+
+def get_etd_dt(system, params, rtol=1e-4, t_probe=100.0, dt_probe=0.025):
+    r"""Function to obtain the step size of the exponential integrator for a target relative error of the correlations.
+
+    The error is estimated by step doubling over a probe span from the minimum time, where the fourth-order scheme gives the error :math:`\epsilon_{h / 2} \approx \max_{t} \left| y_{h} (t) - y_{h / 2} (t) \right| / 15` of the halved step.
+    The probe covers the build-up of the intracavity fields, over which the error grows fastest.
+    Assuming the error to scale as :math:`h^{4}` and to accumulate linearly with the time after the probe, the step size for the relative error ``rtol`` up to the maximum time is :math:`\frac{h}{2} \left( \mathrm{rtol} \, t_{probe} / \epsilon_{h / 2} / t_{span} \right)^{1 / 4}`, bounded by the probed step size.
+
+    Parameters
+    ----------
+    system : :class:`qom.systems.BaseSystem`
+        Instance of the system.
+    params : dict
+        Parameters for the solver.
+    rtol : float, optional
+        Target relative error of the correlations at the maximum time. Default is :math:`10^{-4}`.
+    t_probe : float, optional
+        Span of the probe. Default is :math:`100.0`.
+    dt_probe : float, optional
+        Larger step size of the probe. Default is :math:`0.025`.
+
+    Returns
+    -------
+    etd_dt : float
+        Step size of the exponential integrator.
+    """
+
+    # extract frequently used variables
+    t_min = params.get('t_min', 0.0)
+    t_span = params.get('t_max', 1000.0) - t_min
+    t_probe = min(t_probe, t_span)
+
+    # correlations over the probe for the step and its half
+    Corrs = [HLESolver(
+        system=system,
+        params=dict(params, ode_method='etdrk4', etd_dt=h, dtype='float64', t_max=t_min + t_probe, t_dim=21, t_index_min=0, t_index_max=20, output_stride=None, cache=False)
+    ).get_modes_corrs()[1] for h in [dt_probe, dt_probe / 2.0]]
+    error = np.max(np.abs(Corrs[0] - Corrs[1])) / max(np.max(np.abs(Corrs[1])), np.finfo(np.float64).tiny) / 15.0
+
+    # step size for the target error over the span
+    if error == 0.0:
+        return dt_probe
+    return float(min(dt_probe / 2.0 * (rtol / error / max(t_span / t_probe, 1.0))**0.25, dt_probe))
+
+def get_solver_params(system, params):
+    """Function to select the integrator and its tolerances for a given parameter point.
+
+    The selection is performed only if the value of ``'ode_method'`` is ``'auto'``.
+    The drift matrix is evaluated on the classical modes sampled after their transient (see :func:`get_relaxed_modes`), where the intracavity fields set the optomechanical couplings, instead of the empty cavities at the initial state.
+    The stiffness ratio is estimated as the ratio of the largest modulus of the eigenvalues over the samples to the smallest, bounded by the slowest time scale resolved within the integration span.
+    The moduli include the frequencies, such that the nearly neutral directions along a limit cycle, which oscillate with the mechanical modes, do not count as slow time scales.
+    Explicit Runge-Kutta (``'dopri5'``) is selected for non-stiff points.
+    For stiff points, the exponential integrator (``'etdrk4'``) is selected if the nonlinearity is weak compared to the linear part, otherwise BDF is selected for moderately stiff points and Radau for very stiff or weakly damped oscillatory points.
+
+    Parameters
+    ----------
+    system : :class:`qom.systems.BaseSystem`
+        Instance of the system.
+    params : dict
+        Parameters for the solver. Along with the solver parameters, the selection parameters are:
+        ========================    ====================================================
+        key                         meaning
+        ========================    ====================================================
+        stiff_ratio_explicit        (*float*) stiffness ratio below which the explicit integrator is selected. Default is :math:`10^{2}`.
+        stiff_ratio_implicit        (*float*) stiffness ratio above which Radau is always selected. Default is :math:`10^{4}`.
+        oscillation_ratio           (*float*) ratio of the largest frequency to the largest decay rate above which Radau is preferred over BDF. Default is :math:`10.0`.
+        nonlinearity_ratio          (*float*) ratio of the nonlinearity to the largest decay rate below which the exponential integrator is selected. Default is :math:`0.1`.
+        etd_rtol                    (*float*) target relative error of the correlations for the step size of the exponential integrator (see :func:`get_etd_dt`). Default is :math:`10^{-4}`.
+        ========================    ====================================================
+
+    Returns
+    -------
+    params : dict
+        Updated parameters for the solver.
+    """
+
+    # return unchanged parameters if method is specified
+    if params.get('ode_method', 'auto') != 'auto':
+        return params
+
+    # set selection parameters
+    _params = copy.deepcopy(selection_defaults)
+    _params.update({key: params[key] for key in selection_defaults if key in params})
+
+    # estimate stiffness after the transient
+    Modes, T = get_relaxed_modes(
+        system=system,
+        params=params
+    )
+    stiffnesses = [get_stiffness(
+        system=system,
+        modes=modes,
+        t=t
+    ) for modes, t in zip(Modes, T)]
+    stiffness = {
+        'rate_max'      : max([item['rate_max'] for item in stiffnesses]),
+        'rate_min'      : min([item['rate_min'] for item in stiffnesses]),
+        'scale_max'     : max([item['scale_max'] for item in stiffnesses]),
+        'scale_min'     : min([item['scale_min'] for item in stiffnesses]),
+        'freq_max'      : max([item['freq_max'] for item in stiffnesses]),
+        'nonlinearity'  : max([item['nonlinearity'] for item in stiffnesses]) if stiffnesses[0]['nonlinearity'] is not None else None
+    }
+    t_span = params.get('t_max', 1000.0) - params.get('t_min', 0.0)
+    ratio = stiffness['scale_max'] / max(stiffness['scale_min'], 1.0 / t_span)
+
+    # select integrator
+    if ratio < _params['stiff_ratio_explicit']:
+        family = 'explicit'
+        ode_method = 'dopri5'
+    elif stiffness['nonlinearity'] is not None and stiffness['nonlinearity'] < _params['nonlinearity_ratio'] * stiffness['rate_max']:
+        family = 'split'
+        ode_method = 'etdrk4'
+    else:
+        family = 'implicit'
+        if ratio >= _params['stiff_ratio_implicit'] or stiffness['freq_max'] > _params['oscillation_ratio'] * stiffness['rate_max']:
+            ode_method = 'Radau'
+        else:
+            ode_method = 'BDF'
+
+    # update parameters
+    params = copy.deepcopy(params)
+    params['ode_method'] = ode_method
+    params['ode_is_stiff'] = family == 'implicit'
+    params.update(selection_tolerances[family])
+    if family == 'split':
+        params['etd_dt'] = get_etd_dt(
+            system=system,
+            params=params,
+            rtol=_params['etd_rtol']
+        )
+
+    # log choice
+    logger.info('{name}: stiffness ratio {ratio:.2e}, selected {ode_method} ({settings})\n'.format(
+        name=getattr(system, 'name', type(system).__name__),
+        ratio=ratio,
+        ode_method=ode_method,
+        settings='dt={:.2e}'.format(params['etd_dt']) if family == 'split' else 'atol={:.0e}, rtol={:.0e}'.format(params['ode_atol'], params['ode_rtol'])
+    ))
+
+    return params
+
+class HLESolver():
+    r"""Class to solve the Heisenberg-Langevin equations of the classical modes and quantum correlations.
+
+    The solver mirrors the interface of :class:`qom.solvers.deterministic.HLESolver` and additionally passes the analytic Jacobian of the systems to the implicit integrators.
+    The state is integrated in the real form :math:`\left[ \mathrm{Re} \alpha_{L}, \mathrm{Im} \alpha_{L}, ..., V_{00}, V_{01}, ... \right]`.
+    The noise matrix is assumed to be independent of the modes.
+
+    Parameters
+    ----------
+    system : :class:`qom.systems.BaseSystem`
+        Instance of the system. The Jacobian is used if the system implements ``get_mode_rates_jac`` and ``get_A_jac``.
+    params : dict
+        Parameters for the solver. The solver parameters are:
+        ================    ====================================================
+        key                 meaning
+        ================    ====================================================
+        ode_method          (*str*) method used to solve the ODEs. Available options are ``'auto'`` (selected by :func:`get_solver_params`), ``'dop853'``, ``'dopri5'``, ``'lsoda'``, ``'vode'`` (``scipy.integrate.ode``), ``'BDF'``, ``'DOP853'``, ``'LSODA'``, ``'Radau'``, ``'RK23'``, ``'RK45'`` (``scipy.integrate.solve_ivp``) and ``'etdrk4'`` (:class:`utils.integrators.ETDRK4`). Default is ``'vode'``.
+        ode_is_stiff        (*bool*) option to use the BDF method of ``'vode'`` instead of the Adams method, as in :class:`qom.solvers.deterministic.HLESolver`. Default is ``False``.
+        ode_atol            (*float*) absolute tolerance of the integrator. Default is :math:`10^{-12}`.
+        ode_rtol            (*float*) relative tolerance of the integrator. Default is :math:`10^{-6}`.
+        use_jac             (*bool*) option to use the analytic Jacobian. Default is ``True``.
+        dtype               (*str*) precision of the real-form state. Available options are ``'float32'`` and ``'float64'``. For ``'float32'``, the exponential integrator steps in single precision and the outputs of all integrators are stored in single precision, while the ``scipy`` integrators step in double precision. Default is ``'float64'``.
+        etd_dt              (*float*) largest step size of the exponential integrator, whose relative error of the correlations is about :math:`2 \times 10^{-5}` at the default over a span of :math:`100` (see :func:`get_etd_dt` for a step size from a target error). Default is :math:`0.0125`.
+        t_min               (*float*) minimum time. Default is :math:`0.0`.
+        t_max               (*float*) maximum time. Default is :math:`1000.0`.
+        t_dim               (*int*) number of time points. Default is :math:`10001`.
+        t_index_min         (*int*) index of the first time of the window. Default is :math:`0`.
+        t_index_max         (*int*) index of the last time of the window. Default is ``t_dim - 1``.
+        output_stride       (*int*) stride of the output times outside the window, which is always returned at full resolution. If ``None``, only the window is returned. Default is :math:`1`.
+        iv_modes            (*str* or *list*) initial values of the classical modes. If ``'fixed_point'``, the modes are initialized at a fixed point (see :func:`utils.equilibria.get_iv_modes`). If ``None``, the values from ``get_ivc`` of the system are used. Default is ``None``.
+        show_progress       (*bool*) option to log the progress of the integration. Default is ``False``.
+        cache               (*bool*) option to load the output from and save it to a file in ``cache_dir``, named by the hash of the system and the parameters of the integration (see :meth:`get_cache_path`). Default is ``False``.
+        cache_dir           (*str*) directory of the cached outputs. Default is ``'data/v3.0_qom-v1.0.1/cache'``.
+        ================    ====================================================
+
+    The integrator steps over the times outside the output, which are neither interpolated nor stored.
+    The integrations raise an ``AssertionError`` if the integrator fails.
+    """
+
+    # default parameters of the solver
+    solver_defaults = {
+        'ode_method'    : 'vode',
+        'ode_is_stiff'  : False,
+        'ode_atol'      : 1e-12,
+        'ode_rtol'      : 1e-6,
+        'use_jac'       : True,
+        'dtype'         : 'float64',
+        'etd_dt'        : 0.0125,
+        't_min'         : 0.0,
+        't_max'         : 1000.0,
+        't_dim'         : 10001,
+        'output_stride' : 1,
+        'iv_modes'      : None,
+        'show_progress' : False,
+        'cache'         : False,
+        'cache_dir'     : 'data/v3.0_qom-v1.0.1/cache'
+    }
+
+    # methods of scipy.integrate.ode
+    methods_ode = ['dop853', 'dopri5', 'lsoda', 'vode']
+    # methods of scipy.integrate.solve_ivp
+    methods_solve_ivp = ['BDF', 'DOP853', 'LSODA', 'Radau', 'RK23', 'RK45']
+    # exponential integrators
+    methods_etd = ['etdrk4']
+    # methods accepting the Jacobian
+    methods_jac = ['lsoda', 'vode', 'BDF', 'LSODA', 'Radau']
+    # precisions of the state
+    dtypes = ['float32', 'float64']
+    # parameters not affecting the output
+    output_ignored_keys = ['show_progress', 'cache', 'cache_dir']
+
+    def __init__(self, system, params={}):
+        """Class constructor for HLESolver."""
+
+        # set attributes
+        self.system = system
+        self.params = copy.deepcopy(self.solver_defaults)
+        self.params.update(params)
+        self.params = get_solver_params(
+            system=system,
+            params=self.params
+        )
+        assert self.params['ode_method'] in self.methods_ode + self.methods_solve_ivp + self.methods_etd, 'Parameter ``ode_method`` should be one of ``{}``'.format(self.methods_ode + self.methods_solve_ivp + self.methods_etd)
+        assert self.params['dtype'] in self.dtypes, 'Parameter ``dtype`` should be one of ``{}``'.format(self.dtypes)
+
+        # precisions of the real and complex values
+        self.dtype = np.dtype(self.params['dtype'])
+        self.dtype_complex = np.result_type(self.dtype, np.complex64)
+
+        # initial values
+        self.iv_modes, self.iv_corrs, self.c = system.get_ivc()
+        if type(self.params['iv_modes']) is str:
+            assert self.params['iv_modes'] == 'fixed_point', 'Parameter ``iv_modes`` should be either ``fixed_point``, a list of modes or ``None``'
+
+            # local modules
+            from utils.equilibria import get_iv_modes
+
+            self.iv_modes = get_iv_modes(
+                system=system,
+                c=self.c
+            )
+        elif self.params['iv_modes'] is not None:
+            self.iv_modes = np.asarray(self.params['iv_modes'], dtype=np.complex128)
+        self.dim_m = 2 * system.num_modes
+        self.dim_c = self.dim_m**2
+
+        # option to use the Jacobian
+        self.has_jac = self.params['use_jac'] and self.params['ode_method'] in self.methods_jac and hasattr(system, 'get_mode_rates_jac') and hasattr(system, 'get_A_jac')
+
+    def get_output_indices(self):
+        """Method to obtain the indices of the output times in the integration grid.
+
+        Returns
+        -------
+        idxs : numpy.ndarray
+            Sorted indices of the output times.
+        """
+
+        # extract frequently used variables
+        t_dim = self.params['t_dim']
+        t_index_min = self.params.get('t_index_min', 0)
+        t_index_max = self.params.get('t_index_max', t_dim - 1)
+        window = np.arange(t_index_min, t_index_max + 1)
+
+        # only the window
+        if self.params['output_stride'] is None:
+            return window
+
+        return np.union1d(np.arange(0, t_dim, self.params['output_stride']), window)
+
+    def get_window(self):
+        """Method to obtain the window between ``t_index_min`` and ``t_index_max`` in the output values.
+
+        Returns
+        -------
+        window : slice
+            Window of the output values.
+        """
+
+        # extract frequently used variables
+        idxs = self.get_output_indices()
+        t_index_min = self.params.get('t_index_min', 0)
+        t_index_max = self.params.get('t_index_max', self.params['t_dim'] - 1)
+
+        return slice(int(np.searchsorted(idxs, t_index_min)), int(np.searchsorted(idxs, t_index_max, side='right')))
+
+    def get_times(self):
+        """Method to obtain the times at which the values are returned.
+
+        Returns
+        -------
+        T : numpy.ndarray
+            Output times.
+        """
+
+        return np.linspace(self.params['t_min'], self.params['t_max'], self.params['t_dim'])[self.get_output_indices()]
+
+    def _split(self, y):
+        # extract modes and correlations from the real form
+        modes = np.ascontiguousarray(y[:self.dim_m]).view(np.result_type(y.dtype, np.complex64))
+        corrs = y[self.dim_m:].reshape((self.dim_m, self.dim_m))
+        return modes, corrs
+
+    def get_rates(self, t, y):
+        """Method to obtain the rates of change of the real-form state.
+
+        Parameters
+        ----------
+        t : float
+            Time at which the values are calculated.
+        y : numpy.ndarray
+            Real-form state.
+
+        Returns
+        -------
+        rates : numpy.ndarray
+            Rates of change of the real-form state, in the precision of the state.
+        """
+
+        # extract modes and correlations
+        modes, corrs = self._split(y)
+
+        # rates of the modes
+        mode_rates = np.asarray(self.system.get_mode_rates(modes, self.c, t), dtype=np.result_type(y.dtype, np.complex64))
+        # rates of the correlations
+        A = np.asarray(self.system.get_A(modes, self.c, t), dtype=y.dtype)
+        D = np.asarray(self.system.get_D(modes, corrs, self.c, t), dtype=y.dtype)
+        corr_rates = A.dot(corrs) + corrs.dot(A.transpose()) + D
+
+        return np.concatenate((mode_rates.view(y.dtype), corr_rates.ravel()))
+
+    def get_jac(self, t, y):
+        r"""Method to obtain the analytic Jacobian of the real-form state.
+
+        The block of the correlations with respect to the modes is :math:`\partial_{k} A V + V \partial_{k} A^{T}` and the block of the correlations with respect to themselves is :math:`A \otimes I + I \otimes A`.
+
+        Parameters
+        ----------
+        t : float
+            Time at which the values are calculated.
+        y : numpy.ndarray
+            Real-form state.
+
+        Returns
+        -------
+        jac : numpy.ndarray
+            Jacobian of the real-form state.
+        """
+
+        # extract modes and correlations
+        modes, corrs = self._split(y)
+
+        # derivatives
+        A = np.array(self.system.get_A(modes, self.c, t))
+        A_jac = np.asarray(self.system.get_A_jac(modes, self.c, t))
+        I = np.eye(self.dim_m)
+
+        # initialize Jacobian
+        jac = np.zeros((self.dim_m + self.dim_c, self.dim_m + self.dim_c), dtype=np.float64)
+        # modes with respect to modes
+        jac[:self.dim_m, :self.dim_m] = self.system.get_mode_rates_jac(modes, self.c, t)
+        # correlations with respect to modes
+        jac[self.dim_m:, :self.dim_m] = (np.einsum('kij,jl->ilk', A_jac, corrs) + np.einsum('ij,klj->ilk', corrs, A_jac)).reshape((self.dim_c, self.dim_m))
+        # correlations with respect to correlations
+        jac[self.dim_m:, self.dim_m:] = np.kron(A, I) + np.kron(I, A)
+
+        return jac
+
+    def get_linear_part(self):
+        r"""Method to obtain the linear part and the constant forcing of the real-form rates.
+
+        The linear part of the modes is the Jacobian of the mode rates at vanishing amplitudes and that of the correlations is :math:`A_{0} \otimes I + I \otimes A_{0}`, where :math:`A_{0}` is the drift matrix at vanishing amplitudes.
+
+        Returns
+        -------
+        L : numpy.ndarray
+            Linear part of the real-form rates.
+        f_0 : numpy.ndarray
+            Constant forcing of the real-form rates.
+        """
+
+        assert hasattr(self.system, 'get_mode_rates_jac'), 'System should implement ``get_mode_rates_jac`` for exponential integrators'
+
+        # dependencies
+        import scipy.linalg as sl
+
+        # vanishing amplitudes
+        t = self.params['t_min']
+        modes = np.zeros(self.system.num_modes, dtype=np.complex128)
+        I = np.eye(self.dim_m)
+
+        # linear parts
+        L_m = np.array(self.system.get_mode_rates_jac(modes, self.c, t))
+        A_0 = np.array(self.system.get_A(modes, self.c, t))
+        L = sl.block_diag(L_m, np.kron(A_0, I) + np.kron(I, A_0))
+
+        # constant forcing
+        f_0 = np.concatenate((np.asarray(self.system.get_mode_rates(modes, self.c, t), dtype=np.complex128).view(np.float64), np.asarray(self.system.get_D(modes, self.iv_corrs, self.c, t)).ravel()))
+
+        return L, f_0
+
+    def integrate(self, func, y_0, jac=None):
+        """Method to integrate a real-form state from the minimum time over the output times of the solver with the ``scipy`` integrators.
+
+        Parameters
+        ----------
+        func : callable
+            Rates of change of the state, formatted as ``func(t, y)``.
+        y_0 : numpy.ndarray
+            State at the initial time.
+        jac : callable, optional
+            Jacobian of the rates, formatted as ``jac(t, y)``.
+
+        Returns
+        -------
+        Ys : numpy.ndarray
+            States at the output times.
+        """
+
+        # extract frequently used variables
+        T = self.get_times()
+        t_0 = self.params['t_min']
+        jac = jac if self.params['ode_method'] in self.methods_jac else None
+
+        # log progress in steps of a tenth of the span
+        if self.params['show_progress']:
+            progress = [0]
+            _func = func
+            def func(t, y):
+                if (t - t_0) >= (progress[0] + 1) * (T[-1] - t_0) / 10.0:
+                    progress[0] = int(10.0 * (t - t_0) / (T[-1] - t_0))
+                    logger.info('Integrating {} ({}%)\n'.format(getattr(self.system, 'name', type(self.system).__name__), 10 * progress[0]))
+                return _func(t, y)
+
+        # scipy.integrate.solve_ivp
+        if self.params['ode_method'] in self.methods_solve_ivp:
+            kwargs = {'jac': jac} if jac is not None else {}
+            sol = si.solve_ivp(
+                fun=func,
+                t_span=(t_0, T[-1]),
+                y0=y_0,
+                method=self.params['ode_method'],
+                t_eval=T,
+                atol=self.params['ode_atol'],
+                rtol=self.params['ode_rtol'],
+                **kwargs
+            )
+            assert sol.success, 'Integration failed with message ``{}``'.format(sol.message)
+            Ys = sol.y.transpose()
+        # scipy.integrate.ode
+        else:
+            # maximum number of steps scaled by the longest skipped span
+            dt = (self.params['t_max'] - t_0) / max(self.params['t_dim'] - 1, 1)
+            nsteps = int(min(1e6 * max(1.0, np.max(np.diff(np.concatenate(([t_0], T)))) / dt), 2**31 - 1))
+
+            integrator = si.ode(func, jac)
+            if self.params['ode_method'] == 'vode':
+                integrator.set_integrator('vode', method='bdf' if self.params['ode_is_stiff'] else 'adams', atol=self.params['ode_atol'], rtol=self.params['ode_rtol'], nsteps=nsteps)
+            else:
+                integrator.set_integrator(self.params['ode_method'], atol=self.params['ode_atol'], rtol=self.params['ode_rtol'], nsteps=nsteps)
+            integrator.set_initial_value(y_0, t_0)
+            Ys = np.zeros((len(T), len(y_0)), dtype=np.float64)
+            for i in range(len(T)):
+                Ys[i] = y_0 if T[i] == t_0 else integrator.integrate(T[i])
+                assert integrator.successful(), 'Integration failed at time {} with return code ``{}``'.format(T[i], integrator.get_return_code())
+
+        return Ys
+
+    def get_cache_path(self):
+        """Method to obtain the path of the cached output.
+
+        The name of the file is the hash of the name and parameters of the system along with the parameters of the solver affecting the output.
+
+        Returns
+        -------
+        file_path : str
+            Path of the ``.npz`` file.
+        """
+
+        # dependencies
+        import hashlib
+        import json
+        import os
+
+        # canonical representation
+        params = {key: value for key, value in self.params.items() if key not in self.output_ignored_keys}
+        text = json.dumps([getattr(self.system, 'name', type(self.system).__name__), getattr(self.system, 'params', {}), params], sort_keys=True, default=str)
+
+        return os.path.join(self.params['cache_dir'], 'hle_' + hashlib.sha1(text.encode()).hexdigest()[:24] + '.npz')
+
+    def get_modes_corrs(self):
+        """Method to obtain the classical modes and quantum correlations.
+
+        Returns
+        -------
+        Modes : numpy.ndarray
+            Classical modes at the output times.
+        Corrs : numpy.ndarray
+            Quantum correlations at the output times.
+        """
+
+        # cached output
+        if self.params['cache']:
+            # dependencies
+            import os
+
+            file_path = self.get_cache_path()
+            if os.path.isfile(file_path):
+                data = np.load(file_path)
+                return data['Modes'], data['Corrs']
+
+        # initial real-form state
+        y_0 = np.concatenate((np.asarray(self.iv_modes, dtype=np.complex128).view(np.float64), np.asarray(self.iv_corrs, dtype=np.float64).ravel()))
+        T = self.get_times()
+        jac = self.get_jac if self.has_jac else None
+
+        # exponential integrator with steps dividing the spacing of the integration grid
+        if self.params['ode_method'] in self.methods_etd:
+            # local modules
+            from utils.integrators import ETDRK4
+
+            L, f_0 = self.get_linear_part()
+            L_state, f_0 = L.astype(self.dtype), f_0.astype(self.dtype)
+            dt = (self.params['t_max'] - self.params['t_min']) / (self.params['t_dim'] - 1) if self.params['t_dim'] > 1 else self.params['etd_dt']
+            num_steps = int(np.ceil(dt / self.params['etd_dt'] - 1e-9))
+            # start from the minimum time
+            has_t_0 = T[0] == self.params['t_min']
+            Ys = ETDRK4(
+                L=L,
+                f_0=f_0,
+                func_N=lambda t, y: self.get_rates(t, y) - L_state.dot(y) - f_0,
+                h=dt / num_steps
+            ).integrate(T if has_t_0 else np.concatenate(([self.params['t_min']], T)), y_0.astype(self.dtype))
+            Ys = Ys if has_t_0 else Ys[1:]
+        # scipy integrators
+        else:
+            Ys = self.integrate(
+                func=self.get_rates,
+                y_0=y_0,
+                jac=jac
+            )
+
+        # extract modes and correlations in the precision of the state
+        Ys = Ys.astype(self.dtype, copy=False)
+        Modes = np.ascontiguousarray(Ys[:, :self.dim_m]).view(self.dtype_complex)
+        Corrs = Ys[:, self.dim_m:].reshape((len(Ys), self.dim_m, self.dim_m))
+
+        # update cache
+        if self.params['cache']:
+            # dependencies
+            import os
+
+            os.makedirs(self.params['cache_dir'], exist_ok=True)
+            np.savez_compressed(file_path, Modes=Modes, Corrs=Corrs)
+
+        return Modes, Corrs
+
+def get_func_quantum_correlation_measures(SystemClass, params, steady_state=False, cb_update=None):
+    """Function to obtain the function returning the quantum correlation measures of a system.
+
+    The function mirrors :func:`qom.utils.solvers.get_func_quantum_correlation_measures` and integrates the system with :class:`HLESolver`.
+    Outside the steady state, the window of the trajectory is read from :func:`utils.caches.get_modes_corrs`, so that other measures at the same point reuse the integration.
+
+    Parameters
+    ----------
+    SystemClass : :class:`qom.systems.BaseSystem`
+        Class of the system.
+    params : dict
+        Parameters for the solver and the measures.
+    steady_state : bool, optional
+        Option to return the measures at the final time only. Default is ``False``.
+    cb_update : callable, optional
+        Callback function to update status and progress.
+
+    Returns
+    -------
+    func : callable
+        Function returning the measures for given system parameters, formatted as ``func(system_params)``.
+    """
+
+    # qom modules
+    from qom.solvers.measure import QCMSolver
+    # local modules
+    from utils.caches import get_modes_corrs
+
+    def func(system_params):
+        # get modes and correlations at the final time
+        if steady_state:
+            t_index = params.get('t_dim', HLESolver.solver_defaults['t_dim']) - 1
+            Modes, Corrs = HLESolver(
+                system=SystemClass(
+                    params=system_params,
+                    cb_update=cb_update
+                ),
+                params=dict(params, t_index_min=t_index, t_index_max=t_index, output_stride=None)
+            ).get_modes_corrs()
+        # get cached window
+        else:
+            Modes, Corrs = get_modes_corrs(
+                SystemClass=SystemClass,
+                system_params=system_params,
+                params=params,
+                cb_update=cb_update
+            )
+
+        return QCMSolver(
+            Modes=Modes,
+            Corrs=Corrs,
+            params=params
+        ).get_measures()
+
+    return func
+
+def get_precision_errors(SystemClass, system_params, params):
+    """Function to validate the single-precision state against the double-precision state at a reference point.
+
+    Both states are integrated over the window between ``t_index_min`` and ``t_index_max`` only.
+
+    Parameters
+    ----------
+    SystemClass : :class:`qom.systems.BaseSystem`
+        Class of the system.
+    system_params : dict
+        Parameters of the system at the reference point.
+    params : dict
+        Parameters for the solver and the measures.
+
+    Returns
+    -------
+    errors : dict
+        Largest relative errors of the single-precision values in the window. The keys are ``'modes'``, ``'corrs'`` and ``'sync_p'`` (error of the average quantum phase synchronization).
+    """
+
+    # local modules
+    from utils.measures import get_average, get_sync_p
+
+    # values in both precisions
+    values = dict()
+    for dtype in ['float64', 'float32']:
+        Modes, Corrs = HLESolver(
+            system=SystemClass(
+                params=system_params
+            ),
+            params=dict(params, dtype=dtype, output_stride=None)
+        ).get_modes_corrs()
+        values[dtype] = (Modes, Corrs, get_average(get_sync_p(Modes, Corrs, params.get('indices', [1, 3]))))
+
+    # relative errors
+    errors = {key: float(np.max(np.abs(values['float32'][i] - values['float64'][i])) / max(float(np.max(np.abs(values['float64'][i]))), np.finfo(np.float64).tiny)) for i, key in enumerate(['modes', 'corrs', 'sync_p'])}
+    logger.info('Errors of single precision: modes {modes:.2e}, corrs {corrs:.2e}, sync_p {sync_p:.2e}\n'.format(**errors))
+
+    return errors
@@ -0,0 +1,390 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Module to emulate the measures of the coupled QOM systems with surrogate models."""
+
+__authors__ = ["Sampreet Kalita"]
+__toolbox__ = 'qom-v1.0.1'
+__created__ = "2026-10-18"
+__updated__ = "2026-10-19"
+
+# dependencies
+import copy
+import logging
+import numpy as np
+import numpy.polynomial.chebyshev as npc
+import os
+import re
+
+# module logger
+logger = logging.getLogger(__name__)
+
+def get_grid(file_path):
+    """Function to load the values of a sweep along with the axes encoded in its file name.
+
+    The file names follow the format ``{prefix}_x={var}_{min}_{max}_{dim}[_y={var}_{min}_{max}_{dim}].npz`` of the loopers, and the values are formatted as ``values[y_index][x_index]`` for two axes.
+
+    Parameters
+    ----------
+    file_path : str
+        Path of the ``.npz`` file.
+
+    Returns
+    -------
+    grid : dict
+        Grid of the sweep with keys ``'x_var'``, ``'X'`` and ``'V'``, and ``'y_var'`` and ``'Y'`` for two axes.
+    """
+
+    # parse axes
+    name = os.path.splitext(os.path.basename(file_path))[0]
+    axes = re.findall(r'([xy])=(\w+?)_(-?[\d.e-]+)_(-?[\d.e-]+)_(\d+)', name)
+    assert len(axes) > 0, 'File name ``{}`` should contain the axes of the sweep'.format(name)
+
+    # update grid
+    grid = {
+        'V' : np.load(file_path)['arr_0']
+    }
+    for axis, var, _min, _max, dim in axes:
+        grid[axis + '_var'] = var
+        grid[axis.upper()] = np.linspace(float(_min), float(_max), int(dim))
+
+    return grid
+
+class Surrogate():
+    r"""Class to emulate a measure over two system parameters from its values on a set of points.
+
+    The parameters are scaled to :math:`\left[ -1, 1 \right]` before fitting.
+    The hyperparameters of the Gaussian-process model (the length scales along each axis, the variance of the values and the noise variance) are fitted by maximizing the log marginal likelihood.
+    The uncertainty of a prediction is the root-mean-square error of the model at the nearest points, obtained by cross-validation over ``num_folds`` folds, such that it is large where the measure varies faster than the points resolve.
+    For the Gaussian-process model, it is at least the posterior standard deviation, which is large away from the points.
+    The predictions are clipped to ``min_value``, as the phase synchronization is non-negative.
+    Points whose ``num_sigmas`` standard deviations exceed ``threshold`` are marked for a true solve and can be refined by :meth:`refine`.
+
+    Parameters
+    ----------
+    params : dict
+        Parameters for the surrogate. The surrogate parameters are:
+        ================    ====================================================
+        key                 meaning
+        ================    ====================================================
+        method              (*str*) model of the surrogate. Available options are ``'chebyshev'``, ``'gp'`` and ``'rbf'``. Default is ``'chebyshev'``.
+        degree              (*int*) degree of the Chebyshev series along each axis. Default is :math:`20`.
+        rbf_kernel          (*str*) kernel of the radial basis functions. Default is ``'thin_plate_spline'``.
+        rbf_neighbors       (*int*) number of nearest points used by the radial basis functions. Default is :math:`64`.
+        rbf_smoothing       (*float*) smoothing of the radial basis functions. Default is :math:`0.0`.
+        gp_length_scale     (*float*) initial length scale of the squared-exponential kernel in the scaled parameters. Default is :math:`0.2`.
+        gp_noise            (*float*) initial noise variance relative to the variance of the values. Default is :math:`10^{-4}`.
+        gp_max_points       (*int*) maximum number of points used by the Gaussian process. Default is :math:`1024`.
+        num_folds           (*int*) number of folds of the cross-validation. Default is :math:`5`.
+        num_neighbors       (*int*) number of nearest points defining the uncertainty. Default is :math:`8`.
+        min_value           (*float*) lower bound of the measure, or ``None`` for measures without bound such as the transverse Lyapunov exponent. Default is :math:`0.0`.
+        threshold           (*float*) uncertainty above which a true solve is needed. Default is :math:`0.01`.
+        num_sigmas          (*float*) number of standard deviations of the uncertainty compared to the threshold. Default is :math:`2.0`.
+        seed                (*int*) seed of the subsets of points. Default is :math:`0`.
+        ================    ====================================================
+    """
+
+    # default parameters of the surrogate
+    surrogate_defaults = {
+        'method'            : 'chebyshev',
+        'degree'            : 20,
+        'rbf_kernel'        : 'thin_plate_spline',
+        'rbf_neighbors'     : 64,
+        'rbf_smoothing'     : 0.0,
+        'gp_length_scale'   : 0.2,
+        'gp_noise'          : 1e-4,
+        'gp_max_points'     : 1024,
+        'num_folds'         : 5,
+        'num_neighbors'     : 8,
+        'min_value'         : 0.0,
+        'threshold'         : 0.01,
+        'num_sigmas'        : 2.0,
+        'seed'              : 0
+    }
+
+    # available models
+    methods = ['chebyshev', 'gp', 'rbf']
+
+    def __init__(self, params={}):
+        """Class constructor for Surrogate."""
+
+        # set attributes
+        self.params = copy.deepcopy(self.surrogate_defaults)
+        self.params.update(params)
+        assert self.params['method'] in self.methods, 'Parameter ``method`` should be one of ``{}``'.format(self.methods)
+        self.rng = np.random.default_rng(self.params['seed'])
+
+    @classmethod
+    def from_file(cls, file_path, params={}):
+        """Method to fit a surrogate to the values of a two-dimensional sweep.
+
+        Parameters
+        ----------
+        file_path : str
+            Path of the ``.npz`` file (see :func:`get_grid`).
+        params : dict, optional
+            Parameters for the surrogate.
+
+        Returns
+        -------
+        surrogate : :class:`Surrogate`
+            Fitted surrogate.
+        """
+
+        # extract grid
+        grid = get_grid(file_path)
+        assert 'Y' in grid, 'File ``{}`` should contain a two-dimensional sweep'.format(file_path)
+        X, Y = np.meshgrid(grid['X'], grid['Y'])
+
+        # fit surrogate
+        surrogate = cls(params)
+        surrogate.vars = [grid['x_var'], grid['y_var']]
+        surrogate.fit(np.stack((X.ravel(), Y.ravel()), axis=-1), grid['V'].ravel())
+
+        return surrogate
+
+    def _scale(self, points):
+        # scale parameters to [-1, 1]
+        return 2.0 * (np.atleast_2d(points) - self.mins) / (self.maxs - self.mins) - 1.0
+
+    def _clip(self, values):
+        # clip values to the lower bound of the measure
+        return values if self.params['min_value'] is None else np.maximum(values, self.params['min_value'])
+
+    def _get_model(self, points, values):
+        # model predicting the values and, for the Gaussian process, the variances
+        if self.params['method'] == 'chebyshev':
+            deg = [self.params['degree']] * 2
+            coeffs = np.linalg.lstsq(npc.chebvander2d(points[:, 0], points[:, 1], deg), values, rcond=None)[0].reshape((deg[0] + 1, deg[1] + 1))
+            return lambda _points: (npc.chebval2d(_points[:, 0], _points[:, 1], coeffs), None)
+
+        if self.params['method'] == 'rbf':
+            # dependencies
+            import scipy.interpolate as si
+
+            interpolator = si.RBFInterpolator(points, values, kernel=self.params['rbf_kernel'], neighbors=min(self.params['rbf_neighbors'], len(points)), smoothing=self.params['rbf_smoothing'])
+            return lambda _points: (interpolator(_points), None)
+
+        # dependencies
+        import scipy.linalg as sl
+
+        # Gaussian process with the fitted hyperparameters
+        length_scales, var, noise = self.hypers
+        mean = np.mean(values)
+        kernel = lambda a, b: var * np.exp(- 0.5 * np.sum(((a[:, None, :] - b[None, :, :]) / length_scales)**2, axis=-1))
+        factor = sl.cho_factor(kernel(points, points) + noise * np.eye(len(points)))
+        weights = sl.cho_solve(factor, values - mean)
+        def model(_points):
+            K_s = kernel(_points, points)
+            return mean + K_s.dot(weights), np.maximum(var - np.sum(K_s * sl.cho_solve(factor, K_s.transpose()).transpose(), axis=1), 0.0)
+        return model
+
+    def _get_hypers(self, points, values):
+        # hyperparameters of the Gaussian process maximizing the log marginal likelihood
+
+        # dependencies
+        import scipy.linalg as sl
+        import scipy.optimize as so
+
+        # extract frequently used variables
+        values = values - np.mean(values)
+        var = max(np.var(values), 1e-24)
+        sqr_dists = (points[:, None, :] - points[None, :, :])**2
+
+        # negative log marginal likelihood and its gradient in the logarithms of the hyperparameters
+        def func(theta):
+            length_scales, _var, noise = np.exp(theta[:2]), np.exp(theta[2]), np.exp(theta[3])
+            dists = sqr_dists / length_scales**2
+            K_f = _var * np.exp(- 0.5 * np.sum(dists, axis=-1))
+            try:
+                factor = sl.cho_factor(K_f + noise * np.eye(len(points)))
+            except np.linalg.LinAlgError:
+                return np.inf, np.zeros(4)
+            weights = sl.cho_solve(factor, values)
+            W = np.outer(weights, weights) - sl.cho_solve(factor, np.eye(len(points)))
+            value = 0.5 * values.dot(weights) + np.sum(np.log(np.diag(factor[0])))
+            grad = - 0.5 * np.array([np.sum(W * K_f * dists[..., 0]), np.sum(W * K_f * dists[..., 1]), np.sum(W * K_f), np.trace(W) * noise])
+            return value, grad
+
+        # maximize from the initial values
+        res = so.minimize(
+            fun=func,
+            x0=np.log([self.params['gp_length_scale'], self.params['gp_length_scale'], var, self.params['gp_noise'] * var]),
+            jac=True,
+            method='L-BFGS-B',
+            bounds=[(np.log(1e-2), np.log(1e1))] * 2 + [(np.log(1e-3 * var), np.log(1e3 * var)), (np.log(1e-10 * var), np.log(var))]
+        )
+        logger.debug('Fitted hyperparameters {} with log marginal likelihood {}\n'.format(np.exp(res.x), - res.fun))
+
+        return np.exp(res.x[:2]), np.exp(res.x[2]), np.exp(res.x[3])
+
+    def fit(self, points, values):
+        """Method to fit the surrogate to the values of the measure at a set of points.
+
+        Parameters
+        ----------
+        points : numpy.ndarray
+            Values of the two system parameters, in the format ``[[x, y], ...]``.
+        values : numpy.ndarray
+            Values of the measure. Points with non-finite values are ignored.
+
+        Returns
+        -------
+        surrogate : :class:`Surrogate`
+            Fitted surrogate.
+        """
+
+        # extract finite values
+        points = np.asarray(points, dtype=np.float64)
+        values = np.asarray(values, dtype=np.float64)
+        mask = np.isfinite(values)
+        self.points, self.values = points[mask], values[mask]
+
+        # scales of the parameters
+        self.mins = np.min(self.points, axis=0)
+        self.maxs = np.max(self.points, axis=0)
+
+        # dependencies
+        import scipy.spatial as ss
+
+        # extract frequently used variables
+        scaled = self._scale(self.points)
+        values = self.values
+
+        # Gaussian process on a subset of the points
+        if self.params['method'] == 'gp':
+            if len(scaled) > self.params['gp_max_points']:
+                idxs = self.rng.choice(len(scaled), self.params['gp_max_points'], replace=False)
+                scaled, values = scaled[idxs], values[idxs]
+            self.hypers = self._get_hypers(scaled, values)
+
+        # fit model
+        self.model = self._get_model(scaled, values)
+
+        # errors of the cross-validation
+        folds = np.array_split(self.rng.permutation(len(scaled)), self.params['num_folds'])
+        errors = np.empty(len(scaled), dtype=np.float64)
+        for idxs in folds:
+            mask = np.ones(len(scaled), dtype=bool)
+            mask[idxs] = False
+            errors[idxs] = self._clip(self._get_model(scaled[mask], values[mask])(scaled[idxs])[0]) - values[idxs]
+        self.tree = ss.cKDTree(scaled)
+        self.errors = errors
+
+        return self
+
+    def predict(self, points):
+        """Method to predict the measure and its uncertainty at a set of points.
+
+        Parameters
+        ----------
+        points : numpy.ndarray
+            Values of the two system parameters, in the format ``[[x, y], ...]``.
+
+        Returns
+        -------
+        values : numpy.ndarray
+            Predicted values of the measure.
+        stds : numpy.ndarray
+            Uncertainties of the predictions.
+        """
+
+        # predict
+        scaled = self._scale(points)
+        values, variances = self.model(scaled)
+
+        # mean squared errors of the nearest points
+        _, idxs = self.tree.query(scaled, k=min(self.params['num_neighbors'], len(self.errors)))
+        variances_cv = np.mean(self.errors[np.reshape(idxs, (len(scaled), -1))]**2, axis=1)
+        variances = variances_cv if variances is None else np.maximum(variances, variances_cv)
+
+        return self._clip(values), np.sqrt(variances)
+
+    def get_needs_solve(self, points):
+        """Method to mark the points at which a true solve is needed.
+
+        Parameters
+        ----------
+        points : numpy.ndarray
+            Values of the two system parameters, in the format ``[[x, y], ...]``.
+
+        Returns
+        -------
+        needs_solve : numpy.ndarray
+            Boolean mask of the points with uncertainties above the threshold.
+        """
+
+        return self.params['num_sigmas'] * self.predict(points)[1] > self.params['threshold']
+
+    def refine(self, func, points, num_iters=4, batch_size=8):
+        """Method to refine the surrogate by solving at the points of largest uncertainty.
+
+        Parameters
+        ----------
+        func : callable
+            Function returning the true measure at a point, formatted as ``func(point)``.
+        points : numpy.ndarray
+            Candidate points, in the format ``[[x, y], ...]``.
+        num_iters : int, optional
+            Maximum number of refinements. Default is :math:`4`.
+        batch_size : int, optional
+            Number of points solved in each refinement. Default is :math:`8`.
+
+        Returns
+        -------
+        points_solved : numpy.ndarray
+            Points solved during the refinements.
+        """
+
+        # extract frequently used variables
+        points = np.asarray(points, dtype=np.float64)
+        points_solved = list()
+
+        for i in range(num_iters):
+            # points of largest uncertainty
+            stds = self.params['num_sigmas'] * self.predict(points)[1]
+            idxs = [idx for idx in np.argsort(stds)[::-1][:batch_size] if stds[idx] > self.params['threshold']]
+            if len(idxs) == 0:
+                break
+            logger.info('Refinement {}: solving {} points with maximum uncertainty {}\n'.format(i, len(idxs), stds[idxs[0]]))
+
+            # solve and refit
+            values = [func(points[idx]) for idx in idxs]
+            points_solved += [points[idx] for idx in idxs]
+            self.fit(np.concatenate((self.points, points[idxs])), np.concatenate((self.values, values)))
+            points = np.delete(points, idxs, axis=0)
+
+        return np.array(points_solved)
+
+def get_func_measure(SystemClass, params):
+    """Function to obtain the function returning the true measure at a point for the refinement of a surrogate.
+
+    The measures are evaluated with :meth:`utils.optimizers.SyncOptimizer.get_value`.
+
+    Parameters
+    ----------
+    SystemClass : :class:`qom.systems.BaseSystem`
+        Class of the system.
+    params : dict
+        Parameters for the optimizer, the solver and the system (see :class:`utils.optimizers.SyncOptimizer`), where the optimizer parameters ``'objective'`` and ``'keys'`` select the measure and the two system parameters.
+
+    Returns
+    -------
+    func : callable
+        Function returning the average quantum phase synchronization or the transverse Lyapunov exponent, formatted as ``func(point)``.
+    """
+
+    # local modules
+    from utils.optimizers import SyncOptimizer
+
+    # solve without sensitivities
+    params = copy.deepcopy(params)
+    params.setdefault('optimizer', {})['use_grad'] = False
+    params['optimizer'].setdefault('bounds', [(None, None)] * len(params['optimizer'].get('keys', SyncOptimizer.optimizer_defaults['keys'])))
+    optimizer = SyncOptimizer(SystemClass, params)
+    sign = - 1.0 if optimizer.params['objective'] == 'sync_p' else 1.0
+
+    def func(point):
+        return sign * optimizer.get_value(np.asarray(point))[0]
+
+    return func
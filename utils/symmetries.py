@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Module to reduce the sweeps of the coupled QOM systems using the symmetries declared by the systems."""
+
+__authors__ = ["Sampreet Kalita"]
+__toolbox__ = 'qom-v1.0.1'
+__created__ = "2026-10-18"
+__updated__ = "2026-10-18"
+
+# dependencies
+import logging
+import numpy as np
+
+# module logger
+logger = logging.getLogger(__name__)
+
+def get_mirror(SystemClass, name, system_params, axes, measure_codes, indices=[1, 3], atol=1e-12):
+    r"""Function to obtain the images of the points of a sweep under a symmetry declared by a system.
+
+    The symmetries are declared in the ``symmetries`` attribute of the class of the system, formatted as ``{name: symmetry}``, where each symmetry is a dictionary with the keys
+
+    ==============  ================================================================================================================
+    key             value
+    ==============  ================================================================================================================
+    maps            (*dict*) functions mapping the values of the transformed parameters, formatted as ``{key: func}``.
+    pairs           (*list*) keys of the parameters in the format :math:`\left[ L, R \right]`, which should be equal for the symmetry to hold.
+    modes           (*list*) images of the indices of the modes.
+    measure_codes   (*list*) codes of the measures invariant under the symmetry.
+    ==============  ================================================================================================================
+
+    Parameters
+    ----------
+    SystemClass : :class:`qom.systems.BaseSystem`
+        Class of the system.
+    name : str
+        Name of the symmetry.
+    system_params : dict
+        Parameters of the system.
+    axes : list
+        Axes of the sweep, in the format ``[(var, values), ...]``, ordered as ``X`` followed by ``Y``.
+    measure_codes : list
+        Codes of the measures.
+    indices : list, optional
+        Indices of the modes of the measures. Default is :math:`\left[ 1, 3 \right]`.
+    atol : float, optional
+        Absolute tolerance to match the images of the values of the axes, relative to their spans. Default is :math:`10^{-12}`.
+
+    Returns
+    -------
+    mirror : numpy.ndarray
+        Indices of the images of the points, flattened as ``values[y_index][x_index]``.
+    """
+
+    # validate declaration
+    symmetries = getattr(SystemClass, 'symmetries', {})
+    assert name in symmetries, 'Symmetry ``{}`` is not declared by ``{}``, available options are ``{}``'.format(name, SystemClass.__name__, list(symmetries.keys()))
+    symmetry = symmetries[name]
+
+    # validate parameters
+    params = dict(getattr(SystemClass, 'system_defaults', {}), **system_params)
+    for key in symmetry['pairs']:
+        assert np.allclose(params[key][0], params[key][1], rtol=0.0, atol=atol), 'Symmetry ``{}`` requires equal values of ``{}``, found ``{}``'.format(name, key, params[key])
+    assert sorted([symmetry['modes'][index] for index in indices]) == sorted(indices), 'Symmetry ``{}`` maps the indices ``{}`` to ``{}``'.format(name, indices, [symmetry['modes'][index] for index in indices])
+    for measure_code in measure_codes:
+        assert measure_code in symmetry['measure_codes'], 'Symmetry ``{}`` does not leave the measure ``{}`` invariant, available options are ``{}``'.format(name, measure_code, symmetry['measure_codes'])
+
+    # fixed parameters should be invariant
+    keys = [axis[0] for axis in axes]
+    for key, func in symmetry['maps'].items():
+        if key not in keys:
+            assert np.allclose(func(params[key]), params[key], rtol=0.0, atol=atol), 'Symmetry ``{}`` changes the fixed value of ``{}``'.format(name, key)
+
+    # images of the values of the axes
+    images = list()
+    for key, values in axes:
+        if key not in symmetry['maps']:
+            images.append(np.arange(len(values)))
+            continue
+        mapped = symmetry['maps'][key](values)
+        idxs = np.argmin(np.abs(mapped[:, None] - values[None, :]), axis=1)
+        assert np.allclose(values[idxs], mapped, rtol=0.0, atol=atol * max(1.0, np.ptp(values))), 'Symmetry ``{}`` maps the values of ``{}`` outside the axis'.format(name, key)
+        images.append(idxs)
+
+    # images of the points
+    grids = np.meshgrid(*images[::-1], indexing='ij')
+
+    return np.ravel_multi_index([grid.ravel() for grid in grids], tuple(len(axis[1]) for axis in axes[::-1]))
+
+def get_representatives(mirror):
+    """Function to obtain the independent points of a sweep under a symmetry.
+
+    Parameters
+    ----------
+    mirror : numpy.ndarray
+        Indices of the images of the points (see :func:`get_mirror`).
+
+    Returns
+    -------
+    idxs : numpy.ndarray
+        Indices of the points not exceeding their images.
+    """
+
+    return np.flatnonzero(np.arange(len(mirror)) <= mirror)
+
+def get_samples(mirror, num_samples=4):
+    """Function to obtain the points sampled to verify a symmetry, along with their images.
+
+    Parameters
+    ----------
+    mirror : numpy.ndarray
+        Indices of the images of the points (see :func:`get_mirror`).
+    num_samples : int, optional
+        Number of sampled points. Default is :math:`4`.
+
+    Returns
+    -------
+    idxs : numpy.ndarray
+        Indices of the sampled points, distinct from their images and spread evenly over the independent points.
+    """
+
+    # independent points distinct from their images
+    idxs = np.flatnonzero(np.arange(len(mirror)) < mirror)
+    if len(idxs) == 0 or num_samples <= 0:
+        return np.zeros(0, dtype=int)
+
+    return np.unique(idxs[np.linspace(0, len(idxs) - 1, min(num_samples, len(idxs))).round().astype(int)])
+
+def get_symmetry_error(values, mirror, idxs, atol=1e-12):
+    """Function to obtain the maximum relative deviation of the values at sampled points from those at their images.
+
+    Parameters
+    ----------
+    values : numpy.ndarray
+        Values of the points, with a trailing axis for multiple measures.
+    mirror : numpy.ndarray
+        Indices of the images of the points (see :func:`get_mirror`).
+    idxs : numpy.ndarray
+        Indices of the sampled points.
+    atol : float, optional
+        Absolute tolerance below which the deviations are ignored. Default is :math:`10^{-12}`.
+
+    Returns
+    -------
+    error : float
+        Maximum relative deviation.
+    """
+
+    if len(idxs) == 0:
+        return 0.0
+
+    # extract frequently used variables
+    vs = values[idxs]
+    vs_mirror = values[mirror[idxs]]
+    scales = np.maximum(np.maximum(np.abs(vs), np.abs(vs_mirror)), atol)
+
+    return float(np.max(np.abs(vs - vs_mirror) / scales))
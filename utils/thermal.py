@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Module to obtain the quantum correlations of the coupled QOM systems for many thermal occupancies along a single classical trajectory."""
+
+__authors__ = ["Sampreet Kalita"]
+__toolbox__ = 'qom-v1.0.1'
+__created__ = "2026-10-18"
+__updated__ = "2026-10-19"
+
+# dependencies
+import copy
+import logging
+import numpy as np
+import scipy.integrate as si
+
+# module logger
+logger = logging.getLogger(__name__)
+
+class ThermalSolver():
+    r"""Class to solve the quantum correlations of a system for many thermal occupancies of the mechanical modes.
+
+    The thermal occupancies :math:`n_{k}` enter only the noise matrix and the initial correlations, both affine in them, whereas the classical modes and the drift matrix are independent of them.
+    As the equations of the correlations are linear in the noise matrix and the initial correlations, the correlations for any occupancies are superposed as :math:`V = V_{0} + \sum_{k} n_{k} \left( V_{k} - V_{0} \right)`.
+    Here, :math:`V_{0}` are the correlations with vanishing occupancies and :math:`V_{k}` those with a unit occupancy of the :math:`k`-th mechanical mode, which are integrated along with a single classical trajectory.
+    With the option ``floquet``, the basis correlations are instead the periodic correlations on the limit cycle (see :class:`utils.floquet.FloquetSolver`), falling back to the integration for points without a stable periodic limit cycle.
+
+    Parameters
+    ----------
+    SystemClass : :class:`qom.systems.BaseSystem`
+        Class of the system.
+    system_params : dict
+        Parameters of the system. The values of ``'n_ths'`` are ignored.
+    params : dict
+        Parameters for the solver. The solver parameters are:
+        ================    ====================================================
+        key                 meaning
+        ================    ====================================================
+        ode_method          (*str*) method of ``scipy.integrate.solve_ivp`` used to solve the ODEs. Other methods, such as ``'auto'``, are replaced by the default. Default is ``'DOP853'``.
+        ode_atol            (*float*) absolute tolerance of the integrator. Default is :math:`10^{-12}`.
+        ode_rtol            (*float*) relative tolerance of the integrator. Default is :math:`10^{-8}`.
+        t_min               (*float*) minimum time. Default is :math:`0.0`.
+        t_max               (*float*) maximum time. Default is :math:`1000.0`.
+        t_dim               (*int*) number of time points. Default is :math:`10001`.
+        t_index_min         (*int*) index of the first time of the window. Default is :math:`0`.
+        t_index_max         (*int*) index of the last time of the window. Default is ``t_dim - 1``.
+        floquet             (*bool*) option to obtain the periodic correlations on the limit cycle. Default is ``False``.
+        ================    ====================================================
+    """
+
+    # default parameters of the solver
+    solver_defaults = {
+        'ode_method'    : 'DOP853',
+        'ode_atol'      : 1e-12,
+        'ode_rtol'      : 1e-8,
+        't_min'         : 0.0,
+        't_max'         : 1000.0,
+        't_dim'         : 10001,
+        't_index_min'   : None,
+        't_index_max'   : None,
+        'floquet'       : False
+    }
+
+    # methods of scipy.integrate.solve_ivp
+    methods_solve_ivp = ['BDF', 'DOP853', 'LSODA', 'Radau', 'RK23', 'RK45']
+
+    def __init__(self, SystemClass, system_params, params={}):
+        """Class constructor for ThermalSolver."""
+
+        # set attributes
+        self._set_params(params)
+        self.params_floquet = params
+
+        # basis systems with vanishing and unit occupancies
+        num_ths = len(dict(getattr(SystemClass, 'system_defaults', {}), **system_params)['n_ths'])
+        self.systems = [SystemClass(
+            params=dict(system_params, n_ths=[float(j == k) for j in range(num_ths)])
+        ) for k in range(-1, num_ths)]
+        self.system = self.systems[0]
+        self.num_ths = num_ths
+
+        # initial values
+        self.iv_modes, _, self.c = self.system.get_ivc()
+        self.dim_m = 2 * self.system.num_modes
+
+        # validate superposition
+        self._validate(SystemClass, system_params)
+
+    def _set_params(self, params):
+        # update defaults and replace the methods unavailable in scipy.integrate.solve_ivp
+        self.params = copy.deepcopy(self.solver_defaults)
+        self.params.update({key: value for key, value in params.items() if key in self.solver_defaults})
+        if self.params['ode_method'] not in self.methods_solve_ivp:
+            self.params['ode_method'] = self.solver_defaults['ode_method']
+
+    def get_times(self):
+        """Method to obtain the times of the window.
+
+        Returns
+        -------
+        T : numpy.ndarray
+            Times between the indices ``t_index_min`` and ``t_index_max``.
+        """
+
+        # extract frequently used variables
+        t_dim = self.params['t_dim']
+        t_index_min = self.params['t_index_min'] if self.params['t_index_min'] is not None else 0
+        t_index_max = self.params['t_index_max'] if self.params['t_index_max'] is not None else t_dim - 1
+
+        return np.linspace(self.params['t_min'], self.params['t_max'], t_dim)[t_index_min:t_index_max + 1]
+
+    def _integrate(self, y_0):
+        # integrate the rates from the minimum time and return the values at the times of the window
+        sol = si.solve_ivp(self._get_rates, (self.params['t_min'], self.params['t_max']), y_0, method=self.params['ode_method'], t_eval=self.get_times(), atol=self.params['ode_atol'], rtol=self.params['ode_rtol'])
+        assert sol.success, 'Integration failed with message ``{}``'.format(sol.message)
+
+        return sol.y.transpose()
+
+    def _validate(self, SystemClass, system_params):
+        # extract frequently used variables
+        n_ths = 0.5 + 0.25 * np.arange(self.num_ths)
+        system = SystemClass(
+            params=dict(system_params, n_ths=n_ths.tolist())
+        )
+        _, iv_corrs, c = system.get_ivc()
+        t = self.params['t_min']
+
+        # classical modes and drift matrix independent of the occupancies
+        for _system in self.systems[1:]:
+            assert np.allclose(_system.get_mode_rates(self.iv_modes, self.c, t), self.system.get_mode_rates(self.iv_modes, self.c, t)), 'Classical modes of ``{}`` should be independent of ``n_ths``'.format(SystemClass.__name__)
+            assert np.allclose(_system.get_A(self.iv_modes, self.c, t), self.system.get_A(self.iv_modes, self.c, t)), 'Drift matrix of ``{}`` should be independent of ``n_ths``'.format(SystemClass.__name__)
+
+        # noise matrix and initial correlations affine in the occupancies
+        Ds = [np.array(_system.get_D(self.iv_modes, iv_corrs, self.c, t), dtype=np.float64) for _system in self.systems]
+        iv_corrss = [np.array(_system.get_ivc()[1], dtype=np.float64) for _system in self.systems]
+        assert np.allclose(np.array(system.get_D(self.iv_modes, iv_corrs, c, t), dtype=np.float64), self._superpose(np.array(Ds), n_ths)), 'Noise matrix of ``{}`` should be affine in ``n_ths``'.format(SystemClass.__name__)
+        assert np.allclose(iv_corrs, self._superpose(np.array(iv_corrss), n_ths)), 'Initial correlations of ``{}`` should be affine in ``n_ths``'.format(SystemClass.__name__)
+
+    def _superpose(self, basis, n_ths):
+        # superpose the basis values
+        return basis[0] + np.tensordot(n_ths, basis[1:] - basis[0], axes=(-1, 0))
+
+    def _get_rates(self, t, y):
+        # extract modes and correlations of each basis system
+        dim = self.dim_m
+        modes = y[:dim].view(np.complex128)
+        Vs = y[dim:].reshape((-1, dim, dim))
+
+        # drift matrix
+        A = np.array(self.system.get_A(modes, self.c, t), dtype=np.float64)
+        rates = [np.asarray(self.system.get_mode_rates(modes, self.c, t), dtype=np.complex128).view(np.float64)]
+
+        # noise matrices
+        for system, V in zip(self.systems, Vs):
+            D = np.array(system.get_D(modes, V, self.c, t), dtype=np.float64)
+            rates.append((A.dot(V) + V.dot(A.transpose()) + D).ravel())
+
+        return np.concatenate(rates)
+
+    def get_basis(self):
+        """Method to obtain the classical modes and the correlations of the basis systems.
+
+        Returns
+        -------
+        Modes : numpy.ndarray
+            Classical modes at the times of the window, or over one period of the limit cycle with the option ``floquet``.
+        Corrs : numpy.ndarray
+            Correlations of the basis systems with a leading axis for the systems, in the order of vanishing occupancies followed by a unit occupancy of each mechanical mode.
+        """
+
+        # periodic correlations on the limit cycle
+        if self.params['floquet']:
+            # local modules
+            from utils.floquet import FloquetSolver
+
+            Modes, Corrs = FloquetSolver(
+                system=self.system,
+                params=self.params_floquet
+            ).get_modes_corrs(
+                systems=self.systems
+            )
+            if Modes is not None:
+                return Modes, Corrs
+
+        # extract frequently used variables
+        dim = self.dim_m
+
+        # single classical trajectory with the basis correlations
+        y_0 = np.concatenate([np.asarray(self.iv_modes, dtype=np.complex128).view(np.float64)] + [np.array(system.get_ivc()[1], dtype=np.float64).ravel() for system in self.systems])
+        Y = self._integrate(y_0)
+        Modes = Y[:, :dim].copy().view(np.complex128)
+        Corrs = Y[:, dim:].reshape((len(Y), len(self.systems), dim, dim)).transpose((1, 0, 2, 3))
+
+        return Modes, Corrs
+
+    def get_modes_corrs(self, n_ths):
+        """Method to obtain the classical modes and the quantum correlations for many thermal occupancies.
+
+        Parameters
+        ----------
+        n_ths : numpy.ndarray
+            Thermal occupancies of the mechanical modes, with a leading axis for the values. Scalar values are used for all mechanical modes.
+
+        Returns
+        -------
+        Modes : numpy.ndarray
+            Classical modes, shared by all occupancies.
+        Corrs : numpy.ndarray
+            Quantum correlations with a leading axis for the values of the occupancies.
+        """
+
+        # extract frequently used variables
+        n_ths = np.array(n_ths, dtype=np.float64)
+        if n_ths.ndim == 1:
+            n_ths = np.repeat(n_ths[:, None], self.num_ths, axis=1)
+        Modes, Corrs_basis = self.get_basis()
+
+        return Modes, np.array([self._superpose(Corrs_basis, n) for n in n_ths])